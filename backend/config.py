@@ -5,6 +5,50 @@ from pathlib import Path
 DATA_FILE = os.getenv("DATA_FILE", "../data/mnemos_data.json")
 IMAGES_DIR = Path("/app/data/images")
 
+# Persistence settings - bursts of saves within the debounce window are
+# coalesced into a single storage upload, delayed at most PERSIST_MAX_DELAY_SECONDS
+PERSIST_DEBOUNCE_SECONDS = float(os.getenv("PERSIST_DEBOUNCE_SECONDS", "0.5"))
+PERSIST_MAX_DELAY_SECONDS = float(os.getenv("PERSIST_MAX_DELAY_SECONDS", "5"))
+
+# Journal mode - append per-mutation records to DATA_FILE + ".journal" instead of
+# rewriting the whole local file, with a full snapshot every N records
+DATA_JOURNAL_ENABLED = os.getenv("DATA_JOURNAL_ENABLED", "false").lower() == "true"
+DATA_JOURNAL_COMPACT_EVERY = int(os.getenv("DATA_JOURNAL_COMPACT_EVERY", "500"))
+
+# Full-text search index (can be disabled on memory-constrained instances)
+SEARCH_INDEX_ENABLED = os.getenv("SEARCH_INDEX_ENABLED", "true").lower() == "true"
+
+# Delta sync - how many recent changes GET /api/items/changes can replay
+CHANGE_LOG_MAX_ENTRIES = int(os.getenv("CHANGE_LOG_MAX_ENTRIES", "10000"))
+
+# Server-sent events (GET /api/events)
+SSE_MAX_SUBSCRIBERS = int(os.getenv("SSE_MAX_SUBSCRIBERS", "100"))
+SSE_QUEUE_SIZE = int(os.getenv("SSE_QUEUE_SIZE", "100"))
+SSE_HEARTBEAT_SECONDS = float(os.getenv("SSE_HEARTBEAT_SECONDS", "15"))
+
+# Storage snapshot format - "json" (default) or "binary" (compact columnar
+# snapshot, memory-mapped on load for fast cold starts). JSON stays the
+# export/interchange format either way
+DATA_SNAPSHOT_FORMAT = os.getenv("DATA_SNAPSHOT_FORMAT", "json").lower()
+
+# Storage I/O - blocking storage calls (GCS round-trips, JSON encode/decode) run
+# in a thread pool of this size so they never stall the event loop
+STORAGE_IO_CONCURRENCY = int(os.getenv("STORAGE_IO_CONCURRENCY", "4"))
+
+# Storage health - availability is cached for the TTL; the circuit opens after
+# N consecutive failures and is re-probed in the background every RETRY seconds
+STORAGE_HEALTH_TTL_SECONDS = float(os.getenv("STORAGE_HEALTH_TTL_SECONDS", "60"))
+STORAGE_HEALTH_FAILURE_THRESHOLD = int(os.getenv("STORAGE_HEALTH_FAILURE_THRESHOLD", "3"))
+STORAGE_HEALTH_RETRY_SECONDS = float(os.getenv("STORAGE_HEALTH_RETRY_SECONDS", "30"))
+
+# Batch mutations (POST /api/batch) - max operations per request
+BATCH_MAX_OPERATIONS = int(os.getenv("BATCH_MAX_OPERATIONS", "1000"))
+
+# Bulk import (POST /api/items/import) - items committed per save, and how many
+# per-line errors the response reports before truncating the list
+IMPORT_CHUNK_SIZE = int(os.getenv("IMPORT_CHUNK_SIZE", "500"))
+IMPORT_MAX_ERRORS = int(os.getenv("IMPORT_MAX_ERRORS", "1000"))
+
 # File upload settings
 MAX_FILE_SIZE = 10 * 1024 * 1024  # 10MB
 ALLOWED_IMAGE_EXTENSIONS = {'jpg', 'jpeg', 'png', 'gif', 'webp', 'bmp', 'heic', 'heif'}
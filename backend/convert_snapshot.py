@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""
+Convert between the JSON data file and the binary snapshot format.
+
+    python convert_snapshot.py to-binary mnemos_data.json mnemos_data.bin
+    python convert_snapshot.py to-json mnemos_data.bin mnemos_data.json
+
+Upload the .bin file as mnemos_data.bin to the storage bucket and set
+DATA_SNAPSHOT_FORMAT=binary to switch a deployment over. JSON stays the
+export/interchange format.
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+
+# Add the backend directory to the path so we can import our services
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from services.data_service import _process_data_dict, dump_app_data
+from services.snapshot import read_snapshot, write_snapshot
+
+
+def json_to_binary(json_path: str, binary_path: str):
+    """Validate a JSON data file and write it as a binary snapshot"""
+    with open(json_path, 'r') as f:
+        data = _process_data_dict(json.load(f))
+    write_snapshot(data, binary_path)
+    print(f"✅ {len(data.items)} items: {json_path} ({os.path.getsize(json_path)} bytes) -> "
+          f"{binary_path} ({os.path.getsize(binary_path)} bytes)")
+
+
+def binary_to_json(binary_path: str, json_path: str):
+    """Export a binary snapshot as a JSON data file"""
+    data = read_snapshot(binary_path)
+    with open(json_path, 'w') as f:
+        json.dump(dump_app_data(data), f, indent=2)
+    print(f"✅ {len(data.items)} items: {binary_path} -> {json_path}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Convert between JSON and binary data snapshots")
+    parser.add_argument("direction", choices=["to-binary", "to-json"])
+    parser.add_argument("source")
+    parser.add_argument("destination")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    if args.direction == "to-binary":
+        json_to_binary(args.source, args.destination)
+    else:
+        binary_to_json(args.source, args.destination)
+    print(f"⏱️  Done in {time.perf_counter() - start:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -3,8 +3,12 @@ from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
 from fastapi.responses import JSONResponse
 from config import IMAGES_DIR, ALLOWED_ORIGINS, API_TITLE, API_DESCRIPTION
-from routes import items_router, settings_router, upload_router, data_router, categories_router
-from services.data_service import preload_data_from_storage, is_data_ready, initialize_default_data, background_data_loading
+from routes import items_router, settings_router, upload_router, data_router, categories_router, review_router, events_router, batch_router
+from services.data_service import (
+    preload_data_from_storage, is_data_ready, initialize_default_data, background_data_loading,
+    flush_pending_saves, get_persistence_stats, get_index_metrics, get_response_cache_stats,
+    get_event_bus, get_storage_health
+)
 import logging
 import traceback
 import asyncio
@@ -96,6 +100,12 @@ async def startup_event():
     
     logger.info("✅ Service started quickly - data loading in background")
 
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Flush coalesced storage writes before the instance goes away"""
+    logger.info("💾 Flushing pending storage writes before shutdown...")
+    await flush_pending_saves()
+
 # Ensure images directory exists
 IMAGES_DIR.mkdir(parents=True, exist_ok=True)
 
@@ -117,6 +127,9 @@ app.include_router(settings_router)
 app.include_router(upload_router)
 app.include_router(data_router)
 app.include_router(categories_router)
+app.include_router(review_router)
+app.include_router(events_router)
+app.include_router(batch_router)
 
 @app.get("/")
 async def root():
@@ -128,7 +141,12 @@ async def health_check():
     return {
         "status": "healthy" if is_data_ready() else "loading",
         "data_ready": is_data_ready(),
-        "message": "Service is ready" if is_data_ready() else "Loading data in background"
+        "message": "Service is ready" if is_data_ready() else "Loading data in background",
+        "persistence": get_persistence_stats(),
+        "indexes": get_index_metrics(),
+        "response_cache": get_response_cache_stats(),
+        "events": get_event_bus().stats(),
+        "storage": get_storage_health().stats()
     }
 
 if __name__ == "__main__":
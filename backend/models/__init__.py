@@ -1,5 +1,7 @@
 from .item import Item
 from .settings import Settings
 from .app_data import AppData
+from .review import ReviewRequest
+from .batch import BatchRequest
 
-__all__ = ["Item", "Settings", "AppData"]
\ No newline at end of file
+__all__ = ["Item", "Settings", "AppData", "ReviewRequest", "BatchRequest"]
\ No newline at end of file
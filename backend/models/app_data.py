@@ -12,4 +12,6 @@ class AppData(BaseModel):
         medium_days=3,
         wtf_days=1
     )
-    last_updated: str
\ No newline at end of file
+    last_updated: str
+    # Dataset version of the last save - the server resumes above it after a restart
+    data_version: int = 0
\ No newline at end of file
@@ -0,0 +1,71 @@
+from typing import Annotated, Any, Dict, List, Literal, Optional, Union
+from pydantic import BaseModel, Field
+from .item import Item
+from .review import ReviewRequest
+from .settings import Settings
+
+
+class ItemCreateOp(BaseModel):
+    op: Literal["item.create"]
+    item: Item
+
+
+class ItemUpdateOp(BaseModel):
+    """Full replacement, like PUT /api/items/{id}"""
+    op: Literal["item.update"]
+    id: str
+    item: Item
+    if_match: Optional[str] = None
+
+
+class ItemPatchOp(BaseModel):
+    """Partial update - only the given fields change"""
+    op: Literal["item.patch"]
+    id: str
+    fields: Dict[str, Any]
+    if_match: Optional[str] = None
+
+
+class ItemDeleteOp(BaseModel):
+    op: Literal["item.delete"]
+    id: str
+    if_match: Optional[str] = None
+
+
+class ItemReviewOp(ReviewRequest):
+    op: Literal["item.review"]
+    id: str
+
+
+class CategoryAddOp(BaseModel):
+    op: Literal["category.add"]
+    name: str
+
+
+class CategoryDeleteOp(BaseModel):
+    op: Literal["category.delete"]
+    name: str
+
+
+class CategoryRenameOp(BaseModel):
+    op: Literal["category.rename"]
+    old_name: str
+    new_name: str
+
+
+class SettingsUpdateOp(BaseModel):
+    op: Literal["settings.update"]
+    settings: Settings
+
+
+BatchOperation = Annotated[
+    Union[
+        ItemCreateOp, ItemUpdateOp, ItemPatchOp, ItemDeleteOp, ItemReviewOp,
+        CategoryAddOp, CategoryDeleteOp, CategoryRenameOp, SettingsUpdateOp
+    ],
+    Field(discriminator="op")
+]
+
+
+class BatchRequest(BaseModel):
+    operations: List[BatchOperation] = Field(..., min_length=1)
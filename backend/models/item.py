@@ -24,4 +24,5 @@ class Item(BaseModel):
     
     created_date: str
     last_accessed: str
-    archived: bool = False
\ No newline at end of file
+    archived: bool = False
+    revision: int = 0  # Bumped on every server-side change (optimistic concurrency)
\ No newline at end of file
@@ -0,0 +1,8 @@
+from typing import Literal, Optional
+from pydantic import BaseModel, Field
+
+
+class ReviewRequest(BaseModel):
+    rating: Literal["confident", "medium", "wtf", "custom"]
+    days: Optional[int] = Field(None, ge=1, le=3650)  # Custom interval - custom rating only
+    today: Optional[str] = None  # Client's local date (YYYY-MM-DD), defaults to server date
@@ -3,5 +3,8 @@ from .settings import router as settings_router
 from .upload import router as upload_router
 from .data import router as data_router
 from .categories import router as categories_router
+from .review import router as review_router
+from .events import router as events_router
+from .batch import router as batch_router
 
-__all__ = ["items_router", "settings_router", "upload_router", "data_router", "categories_router"]
\ No newline at end of file
+__all__ = ["items_router", "settings_router", "upload_router", "data_router", "categories_router", "review_router", "events_router", "batch_router"]
\ No newline at end of file
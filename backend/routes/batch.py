@@ -0,0 +1,322 @@
+from fastapi import APIRouter, HTTPException
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+import uuid
+from pydantic import ValidationError
+from config import BATCH_MAX_OPERATIONS
+from models import AppData, Item, BatchRequest
+from models.batch import (
+    ItemCreateOp, ItemUpdateOp, ItemPatchOp, ItemDeleteOp, ItemReviewOp,
+    CategoryAddOp, CategoryDeleteOp, CategoryRenameOp, SettingsUpdateOp
+)
+from services.data_service import (
+    load_data, save_data, is_data_ready, commit_section,
+    get_item, add_item, replace_item, remove_item, review_item, review_interval,
+    add_category, remove_category, rename_category, update_settings, count_category_items, has_category
+)
+from services.category_registry import CategoryLookup
+from services.item_record import item_to_dict
+from services.response_cache import etag_for_version, etag_matches_strong
+from .categories import validate_category_name
+from .review import parse_today
+from .settings import validate_settings
+
+router = APIRouter(prefix="/api", tags=["batch"])
+
+# Fields item.patch can't set - they are managed by the server
+PATCH_PROTECTED_FIELDS = {"id", "created_date", "last_accessed", "revision"}
+
+
+class _BatchPlan:
+    """Simulated state after the operations checked so far.
+
+    Checking never touches the dataset: items the batch changes are tracked
+    as planned field dicts and category renames as a mapping from stored
+    section to planned name, so any failing operation rejects the whole batch
+    before the first one is applied.
+    """
+
+    def __init__(self, data: AppData):
+        self.categories = list(data.categories)
+        self.lookup = CategoryLookup()
+        self.lookup.rebuild(self.categories)
+        self.settings = data.settings
+        self.items: Dict[str, Optional[dict]] = {}       # id -> planned fields (None = deleted)
+        self.created: List[dict] = []                    # planned fields of new items
+        self.sections: Dict[str, Tuple[str, int]] = {}   # stored section -> (planned name, renames)
+
+    def item(self, item_id: str, if_match: Optional[str] = None) -> dict:
+        """Planned fields of an existing item - 404 if missing, 409 on a stale If-Match"""
+        if item_id in self.items:
+            fields = self.items[item_id]
+        else:
+            item = get_item(item_id)
+            fields = item_to_dict(item) if item is not None else None
+            if fields is not None:
+                fields["section"], renames = self.sections.get(fields["section"], (fields["section"], 0))
+                fields["revision"] += renames
+        if fields is None:
+            raise HTTPException(status_code=404, detail="Item not found")
+        if if_match is not None and not etag_matches_strong(if_match, etag_for_version(fields["revision"])):
+            raise HTTPException(
+                status_code=409,
+                detail=f"Item was modified by another request (current revision {fields['revision']})"
+            )
+        return fields
+
+    def use_section(self, section: str):
+        """New sections are added as categories, like POST/PUT /api/items do"""
+        if section and section not in self.lookup:
+            self.add_category(section)
+
+    def add_category(self, name: str):
+        self.categories.append(name)
+        self.lookup.add(name)
+
+    def section_usage(self, name: str) -> int:
+        """Items that will be in the section at this point of the batch"""
+        count = sum(1 for fields in self.created if fields["section"] == name)
+        count += sum(1 for fields in self.items.values() if fields is not None and fields["section"] == name)
+        # Stored sections planned to be called `name`, counted in O(1) each,
+        # minus their items the batch already tracks above
+        stored = {
+            section for section in {name, *self.sections}
+            if self.sections.get(section, (section,))[0] == name
+        }
+        count += sum(count_category_items(section) for section in stored)
+        count -= sum(1 for item_id in self.items if get_item(item_id).section in stored)
+        return count
+
+    def rename_section(self, old_name: str, new_name: str):
+        self.categories[self.categories.index(old_name)] = new_name
+        self.lookup.rename(old_name, new_name)
+        for stored, (planned, renames) in self.sections.items():
+            if planned == old_name:
+                self.sections[stored] = (new_name, renames + 1)
+        self.sections.setdefault(old_name, (new_name, 1))
+        for fields in self.created:
+            if fields["section"] == old_name:
+                fields["section"] = new_name
+        for fields in self.items.values():
+            if fields is not None and fields["section"] == old_name:
+                fields["section"] = new_name
+                fields["revision"] += 1
+
+
+def _validate_item(fields: dict) -> Item:
+    try:
+        return Item(**fields)
+    except ValidationError as e:
+        raise HTTPException(status_code=422, detail=e.errors(include_url=False))
+
+
+def _patched_fields(current: dict, op: ItemPatchOp) -> dict:
+    unknown = set(op.fields) - set(Item.model_fields)
+    if unknown:
+        raise HTTPException(status_code=400, detail=f"Unknown item fields: {', '.join(sorted(unknown))}")
+    protected = set(op.fields) & PATCH_PROTECTED_FIELDS
+    if protected:
+        raise HTTPException(status_code=400, detail=f"Fields can't be patched: {', '.join(sorted(protected))}")
+    return {**current, **op.fields, "last_accessed": datetime.now().isoformat()}
+
+
+# Checks - validate one operation against the plan and record its effect
+
+def _check_item_create(plan: _BatchPlan, op: ItemCreateOp):
+    plan.use_section(op.item.section)
+    plan.created.append(op.item.dict())
+
+
+def _check_item_update(plan: _BatchPlan, op: ItemUpdateOp):
+    current = plan.item(op.id, op.if_match)
+    plan.use_section(op.item.section)
+    plan.items[op.id] = {**op.item.dict(), "id": op.id, "revision": current["revision"] + 1}
+
+
+def _check_item_patch(plan: _BatchPlan, op: ItemPatchOp):
+    current = plan.item(op.id, op.if_match)
+    item = _validate_item(_patched_fields(current, op))
+    plan.use_section(item.section)
+    plan.items[op.id] = {**item.dict(), "revision": current["revision"] + 1}
+
+
+def _check_item_delete(plan: _BatchPlan, op: ItemDeleteOp):
+    plan.item(op.id, op.if_match)
+    plan.items[op.id] = None
+
+
+def _check_item_review(plan: _BatchPlan, op: ItemReviewOp):
+    if op.days is not None and op.rating != "custom":
+        raise HTTPException(status_code=400, detail="days is only allowed with the custom rating")
+    parse_today(op.today)
+    current = plan.item(op.id)
+    current["revision"] += 1
+    plan.items[op.id] = current
+
+
+def _check_category_add(plan: _BatchPlan, op: CategoryAddOp):
+    name = validate_category_name(op.name)
+    if plan.lookup.find(name) is not None:
+        raise HTTPException(status_code=409, detail="Category already exists")
+    plan.add_category(name)
+
+
+def _check_category_delete(plan: _BatchPlan, op: CategoryDeleteOp):
+    if op.name not in plan.lookup:
+        raise HTTPException(status_code=404, detail="Category not found")
+    in_use = plan.section_usage(op.name)
+    if in_use:
+        raise HTTPException(
+            status_code=409,
+            detail=f"Cannot delete category '{op.name}' - it is used by {in_use} item(s)"
+        )
+    plan.categories.remove(op.name)
+    plan.lookup.remove(op.name)
+
+
+def _check_category_rename(plan: _BatchPlan, op: CategoryRenameOp):
+    new_name = validate_category_name(op.new_name, label="New category name")
+    if op.old_name not in plan.lookup:
+        raise HTTPException(status_code=404, detail="Category not found")
+    if plan.lookup.find(new_name, ignore=op.old_name) is not None:
+        raise HTTPException(status_code=409, detail="A category with the new name already exists")
+    plan.rename_section(op.old_name, new_name)
+
+
+def _check_settings_update(plan: _BatchPlan, op: SettingsUpdateOp):
+    validate_settings(op.settings)
+    plan.settings = op.settings
+
+
+# Applies - same effect as the single-operation endpoints, minus the save
+
+def _add_section_category(section: str):
+    if section and not has_category(section):
+        add_category(section)
+
+
+def _apply_item_create(op: ItemCreateOp) -> dict:
+    item = op.item
+    item.id = str(uuid.uuid4())
+    item.created_date = datetime.now().isoformat()
+    item.last_accessed = datetime.now().isoformat()
+    add_item(item)
+    _add_section_category(item.section)
+    return {"item": item}
+
+
+def _apply_item_update(op: ItemUpdateOp) -> dict:
+    current = get_item(op.id)
+    item = op.item
+    item.id = op.id
+    item.created_date = current.created_date
+    item.last_accessed = datetime.now().isoformat()
+    _add_section_category(item.section)
+    replace_item(op.id, item)
+    return {"item": item}
+
+
+def _apply_item_patch(op: ItemPatchOp) -> dict:
+    item = Item(**_patched_fields(item_to_dict(get_item(op.id)), op))
+    _add_section_category(item.section)
+    replace_item(op.id, item)
+    return {"item": item}
+
+
+def _apply_item_delete(op: ItemDeleteOp) -> dict:
+    remove_item(op.id)
+    return {"id": op.id}
+
+
+def _apply_item_review(op: ItemReviewOp) -> dict:
+    days = review_interval(load_data().settings, op.rating, op.days)
+    return {"item": review_item(op.id, days, parse_today(op.today))}
+
+
+def _apply_category_add(op: CategoryAddOp) -> dict:
+    name = op.name.strip()
+    add_category(name)
+    return {"name": name}
+
+
+def _apply_category_delete(op: CategoryDeleteOp) -> dict:
+    remove_category(op.name)
+    return {"name": op.name}
+
+
+def _apply_category_rename(op: CategoryRenameOp) -> dict:
+    new_name = op.new_name.strip()
+    items_updated = rename_category(op.old_name, new_name)
+    return {"old_name": op.old_name, "new_name": new_name, "items_updated": items_updated}
+
+
+def _apply_settings_update(op: SettingsUpdateOp) -> dict:
+    update_settings(op.settings)
+    return {"settings": op.settings}
+
+
+# op -> (check, apply)
+_OPERATIONS = {
+    "item.create": (_check_item_create, _apply_item_create),
+    "item.update": (_check_item_update, _apply_item_update),
+    "item.patch": (_check_item_patch, _apply_item_patch),
+    "item.delete": (_check_item_delete, _apply_item_delete),
+    "item.review": (_check_item_review, _apply_item_review),
+    "category.add": (_check_category_add, _apply_category_add),
+    "category.delete": (_check_category_delete, _apply_category_delete),
+    "category.rename": (_check_category_rename, _apply_category_rename),
+    "settings.update": (_check_settings_update, _apply_settings_update),
+}
+
+
+@router.post("/batch")
+async def apply_batch(request: BatchRequest):
+    """Apply an ordered list of item, category and settings operations as one commit.
+
+    All or nothing: every operation is checked against the state the earlier
+    ones leave behind before any of them is applied. If one fails, nothing
+    changes and the response carries that operation's status code with its
+    `index`, `op` and `error`. Otherwise all are applied in order, persisted
+    with a single save, and `results` holds one entry per operation.
+
+    Operations: item.create {item}, item.update {id, item, if_match?},
+    item.patch {id, fields, if_match?}, item.delete {id, if_match?},
+    item.review {id, rating, days?, today?}, category.add {name},
+    category.delete {name}, category.rename {old_name, new_name},
+    settings.update {settings}.
+    """
+    if not is_data_ready():
+        raise HTTPException(
+            status_code=503,
+            detail="Service starting up - data loading in background. Please try again in a moment."
+        )
+    if len(request.operations) > BATCH_MAX_OPERATIONS:
+        raise HTTPException(
+            status_code=413,
+            detail=f"A batch can contain at most {BATCH_MAX_OPERATIONS} operations"
+        )
+
+    async with commit_section():
+        data = load_data()
+        plan = _BatchPlan(data)
+        for index, operation in enumerate(request.operations):
+            check, _ = _OPERATIONS[operation.op]
+            try:
+                check(plan, operation)
+            except HTTPException as e:
+                raise HTTPException(
+                    status_code=e.status_code,
+                    detail={
+                        "message": "Batch rejected - no operations were applied",
+                        "index": index,
+                        "op": operation.op,
+                        "error": e.detail
+                    }
+                )
+
+        results = []
+        for index, operation in enumerate(request.operations):
+            _, apply = _OPERATIONS[operation.op]
+            results.append({"index": index, "op": operation.op, **apply(operation)})
+        await save_data(data)
+    return {"applied": len(results), "results": results}
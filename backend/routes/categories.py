@@ -1,11 +1,34 @@
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Query, Request
 from pydantic import BaseModel
-from typing import List
-from services.data_service import load_data, save_data, is_data_ready
+from typing import List, Optional
+from services.data_service import (
+    load_data, save_data, is_data_ready, add_category as add_category_to_data,
+    remove_category, rename_category as rename_category_in_data, commit_section,
+    count_category_items, get_category_stats, has_category, find_category
+)
+from .responses import cached_json_response
+from .review import parse_today
 
 router = APIRouter(prefix="/api/categories", tags=["categories"])
 
 
+RESERVED_NAMES = ["all", "none", "default", "new", "add", "delete", "edit", "settings"]
+
+
+def validate_category_name(name: str, label: str = "Category name") -> str:
+    """Stripped category name, or HTTP 400 if it is empty, too long or reserved"""
+    name = name.strip()
+    if not name:
+        raise HTTPException(status_code=400, detail=f"{label} cannot be empty")
+    
+    if len(name) > 100:
+        raise HTTPException(status_code=400, detail="Category name cannot exceed 100 characters")
+    
+    if name.lower() in RESERVED_NAMES:
+        raise HTTPException(status_code=400, detail=f"'{name}' is a reserved name")
+    return name
+
+
 class CategoryRequest(BaseModel):
     name: str
 
@@ -15,16 +38,32 @@ class CategoryRenameRequest(BaseModel):
     new_name: str
 
 
-@router.get("")
-async def get_categories() -> List[str]:
-    """Get all categories"""
+@router.get("", response_model=List[str])
+async def get_categories(request: Request):
+    """Get all categories (cached encoded body with ETag revalidation)"""
+    if not is_data_ready():
+        raise HTTPException(
+            status_code=503,
+            detail="Service starting up - data loading in background. Please try again in a moment."
+        )
+    return cached_json_response(request, ("categories",), lambda: load_data().categories)
+
+
+@router.get("/stats")
+async def get_categories_stats(
+    today: Optional[str] = Query(None, description="Client's local date (YYYY-MM-DD), defaults to server date")
+):
+    """Item counts per category: total, active, archived, new, overdue and due today.
+
+    Read from counters that every item change updates in O(1), so the cost
+    depends on the number of categories, not items.
+    """
     if not is_data_ready():
         raise HTTPException(
             status_code=503,
             detail="Service starting up - data loading in background. Please try again in a moment."
         )
-    data = load_data()
-    return data.categories
+    return get_category_stats(today=parse_today(today))
 
 
 @router.post("")
@@ -36,29 +75,18 @@ async def add_category(request: CategoryRequest) -> dict:
             detail="Service starting up - data loading in background. Please try again in a moment."
         )
     
-    category_name = request.name.strip()
-    
-    # Validation
-    if not category_name:
-        raise HTTPException(status_code=400, detail="Category name cannot be empty")
-    
-    if len(category_name) > 100:
-        raise HTTPException(status_code=400, detail="Category name cannot exceed 100 characters")
-    
-    # Reserved names check
-    reserved_names = ["all", "none", "default", "new", "add", "delete", "edit", "settings"]
-    if category_name.lower() in reserved_names:
-        raise HTTPException(status_code=400, detail=f"'{category_name}' is a reserved name")
-    
-    data = load_data()
-    
-    # Check for duplicates (case-insensitive)
-    if any(existing.lower() == category_name.lower() for existing in data.categories):
-        raise HTTPException(status_code=409, detail="Category already exists")
+    category_name = validate_category_name(request.name)
     
-    # Add the category
-    data.categories.append(category_name)
-    await save_data(data)
+    async with commit_section():
+        data = load_data()
+        
+        # Check for duplicates (case-insensitive)
+        if find_category(category_name) is not None:
+            raise HTTPException(status_code=409, detail="Category already exists")
+        
+        # Add the category
+        add_category_to_data(category_name)
+        await save_data(data)
     
     return {"message": "Category added successfully", "name": category_name}
 
@@ -72,23 +100,24 @@ async def delete_category(category_name: str) -> dict:
             detail="Service starting up - data loading in background. Please try again in a moment."
         )
     
-    data = load_data()
-    
-    # Check if category exists
-    if category_name not in data.categories:
-        raise HTTPException(status_code=404, detail="Category not found")
-    
-    # Safety check: verify category is not in use
-    items_with_category = [item for item in data.items if item.section == category_name]
-    if items_with_category:
-        raise HTTPException(
-            status_code=409, 
-            detail=f"Cannot delete category '{category_name}' - it is used by {len(items_with_category)} item(s)"
-        )
-    
-    # Remove the category
-    data.categories.remove(category_name)
-    await save_data(data)
+    async with commit_section():
+        data = load_data()
+        
+        # Check if category exists
+        if not has_category(category_name):
+            raise HTTPException(status_code=404, detail="Category not found")
+        
+        # Safety check: verify category is not in use (O(1) via the section counters)
+        items_with_category = count_category_items(category_name)
+        if items_with_category:
+            raise HTTPException(
+                status_code=409, 
+                detail=f"Cannot delete category '{category_name}' - it is used by {items_with_category} item(s)"
+            )
+        
+        # Remove the category
+        remove_category(category_name)
+        await save_data(data)
     
     return {"message": "Category deleted successfully", "name": category_name}
 
@@ -102,42 +131,23 @@ async def rename_category(category_name: str, request: CategoryRequest) -> dict:
             detail="Service starting up - data loading in background. Please try again in a moment."
         )
     
-    new_name = request.name.strip()
-    
-    # Validation
-    if not new_name:
-        raise HTTPException(status_code=400, detail="New category name cannot be empty")
-    
-    if len(new_name) > 100:
-        raise HTTPException(status_code=400, detail="Category name cannot exceed 100 characters")
-    
-    # Reserved names check
-    reserved_names = ["all", "none", "default", "new", "add", "delete", "edit", "settings"]
-    if new_name.lower() in reserved_names:
-        raise HTTPException(status_code=400, detail=f"'{new_name}' is a reserved name")
-    
-    data = load_data()
-    
-    # Check if old category exists
-    if category_name not in data.categories:
-        raise HTTPException(status_code=404, detail="Category not found")
-    
-    # Check if new name already exists (case-insensitive)
-    if any(existing.lower() == new_name.lower() for existing in data.categories if existing != category_name):
-        raise HTTPException(status_code=409, detail="A category with the new name already exists")
-    
-    # Update category name in the categories list
-    category_index = data.categories.index(category_name)
-    data.categories[category_index] = new_name
-    
-    # Update all items that use this category
-    items_updated = 0
-    for item in data.items:
-        if item.section == category_name:
-            item.section = new_name
-            items_updated += 1
-    
-    await save_data(data)
+    new_name = validate_category_name(request.name, label="New category name")
+    
+    async with commit_section():
+        data = load_data()
+        
+        # Check if old category exists
+        if not has_category(category_name):
+            raise HTTPException(status_code=404, detail="Category not found")
+        
+        # Check if new name already exists (case-insensitive)
+        if find_category(new_name, ignore=category_name) is not None:
+            raise HTTPException(status_code=409, detail="A category with the new name already exists")
+        
+        # Update the category name - items follow through their category ID
+        items_updated = rename_category_in_data(category_name, new_name)
+        
+        await save_data(data)
     
     return {
         "message": "Category renamed successfully", 
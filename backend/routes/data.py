@@ -1,19 +1,103 @@
-from fastapi import APIRouter, HTTPException
-from services.data_service import load_data, get_active_items, is_data_ready
+from fastapi import APIRouter, HTTPException, Query, Request
+from fastapi.responses import StreamingResponse
+from typing import Optional
+from services.data_service import (
+    load_data, get_active_items, is_data_ready,
+    get_active_items_page, parse_item_fields, project_items, get_export_snapshot,
+    validate_item_query
+)
+from services.item_transfer import (
+    FORMAT_CSV, FORMAT_JSON, FORMAT_NDJSON, MEDIA_TYPES,
+    encode_chunks, iter_csv, iter_json, iter_ndjson
+)
+from services.response_cache import etag_for_version
+from .responses import cached_json_response
 
 router = APIRouter(prefix="/api", tags=["data"])
 
 
+def _data_payload(limit: Optional[int], cursor: Optional[str], fields: Optional[str]):
+    """Build the GET /api/data response content for one variant"""
+    data = load_data()
+    if limit is None and cursor is None and fields is None:
+        # Pre-filtered active items from cache (Items or raw ItemRecords)
+        return {"items": get_active_items(), **data.dict(exclude={"items"})}
+    
+    field_set = parse_item_fields(fields)
+    page, next_cursor = get_active_items_page(limit, cursor)
+    response = data.dict(exclude={"items"})
+    response["items"] = project_items(page, field_set)
+    if limit is not None or cursor is not None:
+        response["next_cursor"] = next_cursor
+    return response
+
+
 @router.get("/data")
-async def get_data():
-    """Get all application data with non-archived items only - SUPER FAST O(1) operation"""
+async def get_data(
+    request: Request,
+    limit: Optional[int] = Query(None, ge=1, le=1000),
+    cursor: Optional[str] = None,
+    fields: Optional[str] = Query(None, description="Comma-separated item fields to return, e.g. id,name,section")
+):
+    """Get all application data with non-archived items only - SUPER FAST O(1) operation.
+
+    `limit`/`cursor`/`fields` page and project the items the same way as GET /api/items;
+    paged responses carry a top-level "next_cursor". Encoded bodies are cached until
+    the dataset version changes and carry an ETag for conditional requests.
+    """
     if not is_data_ready():
         raise HTTPException(
             status_code=503,
             detail="Service starting up - data loading in background. Please try again in a moment."
         )
-    data = load_data()
-    # Create a copy with pre-filtered active items from cache
-    filtered_data = data.copy()
-    filtered_data.items = get_active_items()
-    return filtered_data
\ No newline at end of file
+    try:
+        validate_item_query(cursor, fields)
+        return cached_json_response(
+            request,
+            ("data", limit, cursor, fields),
+            lambda: _data_payload(limit, cursor, fields)
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
+@router.get("/export")
+async def export_data(
+    format: str = Query(FORMAT_NDJSON, pattern="^(ndjson|csv|json)$"),
+    include_archived: bool = False,
+    gzip: bool = Query(False, description="Compress the download with gzip")
+):
+    """Download items as NDJSON, CSV or JSON, streamed as they are encoded.
+
+    The export is a snapshot of one dataset version - reported in the
+    X-Data-Version header and the ETag - so changes made during the download
+    don't show up in it. Items are encoded lazily in ~64 KB chunks, so memory
+    doesn't grow with deck size. `json` is the data file layout (with
+    categories and settings) and works as a backup; NDJSON and CSV are the
+    formats POST /api/items/import reads.
+    """
+    if not is_data_ready():
+        raise HTTPException(
+            status_code=503,
+            detail="Service starting up - data loading in background. Please try again in a moment."
+        )
+    version, items, meta, categories = get_export_snapshot(include_archived)
+    if format == FORMAT_CSV:
+        parts = iter_csv(items, categories)
+    elif format == FORMAT_JSON:
+        parts = iter_json(items, meta, categories)
+    else:
+        parts = iter_ndjson(items, categories)
+
+    filename = f"mnemos-export-v{version}.{format}" + (".gz" if gzip else "")
+    return StreamingResponse(
+        encode_chunks(parts, gzip=gzip),
+        media_type="application/gzip" if gzip else MEDIA_TYPES[format],
+        headers={
+            "Content-Disposition": f'attachment; filename="{filename}"',
+            "X-Data-Version": str(version),
+            # One ETag per representation - format, compression and scope all change the bytes
+            "ETag": etag_for_version(version, f"{format}{'-all' if include_archived else ''}{'-gzip' if gzip else ''}"),
+            "Cache-Control": "no-cache"
+        }
+    )
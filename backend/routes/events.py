@@ -0,0 +1,63 @@
+from fastapi import APIRouter, HTTPException, Request
+from fastapi.responses import StreamingResponse
+import asyncio
+import json
+from config import SSE_HEARTBEAT_SECONDS
+from services.data_service import get_event_bus, get_data_version
+from services.event_bus import TooManySubscribersError
+
+router = APIRouter(prefix="/api", tags=["events"])
+
+
+def _format_event(event: dict) -> str:
+    return f"event: {event['type']}\ndata: {json.dumps(event, ensure_ascii=False)}\n\n"
+
+
+async def _event_stream(request: Request):
+    """Yield SSE frames until the client disconnects, with heartbeat pings.
+
+    Subscribes only once the body is being sent, so a response that is never
+    iterated can't leak a subscription.
+    """
+    event_bus = get_event_bus()
+    try:
+        subscription = event_bus.subscribe()
+    except TooManySubscribersError:
+        # Filled up between the capacity check and the first frame
+        yield _format_event({"type": "resync", "reason": "too many subscribers"})
+        return
+    try:
+        yield _format_event({"type": "hello", "version": get_data_version()})
+        while True:
+            try:
+                event = await asyncio.wait_for(subscription.queue.get(), timeout=SSE_HEARTBEAT_SECONDS)
+                yield _format_event(event)
+                if await request.is_disconnected():
+                    break
+            except asyncio.TimeoutError:
+                if await request.is_disconnected():
+                    break
+                yield ": ping\n\n"
+    finally:
+        event_bus.unsubscribe(subscription)
+
+
+@router.get("/events")
+async def stream_events(request: Request):
+    """Server-sent events stream of committed data changes.
+
+    Events: "hello" (current version), "changes" (version + item-level ops, apply
+    via GET /api/items/changes) and "resync" (re-fetch everything).
+    """
+    event_bus = get_event_bus()
+    if event_bus.is_full():
+        raise HTTPException(status_code=503, detail=f"Subscriber limit of {event_bus.max_subscribers} reached")
+    
+    return StreamingResponse(
+        _event_stream(request),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "X-Accel-Buffering": "no"  # Disable nginx buffering for this stream
+        }
+    )
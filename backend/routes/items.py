@@ -1,8 +1,21 @@
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, Header, HTTPException, Query, Request, Response
 from datetime import datetime
+from typing import List, Optional, Tuple
 import uuid
-from models import Item
-from services.data_service import load_data, save_data, get_active_items, is_data_ready
+from pydantic import ValidationError
+from config import IMPORT_CHUNK_SIZE, IMPORT_MAX_ERRORS
+from models import Item, ReviewRequest
+from services.data_service import (
+    load_data, save_data, get_active_items, is_data_ready,
+    get_item, add_item, replace_item, remove_item, add_category, search_items,
+    get_active_items_page, parse_item_fields, project_items, get_changes_since,
+    get_item_etag, commit_section, review_item, review_interval, has_item, has_category,
+    validate_item_query, is_search_ready
+)
+from services.item_transfer import FORMAT_CSV, FORMAT_NDJSON, iter_import_records, validation_message
+from services.response_cache import etag_matches_strong
+from .responses import cached_json_response
+from .review import parse_today
 
 router = APIRouter(prefix="/api/items", tags=["items"])
 
@@ -10,71 +23,308 @@ router = APIRouter(prefix="/api/items", tags=["items"])
 @router.post("")
 async def create_item(item: Item):
     """Create a new item"""
-    data = load_data()
-    
-    # Generate ID and timestamps
-    item.id = str(uuid.uuid4())
-    item.created_date = datetime.now().isoformat()
-    item.last_accessed = datetime.now().isoformat()
-    
-    data.items.append(item)
-    
-    # Add category if new
-    if item.section and item.section not in data.categories:
-        data.categories.append(item.section)
-    
-    await save_data(data)
+    async with commit_section():
+        data = load_data()
+        
+        # Generate ID and timestamps
+        item.id = str(uuid.uuid4())
+        item.created_date = datetime.now().isoformat()
+        item.last_accessed = datetime.now().isoformat()
+        
+        add_item(item)
+        
+        # Add category if new
+        if item.section and not has_category(item.section):
+            add_category(item.section)
+        
+        await save_data(data)
+    return item
+
+
+class _ImportReport:
+    """Counts and the (capped) per-line error list of one import"""
+
+    def __init__(self, format: str):
+        self.format = format
+        self.imported = 0
+        self.failed = 0
+        self.chunks = 0
+        self.errors: List[dict] = []
+
+    def error(self, line: int, message: str):
+        self.failed += 1
+        if len(self.errors) < IMPORT_MAX_ERRORS:
+            self.errors.append({"line": line, "error": message})
+
+    def dict(self) -> dict:
+        return {
+            "format": self.format,
+            "imported": self.imported,
+            "failed": self.failed,
+            "chunks": self.chunks,
+            "errors": self.errors,
+            "errors_truncated": self.failed > len(self.errors)
+        }
+
+
+def _imported_item(fields: dict) -> Item:
+    """Validate one imported record, filling in the ID and timestamps it lacks"""
+    now = datetime.now().isoformat()
+    item = Item(**{**fields, "created_date": fields.get("created_date") or now, "last_accessed": fields.get("last_accessed") or now})
+    item.id = item.id or str(uuid.uuid4())
     return item
 
 
+async def _commit_imported(pending: List[Tuple[int, Item]], report: _ImportReport):
+    """Add one chunk of imported items and persist it"""
+    async with commit_section():
+        data = load_data()
+        for line, item in pending:
+            if has_item(item.id):
+                report.error(line, f"Item id already exists: {item.id}")
+                continue
+            add_item(item)
+            if item.section and not has_category(item.section):
+                add_category(item.section)
+            report.imported += 1
+        await save_data(data)
+    report.chunks += 1
+
+
+@router.post("/import")
+async def import_items(
+    request: Request,
+    format: Optional[str] = Query(None, pattern="^(ndjson|csv)$", description="Body format - defaults to csv for text/csv, ndjson otherwise"),
+    chunk_size: int = Query(IMPORT_CHUNK_SIZE, ge=1, le=10000, description="Items committed per save")
+):
+    """Bulk-create items from a streamed NDJSON or CSV body.
+
+    The body is parsed and validated line by line as it arrives - memory is
+    bounded by `chunk_size`, not the upload size. Valid items are committed
+    every `chunk_size` items; their sections are added as categories. Items
+    without an `id` get a new one and missing timestamps are set to now.
+
+    CSV needs a header row of item field names; list fields are JSON arrays.
+    Invalid lines, and lines whose `id` is already taken, are skipped and
+    reported as {"line", "error"} - the response also counts imported and
+    failed items.
+    """
+    if not is_data_ready():
+        raise HTTPException(
+            status_code=503,
+            detail="Service starting up - data loading in background. Please try again in a moment."
+        )
+    if format is None:
+        content_type = request.headers.get("content-type", "")
+        format = FORMAT_CSV if content_type.startswith("text/csv") else FORMAT_NDJSON
+
+    report = _ImportReport(format)
+    pending: List[Tuple[int, Item]] = []
+    try:
+        async for line, fields, error in iter_import_records(request.stream(), format):
+            if error is not None:
+                report.error(line, error)
+                continue
+            try:
+                pending.append((line, _imported_item(fields)))
+            except ValidationError as e:
+                report.error(line, validation_message(e))
+                continue
+            if len(pending) >= chunk_size:
+                await _commit_imported(pending, report)
+                pending = []
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    if pending:
+        await _commit_imported(pending, report)
+    return report.dict()
+
+
+def _items_payload(limit: Optional[int], cursor: Optional[str], fields: Optional[str]):
+    """Build the GET /api/items response content for one variant"""
+    if limit is None and cursor is None and fields is None:
+        return get_active_items()
+    
+    field_set = parse_item_fields(fields)
+    page, next_cursor = get_active_items_page(limit, cursor)
+    items = project_items(page, field_set)
+    if limit is None and cursor is None:
+        return items
+    return {"items": items, "next_cursor": next_cursor}
+
+
 @router.get("")
-async def get_items():
-    """Get all non-archived items - SUPER FAST O(1) operation"""
+async def get_items(
+    request: Request,
+    limit: Optional[int] = Query(None, ge=1, le=1000),
+    cursor: Optional[str] = None,
+    fields: Optional[str] = Query(None, description="Comma-separated item fields to return, e.g. id,name,section")
+):
+    """Get non-archived items - SUPER FAST O(1) operation without parameters.
+
+    With `limit`/`cursor` the response becomes a page: {"items": [...], "next_cursor": ...}.
+    `fields` returns only the listed item fields (id is always included).
+    Encoded bodies are cached until the dataset version changes and carry an
+    ETag for conditional requests.
+    """
+    if not is_data_ready():
+        raise HTTPException(
+            status_code=503,
+            detail="Service starting up - data loading in background. Please try again in a moment."
+        )
+    try:
+        validate_item_query(cursor, fields)
+        return cached_json_response(
+            request,
+            ("items", limit, cursor, fields),
+            lambda: _items_payload(limit, cursor, fields)
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
+@router.get("/search")
+async def search(
+    q: str = Query(..., min_length=1, max_length=200),
+    limit: int = Query(20, ge=1, le=100),
+    include_archived: bool = False
+):
+    """Full-text search over name, problem, answer and side note (BM25, prefix matching).
+
+    Answers 503 while the search index is being rebuilt after a load.
+    """
+    if not is_data_ready():
+        raise HTTPException(
+            status_code=503,
+            detail="Service starting up - data loading in background. Please try again in a moment."
+        )
+    if not is_search_ready():
+        raise HTTPException(
+            status_code=503,
+            detail="Search index is being built. Please try again in a moment."
+        )
+    items = search_items(q, limit=limit, include_archived=include_archived)
+    return {"query": q, "count": len(items), "items": items}
+
+
+@router.get("/changes")
+async def get_changes(since: int = Query(..., description="Dataset version the client last synced (ETag value)")):
+    """Get item upserts and tombstones since a dataset version - O(changes).
+
+    Returns {"full_resync": true} when the change log no longer covers `since`;
+    the client should then re-fetch GET /api/items.
+    """
+    if not is_data_ready():
+        raise HTTPException(
+            status_code=503,
+            detail="Service starting up - data loading in background. Please try again in a moment."
+        )
+    return get_changes_since(since)
+
+
+@router.get("/{item_id}")
+async def get_single_item(item_id: str, response: Response):
+    """Get a single item with all fields - O(1) lookup.
+
+    The ETag is the item's revision; send it back as If-Match on PUT.
+    """
     if not is_data_ready():
         raise HTTPException(
             status_code=503,
             detail="Service starting up - data loading in background. Please try again in a moment."
         )
-    return get_active_items()
+    item = get_item(item_id)
+    if item is None:
+        raise HTTPException(status_code=404, detail="Item not found")
+    response.headers["ETag"] = get_item_etag(item)
+    return item
 
 
 @router.delete("/{item_id}")
 async def delete_item(item_id: str):
     """Delete an existing item"""
-    data = load_data()
-    
-    # Find and remove item by ID
-    original_count = len(data.items)
-    data.items = [item for item in data.items if item.id != item_id]
-    
-    # Check if item was found and removed
-    if len(data.items) == original_count:
-        raise HTTPException(status_code=404, detail="Item not found")
-    
-    await save_data(data)
+    async with commit_section():
+        data = load_data()
+        
+        # Find and remove item by ID (O(1) via item index)
+        if remove_item(item_id) is None:
+            raise HTTPException(status_code=404, detail="Item not found")
+        
+        await save_data(data)
     return {"message": "Item deleted successfully", "id": item_id}
 
 
 @router.put("/{item_id}")
-async def update_item(item_id: str, updated_item: Item):
-    """Update an existing item"""
-    data = load_data()
-
-    # Find item by ID
-    for i, item in enumerate(data.items):
-        if item.id == item_id:
-            # Preserve original metadata
-            updated_item.id = item_id
-            updated_item.created_date = item.created_date
-            updated_item.last_accessed = datetime.now().isoformat()
-
-            # Add new category if needed
-            if updated_item.section and updated_item.section not in data.categories:
-                data.categories.append(updated_item.section)
-
-            # Replace item
-            data.items[i] = updated_item
-            await save_data(data)
-            return updated_item
+async def update_item(
+    item_id: str,
+    updated_item: Item,
+    response: Response,
+    if_match: Optional[str] = Header(None)
+):
+    """Update an existing item.
+
+    With an If-Match header (the ETag from GET /api/items/{id}) the update is
+    only applied if nobody changed the item in between - 409 otherwise.
+    """
+    async with commit_section():
+        data = load_data()
+
+        # Find item by ID (O(1) via item index)
+        item = get_item(item_id)
+        if item is None:
+            raise HTTPException(status_code=404, detail="Item not found")
+
+        # Optimistic concurrency check
+        if if_match is not None and not etag_matches_strong(if_match, get_item_etag(item)):
+            raise HTTPException(
+                status_code=409,
+                detail=f"Item was modified by another request (current revision {item.revision})"
+            )
+
+        # Preserve original metadata
+        updated_item.id = item_id
+        updated_item.created_date = item.created_date
+        updated_item.last_accessed = datetime.now().isoformat()
+
+        # Add new category if needed
+        if updated_item.section and not has_category(updated_item.section):
+            add_category(updated_item.section)
+
+        # Replace item (bumps the revision)
+        replace_item(item_id, updated_item)
+        await save_data(data)
+    response.headers["ETag"] = get_item_etag(updated_item)
+    return updated_item
 
-    raise HTTPException(status_code=404, detail="Item not found")
\ No newline at end of file
+@router.post("/{item_id}/review")
+async def record_review(item_id: str, review: ReviewRequest, response: Response):
+    """Record a review and schedule the next one server-side.
+
+    The next review date is `today` plus the interval for the rating from
+    Settings (`days` for a custom rating), and `today` is appended to the
+    review history. Only review fields change, so the request is a few bytes
+    and can't clobber a concurrent content edit. Safe to retry: the same
+    rating on the same day again changes nothing, another rating reschedules
+    without adding a second review.
+    """
+    if not is_data_ready():
+        raise HTTPException(
+            status_code=503,
+            detail="Service starting up - data loading in background. Please try again in a moment."
+        )
+    if review.days is not None and review.rating != "custom":
+        raise HTTPException(status_code=400, detail="days is only allowed with the custom rating")
+    today = parse_today(review.today)
+
+    async with commit_section():
+        data = load_data()
+        days = review_interval(data.settings, review.rating, review.days)
+        current = get_item(item_id)
+        if current is None:
+            raise HTTPException(status_code=404, detail="Item not found")
+        item = review_item(item_id, days, today)
+        # The stored item itself comes back when the review was already applied
+        if item is not current:
+            await save_data(data)
+    response.headers["ETag"] = get_item_etag(item)
+    return item
@@ -0,0 +1,20 @@
+from fastapi import Request, Response
+from typing import Any, Callable, Tuple
+from services.data_service import get_cached_response, get_data_etag
+from services.response_cache import etag_matches
+
+
+def cached_json_response(request: Request, key: Tuple, build: Callable[[], Any]) -> Response:
+    """Serve a read endpoint from the encoded response cache with ETag revalidation.
+
+    Answers 304 Not Modified when the client's If-None-Match still matches the
+    dataset version, so polling clients and proxies revalidate for free.
+    Validate the request parameters before calling this - a 304 must never
+    stand in for an error response.
+    """
+    etag = get_data_etag()
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=headers)
+    body = get_cached_response(key, build)
+    return Response(content=body, media_type="application/json", headers=headers)
@@ -0,0 +1,63 @@
+from fastapi import APIRouter, HTTPException, Query
+from datetime import date
+from typing import Optional
+from services.data_service import count_due_items, get_due_items, get_review_stats, is_data_ready
+
+router = APIRouter(prefix="/api/review", tags=["review"])
+
+
+def _check_ready():
+    if not is_data_ready():
+        raise HTTPException(
+            status_code=503,
+            detail="Service starting up - data loading in background. Please try again in a moment."
+        )
+
+
+def parse_today(today: Optional[str]) -> str:
+    """Client's local date, defaulting to the server date"""
+    if today is None:
+        return date.today().isoformat()
+    try:
+        valid = date.fromisoformat(today).isoformat() == today
+    except ValueError:
+        valid = False
+    if not valid:
+        raise HTTPException(status_code=400, detail="today must be a date in YYYY-MM-DD format")
+    return today
+
+
+@router.get("/queue")
+async def get_review_queue(
+    limit: int = Query(50, ge=1, le=1000),
+    category: Optional[str] = None,
+    today: Optional[str] = Query(None, description="Client's local date (YYYY-MM-DD), defaults to server date")
+):
+    """Get items due for review, most overdue first - O(k log k) via the due index.
+
+    `total` is the number of items due in all (vectorized count), `count` the
+    number returned.
+    """
+    _check_ready()
+    today = parse_today(today)
+    items = get_due_items(limit, section=category, today=today)
+    return {
+        "date": today,
+        "count": len(items),
+        "total": count_due_items(section=category, today=today),
+        "items": items
+    }
+
+
+@router.get("/stats")
+async def get_review_stats_route(
+    days: int = Query(7, ge=0, le=3650, description="Window for the upcoming count"),
+    today: Optional[str] = Query(None, description="Client's local date (YYYY-MM-DD), defaults to server date")
+):
+    """Review workload: new, overdue, due today and upcoming counts, overall and per category.
+
+    Answered by vectorized passes over the schedule index - milliseconds even
+    for a million items.
+    """
+    _check_ready()
+    return get_review_stats(today=parse_today(today), days=days)
@@ -1,21 +1,39 @@
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Request
 from models import Settings
-from services.data_service import load_data, save_data
+from services.data_service import (
+    load_data, save_data, update_settings as update_settings_in_data, is_data_ready, commit_section
+)
+from .responses import cached_json_response
 
 router = APIRouter(prefix="/api/settings", tags=["settings"])
 
 
+def validate_settings(settings: Settings):
+    """HTTP 400 unless every interval is a positive number of days"""
+    if settings.confident_days <= 0 or settings.medium_days <= 0 or settings.wtf_days <= 0:
+        raise HTTPException(status_code=400, detail="All settings values must be positive integers")
+
+
+@router.get("", response_model=Settings)
+async def get_settings(request: Request):
+    """Get global settings (cached encoded body with ETag revalidation)"""
+    if not is_data_ready():
+        raise HTTPException(
+            status_code=503,
+            detail="Service starting up - data loading in background. Please try again in a moment."
+        )
+    return cached_json_response(request, ("settings",), lambda: load_data().settings)
+
+
 @router.put("")
 async def update_settings(new_settings: Settings):
     """Update global settings"""
     data = load_data()
     
-    # Validate settings values
-    if new_settings.confident_days <= 0 or new_settings.medium_days <= 0 or new_settings.wtf_days <= 0:
-        raise HTTPException(status_code=400, detail="All settings values must be positive integers")
+    validate_settings(new_settings)
     
     # Update settings
-    data.settings = new_settings
-    
-    await save_data(data)
+    async with commit_section():
+        update_settings_in_data(new_settings)
+        await save_data(data)
     return data.settings
\ No newline at end of file
@@ -0,0 +1,148 @@
+import logging
+import threading
+from typing import Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class CategoryRegistry:
+    """Stable integer IDs for category names.
+
+    Item records store the ID of their section instead of the name and
+    resolve it through this table when read, so renaming a category changes
+    one entry here instead of every record in it. Only ItemRecords work this
+    way: Item models (hydrated by a route or created since the load) hold
+    the name and are still copied one by one. Each ID also counts its
+    renames, which records add to their stored revision - a rename still
+    moves the revision (and ETag) of every item in the category. IDs are
+    process-wide and never reused; after a rename the old name is free and
+    gets a new ID the next time it is seen.
+
+    Data is loaded in I/O threads while the event loop may rename, so
+    registering, renaming and snapshotting hold a lock; lookups are single
+    reads.
+    """
+
+    def __init__(self):
+        self._names: List[str] = []
+        self._renames: List[int] = []
+        self._ids: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def id_for(self, name: str) -> int:
+        """ID of a category name, registering it on first use"""
+        category_id = self._ids.get(name)
+        if category_id is None:
+            with self._lock:
+                category_id = self._ids.get(name)
+                if category_id is None:
+                    category_id = len(self._names)
+                    self._names.append(name)
+                    self._renames.append(0)
+                    self._ids[name] = category_id
+        return category_id
+
+    def get_id(self, name: str) -> Optional[int]:
+        """ID of a category name, or None if it was never used"""
+        return self._ids.get(name)
+
+    def name(self, category_id: int) -> str:
+        return self._names[category_id]
+
+    def renames(self, category_id: int) -> int:
+        """How often the category was renamed since its ID was assigned"""
+        return self._renames[category_id]
+
+    def snapshot(self) -> "CategoryRegistry":
+        """Copy that keeps resolving IDs as they are now, whatever is renamed later"""
+        frozen = CategoryRegistry()
+        with self._lock:
+            frozen._names = list(self._names)
+            frozen._renames = list(self._renames)
+            frozen._ids = dict(self._ids)
+        return frozen
+
+    def release(self, name: str):
+        """Unregister a name whose ID no item uses any more, so a rename can take it.
+
+        Anything still holding the old ID keeps resolving it.
+        """
+        with self._lock:
+            self._ids.pop(name, None)
+
+    def rename(self, category_id: int, new_name: str):
+        """Point an ID at a new name - O(1).
+
+        `new_name` must not belong to another ID: merging two categories moves
+        items from one ID to the other, which the caller has to do item by
+        item. Release a name first if its ID is no longer used.
+        """
+        with self._lock:
+            owner = self._ids.get(new_name)
+            if owner is not None and owner != category_id:
+                raise ValueError(f"Category name {new_name!r} belongs to category {owner}")
+            old_name = self._names[category_id]
+            if self._ids.get(old_name) == category_id:
+                del self._ids[old_name]
+            self._names[category_id] = new_name
+            self._renames[category_id] += 1
+            self._ids[new_name] = category_id
+        logger.debug(f"🏷️  Category {category_id} renamed: {old_name!r} -> {new_name!r}")
+
+
+class CategoryLookup:
+    """Case-insensitive index over the category list.
+
+    Makes duplicate checks ("does a category with this name in any case
+    exist?") and exact membership tests hash lookups instead of list scans.
+    """
+
+    def __init__(self):
+        self._folded: Dict[str, List[str]] = {}  # casefolded name -> names in list order
+        self._source: Optional[List[str]] = None
+        self._count = 0
+
+    def rebuild(self, categories: List[str]):
+        self._folded = {}
+        for name in categories:
+            self._folded.setdefault(name.casefold(), []).append(name)
+        self._source = categories
+        self._count = len(categories)
+
+    def is_synced_with(self, categories: List[str]) -> bool:
+        """Cheap check that the lookup still describes the given list"""
+        return self._source is categories and self._count == len(categories)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._folded.get(name.casefold(), ())
+
+    def find(self, name: str, ignore: Optional[str] = None) -> Optional[str]:
+        """The category equal to `name` ignoring case (other than `ignore`), or None"""
+        for match in self._folded.get(name.casefold(), ()):
+            if match != ignore:
+                return match
+        return None
+
+    def add(self, name: str):
+        self._folded.setdefault(name.casefold(), []).append(name)
+        self._count += 1
+
+    def remove(self, name: str):
+        key = name.casefold()
+        matches = self._folded.get(key)
+        if matches and name in matches:
+            matches.remove(name)
+            if not matches:
+                del self._folded[key]
+            self._count -= 1
+
+    def rename(self, old_name: str, new_name: str):
+        self.remove(old_name)
+        self.add(new_name)
+
+
+# Shared by every item record in the process
+registry = CategoryRegistry()
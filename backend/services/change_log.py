@@ -0,0 +1,52 @@
+import logging
+from collections import deque
+from typing import List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Change operations
+CHANGE_UPSERT = "upsert"
+CHANGE_DELETE = "delete"
+CHANGE_CATEGORIES = "categories"
+CHANGE_SETTINGS = "settings"
+CHANGE_MOVED = "moved"  # A category was renamed - the entry holds its category ID, not an item ID
+
+
+class ChangeLog:
+    """Bounded log of (version, op, item_id) entries for delta sync.
+
+    ``since(v)`` answers with every entry newer than v, or None when v is
+    older than the oldest retained entry (or from another dataset lineage)
+    and the client has to do a full resync.
+    """
+
+    def __init__(self, max_entries: int = 10000):
+        self._entries: deque = deque(maxlen=max_entries)
+        self._base_version = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def reset(self, version: int):
+        """Forget history - versions before this one require a full resync"""
+        self._entries.clear()
+        self._base_version = version
+
+    def append(self, version: int, op: str, item_id: Optional[str] = None):
+        if len(self._entries) == self._entries.maxlen:
+            # The oldest entry is about to be dropped
+            self._base_version = self._entries[0][0]
+        self._entries.append((version, op, item_id))
+
+    def since(self, version: int, current_version: int) -> Optional[List[Tuple[int, str, Optional[str]]]]:
+        """Entries with a version greater than `version`, or None if a full resync is required"""
+        if version < self._base_version or version > current_version:
+            return None
+        # Entries are in version order; walk back from the newest
+        changes = []
+        for entry in reversed(self._entries):
+            if entry[0] <= version:
+                break
+            changes.append(entry)
+        changes.reverse()
+        return changes
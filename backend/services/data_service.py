@@ -1,22 +1,120 @@
 import json
 import os
 import asyncio
+import base64
+import bisect
 import logging
-from datetime import datetime
-from typing import Optional
-from models import AppData, Settings
-from config import DATA_FILE
-from .storage_service import get_storage_service
+import time
+from datetime import date, datetime, timedelta
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+from models import AppData, Item, Settings
+from config import (
+    DATA_FILE, PERSIST_DEBOUNCE_SECONDS, PERSIST_MAX_DELAY_SECONDS,
+    DATA_JOURNAL_ENABLED, DATA_JOURNAL_COMPACT_EVERY, SEARCH_INDEX_ENABLED,
+    CHANGE_LOG_MAX_ENTRIES, SSE_MAX_SUBSCRIBERS, SSE_QUEUE_SIZE,
+    STORAGE_HEALTH_TTL_SECONDS, STORAGE_HEALTH_FAILURE_THRESHOLD, STORAGE_HEALTH_RETRY_SECONDS,
+    DATA_SNAPSHOT_FORMAT
+)
+from .storage_service import get_storage_service, run_blocking
+from .storage_health import StorageHealth
+from .item_index import ItemIndex
+from .due_index import DueIndex
+from .schedule_index import ScheduleIndex
+from .section_stats import SectionStats, COUNTS as SECTION_COUNTS
+from .search_index import SearchIndex
+from .response_cache import ResponseCache, etag_for_version
+from . import change_log
+from .event_bus import EventBus
+from .persistence_queue import PersistenceQueue
+from . import journal
+from . import snapshot
+from . import json_stream
+from .item_record import ItemRecord, make_item_record, item_to_dict, section_id
+from .category_registry import CategoryLookup, CategoryRegistry, registry
 
 logger = logging.getLogger(__name__)
 
+# Storage object names
+STORAGE_JSON_NAME = "mnemos_data.json"
+STORAGE_SNAPSHOT_NAME = "mnemos_data.bin"
+
 # Global memory cache
 _cached_data: Optional[AppData] = None
 _storage_service = None
+_storage_health: Optional[StorageHealth] = None
+_storage_health_for = None  # Storage service the health state belongs to
+
+# Fast item filtering cache (maintained incrementally, rebuilt on bulk load)
+_active_items = ItemIndex()
+_archived_items = ItemIndex()
+
+# Sorted IDs of active items - stable keyset order for cursor pagination
+_active_ids_sorted: List[str] = []
+
+# Review queue index keyed on next_review_date
+_due_index = DueIndex()
+_schedule_index = ScheduleIndex()  # Row-aligned with _item_index
+
+# Per-section item and due counters
+_section_stats = SectionStats()
+
+# Case-insensitive lookup over _cached_data.categories
+_category_lookup = CategoryLookup()
+
+# IDs of items held as Item models rather than records, by section. Records
+# resolve their section through the category registry; these are the items a
+# rename has to copy.
+_item_models_by_section: Dict[str, Set[str]] = {}
+
+# Full-text search index over item text. Bulk builds run in the I/O pool and
+# are swapped in when done; until then _search_pending collects the IDs of
+# items changed meanwhile (None while the live index is current).
+_search_index = SearchIndex()
+_search_pending: Optional[Set[str]] = None
+_search_build: Optional[asyncio.Task] = None
+_search_generation = 0
+
+# Build cost of the derived indexes, from the last bulk rebuild
+_index_metrics: dict = {}
 
-# Fast item filtering cache
-_cached_active_items: Optional[list] = None
-_cached_archived_items: Optional[list] = None
+# O(1) item-by-ID index over _cached_data.items
+_item_index = ItemIndex()
+
+# Mutation records collected by the helpers below until the next save_data
+_pending_records: list = []
+# Set when the local file must be fully rewritten instead of journaled
+_snapshot_required: bool = True
+_journal: Optional[journal.MutationJournal] = None
+
+# Monotonically increasing dataset version, bumped on every change. Seeded
+# from the wall clock and raised above the version saved with loaded data
+# (see _rebuild_indexes), so versions keep increasing across restarts even
+# when bulk writes have pushed them ahead of the clock.
+_data_version: int = time.time_ns() // 1_000_000
+
+# Encoded read responses for the current dataset version
+_response_cache = ResponseCache()
+
+# Recent (version, op, item_id) entries for delta sync
+_change_log = change_log.ChangeLog(CHANGE_LOG_MAX_ENTRIES)
+
+# Push channel for committed changes (GET /api/events)
+_event_bus = EventBus(max_subscribers=SSE_MAX_SUBSCRIBERS, queue_size=SSE_QUEUE_SIZE)
+_last_published_version: int = _data_version
+
+# Journal op -> change log op
+_CHANGE_OPS = {
+    journal.OP_ITEM_UPSERT: change_log.CHANGE_UPSERT,
+    journal.OP_ITEM_DELETE: change_log.CHANGE_DELETE,
+    journal.OP_SETTINGS: change_log.CHANGE_SETTINGS,
+    journal.OP_CATEGORY_ADD: change_log.CHANGE_CATEGORIES,
+    journal.OP_CATEGORY_DELETE: change_log.CHANGE_CATEGORIES,
+    journal.OP_CATEGORY_RENAME: change_log.CHANGE_CATEGORIES,
+}
+
+# Serializes read-check-write mutations (see commit_section)
+_commit_lock: Optional[asyncio.Lock] = None
+_commit_lock_loop: Optional[asyncio.AbstractEventLoop] = None
 
 # Service state tracking for non-blocking startup
 _service_ready: bool = False
@@ -29,6 +127,24 @@ def get_storage():
         _storage_service = get_storage_service()
     return _storage_service
 
+def get_storage_health() -> StorageHealth:
+    """Cached health state for the current storage service (rebuilt if it was swapped)"""
+    global _storage_health, _storage_health_for
+    storage = get_storage()
+    if _storage_health is None or _storage_health_for is not storage:
+        async def probe() -> bool:
+            return await run_blocking(storage.is_available)
+        _storage_health = StorageHealth(
+            probe,
+            ttl_seconds=STORAGE_HEALTH_TTL_SECONDS,
+            failure_threshold=STORAGE_HEALTH_FAILURE_THRESHOLD,
+            retry_seconds=STORAGE_HEALTH_RETRY_SECONDS,
+            # Uploads were skipped while the circuit was open - push the latest state
+            on_recovery=lambda: _persistence_queue.request_save()
+        )
+        _storage_health_for = storage
+    return _storage_health
+
 async def _load_from_storage() -> Optional[AppData]:
     """Load data from storage service"""
     storage = get_storage()
@@ -36,12 +152,16 @@ async def _load_from_storage() -> Optional[AppData]:
     logger.info(f"🔧 Using storage service: {storage_type}")
     
     try:
-        if storage.is_available():
+        if await get_storage_health().check():
+            if DATA_SNAPSHOT_FORMAT == "binary":
+                data = await _load_snapshot_from_storage(storage)
+                if data is not None:
+                    return data
+                logger.info("📄 No usable binary snapshot, falling back to JSON")
             logger.info("✅ Storage service is available, downloading data...")
-            data_dict = await storage.download_json("mnemos_data.json")
-            if data_dict:
-                logger.info(f"📥 Successfully downloaded data from storage ({len(str(data_dict))} chars)")
-                processed_data = _process_data_dict(data_dict)
+            # Items are parsed and validated one at a time as the blob streams in
+            processed_data = await storage.read_json_stream(STORAGE_JSON_NAME, _parse_data_stream)
+            if processed_data:
                 logger.info(f"🔄 Processed data: {len(processed_data.items)} items, {len(processed_data.categories)} categories")
                 return processed_data
             else:
@@ -54,17 +174,65 @@ async def _load_from_storage() -> Optional[AppData]:
         logger.error(f"📋 Full traceback: {traceback.format_exc()}")
     return None
 
+def _snapshot_cache_path() -> str:
+    """Local file the binary snapshot is downloaded to and memory-mapped from"""
+    return os.path.splitext(DATA_FILE)[0] + ".bin"
+
+async def _load_snapshot_from_storage(storage) -> Optional[AppData]:
+    """Download the binary snapshot and decode it (None if missing or unreadable)"""
+    path = _snapshot_cache_path()
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    # Records of an earlier load may still read from the mapped file - never
+    # rewrite it in place, swap in a new one
+    download_path = path + ".download"
+    if not await storage.download_to_file(STORAGE_SNAPSHOT_NAME, download_path):
+        return None
+    os.replace(download_path, path)
+    try:
+        data = await run_blocking(snapshot.read_snapshot, path)
+        logger.info(f"📦 Loaded binary snapshot: {len(data.items)} items, {len(data.categories)} categories")
+        return data
+    except snapshot.SnapshotError as e:
+        logger.warning(f"⚠️  Ignoring unreadable binary snapshot: {e}")
+        return None
+
 def _load_from_local_file() -> Optional[AppData]:
-    """Load data from local file as fallback"""
+    """Load data from local file as fallback (snapshot + journal replay)"""
     if os.path.exists(DATA_FILE):
         try:
             with open(DATA_FILE, 'r') as f:
-                data_dict = json.load(f)
-                return _process_data_dict(data_dict)
+                data = _parse_data_stream(f)
+            _get_journal().replay(data)
+            return data
         except Exception as e:
             logger.warning(f"Failed to load from local file: {e}")
     return None
 
+def dump_app_data(data: AppData, categories: Optional[CategoryRegistry] = None) -> dict:
+    """AppData as a plain dict - items may be Items or not-yet-hydrated ItemRecords.
+
+    `categories` is a registry snapshot to resolve record sections through
+    (see item_to_dict) - needed when dumping off the event loop.
+    """
+    return {"items": [item_to_dict(item, categories) for item in data.items], **data.dict(exclude={"items"})}
+
+def _migrate_item_dict(item: dict) -> dict:
+    """Handle backward compatibility: migrate single images to arrays"""
+    # Migrate problem_image to problem_images
+    if "problem_image" in item and item["problem_image"] and "problem_images" not in item:
+        item["problem_images"] = [item["problem_image"]]
+    elif "problem_images" not in item:
+        item["problem_images"] = []
+
+    # Migrate answer_image to answer_images
+    if "answer_image" in item and item["answer_image"] and "answer_images" not in item:
+        item["answer_images"] = [item["answer_image"]]
+    elif "answer_images" not in item:
+        item["answer_images"] = []
+    return item
+
 def _process_data_dict(data_dict: dict) -> AppData:
     """Process raw data dictionary into AppData model"""
     # Handle backward compatibility: convert dict settings to Settings model
@@ -72,23 +240,30 @@ def _process_data_dict(data_dict: dict) -> AppData:
         settings_dict = data_dict["settings"]
         data_dict["settings"] = Settings(**settings_dict)
 
-    # Handle backward compatibility: migrate single images to arrays
     if "items" in data_dict:
         for item in data_dict["items"]:
-            # Migrate problem_image to problem_images
-            if "problem_image" in item and item["problem_image"] and "problem_images" not in item:
-                item["problem_images"] = [item["problem_image"]]
-            elif "problem_images" not in item:
-                item["problem_images"] = []
-
-            # Migrate answer_image to answer_images
-            if "answer_image" in item and item["answer_image"] and "answer_images" not in item:
-                item["answer_images"] = [item["answer_image"]]
-            elif "answer_images" not in item:
-                item["answer_images"] = []
+            _migrate_item_dict(item)
 
     return AppData(**data_dict)
 
+def _parse_data_stream(fp) -> AppData:
+    """Build AppData from a JSON text stream, one item at a time.
+
+    Peak memory stays at the finished AppData plus one raw item and a read
+    chunk, instead of text + parsed dict + models all at once. Items are kept
+    as ItemRecords and only become Items when get_item() needs one.
+    """
+    items = []
+    fields = {}
+    for key, value in json_stream.iter_members(fp):
+        if key == "items":
+            items.append(make_item_record(_migrate_item_dict(value)))
+        else:
+            fields[key] = value
+    data = _process_data_dict(fields)
+    data.items = items
+    return data
+
 def _create_default_data() -> AppData:
     """Create default data when no data source is available"""
     return AppData(
@@ -106,7 +281,7 @@ def initialize_default_data():
     global _cached_data, _service_ready
     logger.info("🏗️  Initializing service with default data for quick startup")
     _cached_data = _create_default_data()
-    _rebuild_item_caches()
+    _rebuild_indexes()
     _service_ready = True
     logger.info("✅ Service ready with default data")
 
@@ -127,7 +302,7 @@ async def background_data_loading():
         if loaded_data:
             logger.info(f"✅ Background loading successful: {len(loaded_data.items)} items, {len(loaded_data.categories)} categories")
             _cached_data = loaded_data
-            _rebuild_item_caches()
+            _rebuild_indexes()
         else:
             logger.info("⚠️  Background loading returned no data - keeping default data")
             
@@ -138,7 +313,7 @@ async def background_data_loading():
             if local_data:
                 logger.info(f"✅ Local file fallback successful: {len(local_data.items)} items")
                 _cached_data = local_data
-                _rebuild_item_caches()
+                _rebuild_indexes()
             else:
                 logger.info("⚠️  Local file fallback also failed - keeping default data")
                 
@@ -150,40 +325,571 @@ async def background_data_loading():
         _data_loading = False
         logger.info("🏁 Background data loading completed")
 
-def _rebuild_item_caches():
-    """Rebuild active/archived item caches - called when data changes"""
-    global _cached_active_items, _cached_archived_items, _cached_data
+def _rebuild_item_caches(items: Optional[list] = None):
+    """Rebuild active/archived item caches from scratch - bulk load only"""
+    if items is None:
+        items = _cached_data.items if _cached_data is not None else []
     
-    if _cached_data is None:
-        _cached_active_items = []
-        _cached_archived_items = []
+    # Split items into active and archived lists (O(n) operation)
+    started = time.perf_counter()
+    _active_items.rebuild([item for item in items if not item.archived])
+    _archived_items.rebuild([item for item in items if item.archived])
+    _active_ids_sorted[:] = sorted(item.id for item in _active_items.items)
+    caches_done = time.perf_counter()
+    _due_index.rebuild(items)
+    due_done = time.perf_counter()
+    _schedule_index.rebuild(_item_index.items)
+    schedule_done = time.perf_counter()
+    _section_stats.rebuild(items)
+    _item_models_by_section.clear()
+    for item in items:
+        if not isinstance(item, ItemRecord):
+            _item_models_by_section.setdefault(item.section, set()).add(item.id)
+    section_stats_done = time.perf_counter()
+    if SEARCH_INDEX_ENABLED:
+        _rebuild_search_index(items)
+    
+    _index_metrics.update({
+        "items": len(items),
+        "item_caches_ms": round((caches_done - started) * 1000, 2),
+        "due_index_ms": round((due_done - caches_done) * 1000, 2),
+        "schedule_index_ms": round((schedule_done - due_done) * 1000, 2),
+        "section_stats_ms": round((section_stats_done - schedule_done) * 1000, 2),
+        "rebuilt_at": datetime.now().isoformat()
+    })
+    logger.info(f"⚡ Indexes rebuilt for {len(items)} items: {_index_metrics}")
+    
+    logger.debug(f"⚡ Cache rebuilt: {len(_active_items)} active, {len(_archived_items)} archived items")
+
+def _rebuild_search_index(items: list):
+    """Rebuild the search index - in the I/O pool when called on the event loop.
+
+    Search answers 503 (is_search_ready) until the new index is swapped in;
+    the build takes seconds for a large deck and must not stall other requests.
+    """
+    global _search_index, _search_pending, _search_build, _search_generation
+    _search_generation += 1
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        # No event loop (scripts, tests) - nothing to stall
+        started = time.perf_counter()
+        _search_index = SearchIndex()
+        _search_index.rebuild(items)
+        _search_pending = None
+        _index_metrics["search_index_ms"] = round((time.perf_counter() - started) * 1000, 2)
         return
+    _search_pending = set()
+    # A shallow copy - mutations replace items, so the worker sees a stable list
+    _search_build = asyncio.create_task(_build_search_index(list(items), _search_generation))
+
+async def _build_search_index(items: list, generation: int):
+    """Build a search index off the loop, catch up on changes made meanwhile and swap it in"""
+    global _search_index, _search_pending
+    started = time.perf_counter()
+    index = SearchIndex()
+    try:
+        await run_blocking(index.rebuild, items)
+    except Exception as e:
+        logger.error(f"💥 Search index build failed: {e}")
+        return
+    if generation != _search_generation:
+        return  # Superseded by a newer rebuild
+    for item_id in _search_pending:
+        index.update(item_id, _item_index.get(item_id))
+    _search_index = index
+    _search_pending = None
+    _index_metrics["search_index_ms"] = round((time.perf_counter() - started) * 1000, 2)
+    logger.info(f"🔎 Search index ready: {len(index)} items in {_index_metrics['search_index_ms']}ms")
+
+def is_search_ready() -> bool:
+    """Whether the search index covers the current data (False while it is being built)"""
+    return _search_pending is None
+
+def _apply_item_delta(old_item: Optional[Item], new_item: Optional[Item]):
+    """Apply a single insert/update/delete/archive transition to the caches - O(1)"""
+    item_id = (old_item or new_item).id
+    _due_index.update(item_id, new_item)
+    _section_stats.update(old_item, new_item)
+    if old_item is not None and not isinstance(old_item, ItemRecord):
+        _forget_item_model(old_item)
+    if new_item is not None and not isinstance(new_item, ItemRecord):
+        _item_models_by_section.setdefault(new_item.section, set()).add(item_id)
+    if SEARCH_INDEX_ENABLED:
+        if _search_pending is not None:
+            _search_pending.add(item_id)
+        else:
+            _search_index.update(item_id, new_item)
     
-    # Split items into active and archived lists (O(n) operation)
-    _cached_active_items = [item for item in _cached_data.items if not item.archived]
-    _cached_archived_items = [item for item in _cached_data.items if item.archived]
+    was_active = old_item is not None and not old_item.archived
+    is_active = new_item is not None and not new_item.archived
+    if is_active and not was_active:
+        bisect.insort(_active_ids_sorted, item_id)
+    elif was_active and not is_active:
+        position = bisect.bisect_left(_active_ids_sorted, item_id)
+        if position < len(_active_ids_sorted) and _active_ids_sorted[position] == item_id:
+            del _active_ids_sorted[position]
     
-    logger.debug(f"⚡ Cache rebuilt: {len(_cached_active_items)} active, {len(_cached_archived_items)} archived items")
+    if old_item is not None and new_item is not None and old_item.archived == new_item.archived:
+        # Same cache - replace in place to keep the item's position
+        (_archived_items if new_item.archived else _active_items).replace(old_item.id, new_item)
+        return
+    if old_item is not None:
+        (_archived_items if old_item.archived else _active_items).remove(old_item.id)
+    if new_item is not None:
+        (_archived_items if new_item.archived else _active_items).append(new_item)
+
+def _forget_item_model(item: Item):
+    ids = _item_models_by_section.get(item.section)
+    if ids is not None:
+        ids.discard(item.id)
+        if not ids:
+            del _item_models_by_section[item.section]
+
+def _bump_version() -> int:
+    """Advance the dataset version - every visible change must call this"""
+    global _data_version
+    _data_version += 1
+    return _data_version
+
+def get_data_version() -> int:
+    """Current dataset version"""
+    return _data_version
+
+def get_data_etag() -> str:
+    """Strong ETag for the current dataset version"""
+    return etag_for_version(_data_version)
+
+def get_item_etag(item: Item) -> str:
+    """Strong ETag for one item's revision (If-Match on PUT /api/items/{id})"""
+    return etag_for_version(item.revision)
+
+def commit_section() -> asyncio.Lock:
+    """Lock that serializes mutations: ``async with commit_section(): ...``
+
+    Hold it across validation, the mutation helpers and ``await save_data()``
+    so a check (e.g. If-Match) and the write it guards can't interleave with
+    another request at an await point.
+    """
+    global _commit_lock, _commit_lock_loop
+    loop = asyncio.get_running_loop()
+    if _commit_lock is None or _commit_lock_loop is not loop:
+        _commit_lock = asyncio.Lock()
+        _commit_lock_loop = loop
+    return _commit_lock
+
+def get_cached_response(key: Tuple, build: Callable[[], Any]) -> bytes:
+    """Encoded JSON body for a read endpoint variant, cached until the next change"""
+    return _response_cache.get_or_build(key, _data_version, build)
+
+def get_response_cache_stats() -> dict:
+    """Hit/miss counters of the encoded response cache"""
+    return _response_cache.stats()
+
+def get_event_bus() -> EventBus:
+    """Event bus that save_data publishes committed changes to"""
+    return _event_bus
+
+def _publish_committed_changes():
+    """Push the changes committed since the last publish to event subscribers"""
+    global _last_published_version
+    changes = _change_log.since(_last_published_version, _data_version)
+    if changes is None:
+        _event_bus.publish({"type": "resync", "version": _data_version})
+    else:
+        _event_bus.publish({
+            "type": "changes",
+            "version": _data_version,
+            "changes": [
+                {"op": op, "section": registry.name(item_id)} if op == change_log.CHANGE_MOVED
+                else {"op": op, "id": item_id}
+                for _, op, item_id in changes
+            ]
+        })
+    _last_published_version = _data_version
+
+def _rebuild_indexes():
+    """Rebuild every derived index from _cached_data - bulk load only"""
+    global _snapshot_required, _data_version
+    if _cached_data is not None:
+        # Never reuse a version (ETag, since= cursor) handed out before a restart
+        _data_version = max(_data_version, _cached_data.data_version)
+    _change_log.reset(_bump_version())
+    _publish_committed_changes()
+    _item_index.rebuild(_cached_data.items if _cached_data is not None else [])
+    _rebuild_item_caches()
+    # Freshly loaded data may differ from the local snapshot + journal
+    _pending_records.clear()
+    _snapshot_required = True
+
+def _ensure_item_index(data: AppData):
+    """Rebuild the item index if the items list was replaced or edited out of band"""
+    global _snapshot_required
+    if not _item_index.is_synced_with(data.items):
+        logger.debug("🔄 Item index out of sync with data - rebuilding")
+        _item_index.rebuild(data.items)
+        _rebuild_item_caches(data.items)
+        # Clients can't be told what changed - force a full resync
+        _change_log.reset(_bump_version())
+        # Out-of-band edits are not in the journal
+        _snapshot_required = True
+
+def _record(op: str, **fields):
+    """Remember a mutation so save_data can journal it and clients can sync it"""
+    version = _bump_version()
+    _pending_records.append({"op": op, **fields})
+    item = fields.get("item")
+    _change_log.append(version, _CHANGE_OPS[op], item.id if item is not None else fields.get("id"))
+
+def get_item(item_id: str) -> Optional[Item]:
+    """Get a single item by ID - O(1) lookup, hydrated to an Item on first access"""
+    _ensure_item_index(load_data())
+    item = _item_index.get(item_id)
+    if isinstance(item, ItemRecord):
+        item = _hydrate(item)
+    return item
+
+def has_item(item_id: str) -> bool:
+    """Check whether an item ID exists - O(1), without hydrating the item"""
+    _ensure_item_index(load_data())
+    return item_id in _item_index
+
+def _hydrate(record: ItemRecord) -> Item:
+    """Validate a record into an Item and put it in the record's place"""
+    item = record.hydrate()
+    _item_index.replace(record.id, item)
+    (_archived_items if item.archived else _active_items).replace(record.id, item)
+    _item_models_by_section.setdefault(item.section, set()).add(item.id)
+    _index_metrics["items_hydrated"] = _index_metrics.get("items_hydrated", 0) + 1
+    return item
+
+def add_item(item: Item):
+    """Append a new item to the dataset and index it - O(1)"""
+    _ensure_item_index(load_data())
+    item.revision = 1
+    _item_index.append(item)
+    _schedule_index.append(item)
+    _apply_item_delta(None, item)
+    _record(journal.OP_ITEM_UPSERT, item=item)
+
+def replace_item(item_id: str, item: Item) -> Optional[Item]:
+    """Replace an item in place by ID - O(1). Returns the previous item or None"""
+    _ensure_item_index(load_data())
+    old_item = _item_index.replace(item_id, item)
+    if old_item is not None:
+        item.revision = old_item.revision + 1
+        _schedule_index.set(_item_index.position(item_id), item)
+        _apply_item_delta(old_item, item)
+        _record(journal.OP_ITEM_UPSERT, item=item)
+    return old_item
+
+def remove_item(item_id: str) -> Optional[Item]:
+    """Remove an item by ID - O(1). Returns the removed item or None"""
+    _ensure_item_index(load_data())
+    position = _item_index.position(item_id)
+    removed = _item_index.remove(item_id)
+    if removed is not None:
+        _schedule_index.remove(position)
+        _apply_item_delta(removed, None)
+        _record(journal.OP_ITEM_DELETE, id=item_id)
+    return removed
+
+def review_interval(settings: Settings, rating: str, days: Optional[int] = None) -> int:
+    """Days until the next review for a rating (custom without days falls back to wtf_days)"""
+    if rating == "custom":
+        return days or settings.wtf_days
+    return getattr(settings, f"{rating}_days")
+
+def review_item(item_id: str, days: int, today: str) -> Optional[Item]:
+    """Record a review made on `today` and schedule the next one `days` later - O(1).
+
+    Only the review fields change; the rest of the item is kept as stored, so a
+    review never overwrites a concurrent edit of the content. A second review
+    on the same day only reschedules - today is in the history once - and one
+    that changes nothing (a retried request) returns the stored item as is.
+    Returns None if the item doesn't exist.
+    """
+    item = get_item(item_id)
+    if item is None:
+        return None
+    next_review_date = (date.fromisoformat(today) + timedelta(days=days)).isoformat()
+    review_dates = item.review_dates
+    if review_dates and review_dates[-1] == today:
+        if item.reviewed and item.next_review_date == next_review_date:
+            return item
+    else:
+        review_dates = [*review_dates, today]
+    reviewed = item.copy(update={
+        "reviewed": True,
+        "next_review_date": next_review_date,
+        "review_dates": review_dates,
+        "last_accessed": datetime.now().isoformat()
+    })
+    replace_item(item_id, reviewed)
+    return reviewed
+
+def update_settings(settings: Settings):
+    """Replace the global settings"""
+    load_data().settings = settings
+    _record(journal.OP_SETTINGS, settings=settings)
+
+def _ensure_category_lookup(data: AppData):
+    """Rebuild the category lookup if the category list was replaced or edited out of band"""
+    if not _category_lookup.is_synced_with(data.categories):
+        _category_lookup.rebuild(data.categories)
+
+def has_category(name: str) -> bool:
+    """Check whether a category exists (exact name) - O(1)"""
+    data = load_data()
+    _ensure_category_lookup(data)
+    return name in _category_lookup
+
+def find_category(name: str, ignore: Optional[str] = None) -> Optional[str]:
+    """Existing category with the same name ignoring case (other than `ignore`) - O(1)"""
+    data = load_data()
+    _ensure_category_lookup(data)
+    return _category_lookup.find(name, ignore)
+
+def add_category(name: str):
+    """Append a category to the category list"""
+    data = load_data()
+    _ensure_category_lookup(data)
+    data.categories.append(name)
+    _category_lookup.add(name)
+    _record(journal.OP_CATEGORY_ADD, name=name)
+
+def remove_category(name: str):
+    """Remove a category from the category list"""
+    data = load_data()
+    _ensure_category_lookup(data)
+    data.categories.remove(name)
+    _category_lookup.remove(name)
+    _record(journal.OP_CATEGORY_DELETE, name=name)
+
+def rename_category(old_name: str, new_name: str) -> int:
+    """Rename a category and move its items over. Returns the number of items moved.
+
+    Item records store their section as a category ID, so a rename points the
+    ID at the new name without touching them - O(1) for the records. Items
+    held as Item models (hydrated or created since the load) carry the name
+    and are copied one by one, O(models in the section). Renaming onto a name
+    other items already use merges the two sections item by item. Either way
+    every moved item's revision goes up by one.
+    """
+    data = load_data()
+    _ensure_item_index(data)
+    _ensure_category_lookup(data)
+    data.categories[data.categories.index(old_name)] = new_name
+    _category_lookup.rename(old_name, new_name)
+    # Record first so the moved items are logged under the rename's version
+    _record(journal.OP_CATEGORY_RENAME, old=old_name, new=new_name)
+    _schedule_index.rename_section(old_name, new_name)
+    items_moved = _section_stats.count(old_name)
+    merge = old_name != new_name and _section_stats.count(new_name) > 0
+    _section_stats.rename(old_name, new_name)
+    model_ids = _item_models_by_section.pop(old_name, set())
+    if not items_moved:
+        return 0
+
+    if merge:
+        for item in data.items:
+            if item.section == old_name:
+                _move_item(item, new_name)
+                _change_log.append(_data_version, change_log.CHANGE_UPSERT, item.id)
+    else:
+        category_id = registry.id_for(old_name)
+        if new_name != old_name:
+            # No item is in new_name (that would be a merge), so an ID still
+            # registered under it is left over from items moved or deleted since
+            registry.release(new_name)
+        registry.rename(category_id, new_name)
+        for item_id in model_ids:
+            _move_item(_item_index.get(item_id), new_name)
+        # One entry for the whole section - delta sync expands it
+        _change_log.append(_data_version, change_log.CHANGE_MOVED, category_id)
+    _item_models_by_section.setdefault(new_name, set()).update(model_ids)
+    return items_moved
+
+def _move_item(item: Item, section: str):
+    """Put a copy of an item in another section - export snapshots share the old objects"""
+    moved = item.copy(update={"section": section, "revision": item.revision + 1})
+    _item_index.replace(item.id, moved)
+    (_archived_items if moved.archived else _active_items).replace(item.id, moved)
+    _due_index.update(item.id, moved)
+
+def get_export_snapshot(include_archived: bool = False) -> Tuple[int, list, dict, CategoryRegistry]:
+    """Point-in-time view for exports: (dataset version, items, categories/settings/last_updated,
+    category registry snapshot to resolve record sections with).
+
+    The item list is a shallow copy - O(n) references, no item data. Mutations
+    replace item objects rather than editing them, and renames change the
+    registry rather than records, so with the registry snapshot it stays
+    unchanged while it is streamed out.
+    """
+    data = load_data()
+    _ensure_item_index(data)
+    items = list(data.items) if include_archived else list(_active_items.items)
+    return _data_version, items, data.dict(exclude={"items"}), registry.snapshot()
 
 def get_active_items() -> list:
     """Get active (non-archived) items - SUPER FAST O(1) operation"""
-    global _cached_active_items
-    
-    if _cached_active_items is None:
-        logger.debug("🔄 Building item cache for the first time")
-        _rebuild_item_caches()
-    
-    return _cached_active_items
+    if _cached_data is not None:
+        _ensure_item_index(_cached_data)
+    return _active_items.items
+
+def _encode_cursor(item_id: str) -> str:
+    return base64.urlsafe_b64encode(item_id.encode()).decode().rstrip("=")
+
+def _decode_cursor(cursor: str) -> str:
+    try:
+        return base64.b64decode(cursor + "=" * (-len(cursor) % 4), altchars=b"-_", validate=True).decode()
+    except Exception:
+        raise ValueError("Invalid cursor")
+
+def get_active_items_page(limit: Optional[int] = None, cursor: Optional[str] = None) -> Tuple[List[Item], Optional[str]]:
+    """Get a page of active items in stable ID order, plus the cursor for the next page.
+
+    The cursor is the last ID of the previous page, so pages stay consistent
+    while items are created or deleted between requests.
+    """
+    if _cached_data is not None:
+        _ensure_item_index(_cached_data)
+    start = bisect.bisect_right(_active_ids_sorted, _decode_cursor(cursor)) if cursor else 0
+    end = len(_active_ids_sorted) if limit is None else start + limit
+    page_ids = _active_ids_sorted[start:end]
+    next_cursor = _encode_cursor(page_ids[-1]) if page_ids and end < len(_active_ids_sorted) else None
+    return [_item_index.get(item_id) for item_id in page_ids], next_cursor
+
+def validate_item_query(cursor: Optional[str], fields: Optional[str]):
+    """Raise ValueError for a malformed `cursor` or unknown `fields` - check before answering 304"""
+    if cursor:
+        _decode_cursor(cursor)
+    parse_item_fields(fields)
+
+def parse_item_fields(fields: Optional[str]) -> Optional[Set[str]]:
+    """Parse a comma-separated `fields=` projection (id is always included)"""
+    if fields is None:
+        return None
+    requested = {field.strip() for field in fields.split(",") if field.strip()}
+    unknown = requested - set(Item.__fields__)
+    if unknown:
+        raise ValueError(f"Unknown item fields: {', '.join(sorted(unknown))}")
+    return requested | {"id"}
+
+def project_items(items: List[Item], fields: Optional[Set[str]]) -> list:
+    """Apply a sparse fieldset to items (no-op without one)"""
+    if fields is None:
+        return items
+    return [
+        {name: item[name] for name in item if name in fields} if isinstance(item, ItemRecord)
+        else item.dict(include=fields)
+        for item in items
+    ]
+
+def get_changes_since(since: int) -> dict:
+    """Active-item upserts and tombstones since a dataset version (delta sync).
+
+    Tombstones cover deleted and archived items. `full_resync` is set when the
+    change log no longer reaches back to `since`.
+    """
+    current = _data_version
+    changes = _change_log.since(since, current)
+    if changes is None:
+        return {"version": current, "full_resync": True}
+
+    latest_ops = {}
+    moved_categories = set()
+    categories_changed = settings_changed = False
+    for _, op, item_id in changes:
+        if op == change_log.CHANGE_CATEGORIES:
+            categories_changed = True
+        elif op == change_log.CHANGE_SETTINGS:
+            settings_changed = True
+        elif op == change_log.CHANGE_MOVED:
+            moved_categories.add(item_id)
+        else:
+            latest_ops[item_id] = op
+
+    if moved_categories:
+        # Renamed sections are logged once - their items are upserts (O(n), renames only)
+        for item in _active_items.items:
+            if item.id not in latest_ops and section_id(item) in moved_categories:
+                latest_ops[item.id] = change_log.CHANGE_UPSERT
+
+    upserts, tombstones = [], []
+    for item_id in latest_ops:
+        item = _item_index.get(item_id)
+        if item is None or item.archived:
+            tombstones.append(item_id)
+        else:
+            upserts.append(item)
+
+    data = load_data()
+    return {
+        "version": current,
+        "full_resync": False,
+        "upserts": upserts,
+        "tombstones": tombstones,
+        "categories": data.categories if categories_changed else None,
+        "settings": data.settings if settings_changed else None
+    }
+
+def get_due_items(limit: int, section: Optional[str] = None, today: Optional[str] = None) -> List[Item]:
+    """Get up to `limit` items due on or before today, most overdue first - O(k log k)"""
+    if _cached_data is not None:
+        _ensure_item_index(_cached_data)
+    today = today or date.today().isoformat()
+    return [_item_index.get(item_id) for item_id in _due_index.due(today, limit, section)]
+
+def count_due_items(section: Optional[str] = None, today: Optional[str] = None) -> int:
+    """Number of items due on or before today - one vectorized pass"""
+    if _cached_data is not None:
+        _ensure_item_index(_cached_data)
+    today = today or date.today().isoformat()
+    return _schedule_index.count_due(date.fromisoformat(today).toordinal(), section)
+
+def get_review_stats(today: Optional[str] = None, days: int = 7) -> dict:
+    """Due, overdue, new and upcoming counts, overall and per category - vectorized"""
+    if _cached_data is not None:
+        _ensure_item_index(_cached_data)
+    today = today or date.today().isoformat()
+    return {"date": today, "days": days, **_schedule_index.stats(date.fromisoformat(today).toordinal(), days)}
+
+def count_category_items(name: str) -> int:
+    """Number of items in a category, archived included - O(1) via the section counters"""
+    if _cached_data is not None:
+        _ensure_item_index(_cached_data)
+    return _section_stats.count(name)
+
+def get_category_stats(today: Optional[str] = None) -> dict:
+    """Item and due counts per category - O(categories) from the section counters"""
+    data = load_data()
+    _ensure_item_index(data)
+    today = today or date.today().isoformat()
+    day = date.fromisoformat(today).toordinal()
+    # Categories in their list order, then sections items use without a category entry
+    names = dict.fromkeys(data.categories)
+    names.update(dict.fromkeys(_section_stats.sections()))
+    categories = {name: _section_stats.counts(name, day) for name in names}
+    totals = {key: sum(counts[key] for counts in categories.values()) for key in SECTION_COUNTS}
+    return {"date": today, **totals, "categories": categories}
+
+def search_items(query: str, limit: int = 20, include_archived: bool = False) -> List[Item]:
+    """Full-text search over item text, best BM25 match first"""
+    if _cached_data is not None:
+        _ensure_item_index(_cached_data)
+    include = None if include_archived else (lambda item_id: item_id in _active_items)
+    return [_item_index.get(item_id) for item_id, _ in _search_index.search(query, limit, include)]
+
+def get_index_metrics() -> dict:
+    """Build cost of the derived indexes from the last bulk rebuild"""
+    return dict(_index_metrics)
 
 def get_archived_items() -> list:
     """Get archived items - SUPER FAST O(1) operation"""
-    global _cached_archived_items
-    
-    if _cached_archived_items is None:
-        logger.debug("🔄 Building item cache for the first time")
-        _rebuild_item_caches()
-    
-    return _cached_archived_items
+    if _cached_data is not None:
+        _ensure_item_index(_cached_data)
+    return _archived_items.items
 
 async def preload_data_from_storage():
     """Preload data from storage during FastAPI startup"""
@@ -195,7 +901,7 @@ async def preload_data_from_storage():
     try:
         _cached_data = await _load_from_storage()
         if _cached_data:
-            _rebuild_item_caches()  # Build fast cache
+            _rebuild_indexes()  # Build fast cache
             logger.info(f"✅ Data preloaded from storage service - {len(_cached_data.items)} items, {len(_cached_data.categories)} categories")
             return
     except Exception as e:
@@ -205,7 +911,7 @@ async def preload_data_from_storage():
     try:
         _cached_data = _load_from_local_file()
         if _cached_data:
-            _rebuild_item_caches()  # Build fast cache
+            _rebuild_indexes()  # Build fast cache
             logger.info(f"✅ Data preloaded from local file - {len(_cached_data.items)} items, {len(_cached_data.categories)} categories")
             return
     except Exception as e:
@@ -214,7 +920,7 @@ async def preload_data_from_storage():
     # Create default data if nothing else works
     logger.info("🏗️  Creating default data (no existing data found)")
     _cached_data = _create_default_data()
-    _rebuild_item_caches()  # Build fast cache
+    _rebuild_indexes()  # Build fast cache
 
 def load_data() -> AppData:
     """Load data with memory cache - should be preloaded during startup"""
@@ -245,49 +951,136 @@ async def save_data(data: AppData):
     
     # Update timestamp
     data.last_updated = datetime.now().isoformat()
+    data.data_version = _bump_version()
     
     # 1. Update memory cache immediately (fast response)
+    # Item caches are kept up to date by the mutation helpers; a replaced or
+    # out-of-band edited items list triggers a full rebuild here
     _cached_data = data
+    _ensure_item_index(data)
     logger.debug("Data updated in memory cache")
     
-    # 2. Rebuild fast item caches (O(n) but only on data changes)
-    _rebuild_item_caches()
+    # 2. Background save to storage (coalesced by the persistence worker);
+    # availability comes from cached health state, not a per-save probe
+    if get_storage_health().is_available():
+        _persistence_queue.request_save()
     
-    # 3. Background save to storage (fire-and-forget)
-    storage = get_storage()
-    if storage.is_available():
-        asyncio.create_task(_async_save_to_storage(data))
+    # 3. Also save to local file as backup (journal append when possible)
+    _persist_to_local_file(data)
     
-    # 4. Also save to local file as backup
-    _save_to_local_file(data)
+    # 4. Notify event subscribers (other tabs/devices)
+    _publish_committed_changes()
 
-async def _async_save_to_storage(data: AppData):
+async def _async_save_to_storage(data: AppData) -> bool:
     """Background task to save data to storage"""
     storage = get_storage()
     storage_type = type(storage).__name__
+    # Point-in-time view taken on the loop - O(n) references. Mutations replace
+    # items and settings and renames only touch the registry, so the I/O pool
+    # can serialize it while requests keep committing.
+    view = data.copy(update={"items": list(data.items), "categories": list(data.categories)})
+    categories = registry.snapshot()
     try:
         logger.info(f"💾 Saving data to {storage_type}...")
-        success = await storage.upload_json("mnemos_data.json", data.dict())
+        if DATA_SNAPSHOT_FORMAT == "binary":
+            payload = await run_blocking(snapshot.encode_snapshot, view, categories)
+            success = await storage.upload_bytes(STORAGE_SNAPSHOT_NAME, payload)
+        else:
+            payload = await run_blocking(dump_app_data, view, categories)
+            success = await storage.upload_json(STORAGE_JSON_NAME, payload)
         if success:
             logger.info(f"✅ Data successfully saved to {storage_type}")
+            get_storage_health().record_success()
         else:
             logger.warning(f"❌ Failed to save data to {storage_type}")
+            get_storage_health().record_failure()
+        return success
     except Exception as e:
         logger.error(f"💥 Error saving to {storage_type}: {e}")
         import traceback
         logger.error(f"📋 Full traceback: {traceback.format_exc()}")
+        get_storage_health().record_failure()
+        return False
+
+async def _save_latest_to_storage() -> bool:
+    """Persistence worker callback - always uploads the latest cached data"""
+    if _cached_data is None:
+        return True
+    return await _async_save_to_storage(_cached_data)
+
+# Single background worker that coalesces storage uploads
+_persistence_queue = PersistenceQueue(
+    _save_latest_to_storage,
+    debounce_seconds=PERSIST_DEBOUNCE_SECONDS,
+    max_delay_seconds=PERSIST_MAX_DELAY_SECONDS
+)
+
+async def flush_pending_saves():
+    """Wait for any pending storage upload to finish (e.g. on shutdown)"""
+    await _persistence_queue.flush()
+
+def get_persistence_stats() -> dict:
+    """Counters for coalesced vs. executed storage writes"""
+    return _persistence_queue.stats()
+
+def _get_journal() -> journal.MutationJournal:
+    """Get the mutation journal that sits next to DATA_FILE"""
+    global _journal
+    journal_path = DATA_FILE + ".journal"
+    if _journal is None or _journal.path != journal_path:
+        _journal = journal.MutationJournal(journal_path)
+    return _journal
+
+def _serialize_record(record: dict, data: AppData) -> dict:
+    """Turn a pending record into a JSON-ready journal record"""
+    serialized = {"last_updated": data.last_updated, "data_version": data.data_version}
+    for key, value in record.items():
+        if isinstance(value, ItemRecord):
+            value = item_to_dict(value)
+        serialized[key] = value.dict() if hasattr(value, "dict") else value
+    return serialized
+
+def _persist_to_local_file(data: AppData):
+    """Append pending records to the journal, or write a full snapshot when required"""
+    global _snapshot_required
+    records = list(_pending_records)
+    _pending_records.clear()
+
+    mutation_journal = _get_journal()
+    if (
+        DATA_JOURNAL_ENABLED
+        and records
+        and not _snapshot_required
+        and mutation_journal.records_since_snapshot + len(records) <= DATA_JOURNAL_COMPACT_EVERY
+    ):
+        try:
+            mutation_journal.append([_serialize_record(record, data) for record in records])
+            logger.debug(f"📜 Journaled {len(records)} records")
+            return
+        except Exception as e:
+            logger.warning(f"Failed to append to journal, writing snapshot instead: {e}")
+
+    # Snapshot + compaction
+    if _save_to_local_file(data):
+        mutation_journal.reset()
+        _snapshot_required = False
 
-def _save_to_local_file(data: AppData):
+def _save_to_local_file(data: AppData) -> bool:
     """Save data to local file as backup"""
     try:
         # Create directory if it doesn't exist
         os.makedirs(os.path.dirname(DATA_FILE), exist_ok=True)
         
-        with open(DATA_FILE, 'w') as f:
-            json.dump(data.dict(), f, indent=2)
+        # Write to a temp file first so a crash never leaves a torn snapshot
+        temp_file = DATA_FILE + ".tmp"
+        with open(temp_file, 'w') as f:
+            json.dump(dump_app_data(data), f, indent=2)
+        os.replace(temp_file, DATA_FILE)
         logger.debug("Data saved to local file")
+        return True
     except Exception as e:
         logger.warning(f"Failed to save to local file: {e}")
+        return False
 
 # Synchronous wrapper for compatibility with existing code
 def save_data_sync(data: AppData):
@@ -0,0 +1,117 @@
+import heapq
+import logging
+from typing import Dict, List, Optional, Tuple
+from models import Item
+from .category_registry import registry
+from .item_record import section_id
+
+logger = logging.getLogger(__name__)
+
+
+def due_key(item: Item) -> Optional[str]:
+    """Sort key for the review queue, or None if the item is never due.
+
+    Matches the frontend rules: archived items are never due, scheduled items
+    are due on their ``next_review_date`` (YYYY-MM-DD), and unreviewed items
+    without a date are new and due immediately.
+    """
+    if item.archived:
+        return None
+    if item.next_review_date:
+        return item.next_review_date[:10]
+    if not item.reviewed:
+        return ""
+    return None
+
+
+class DueIndex:
+    """Min-heaps of schedulable items keyed on next review date.
+
+    One global heap plus one heap per section, keyed by category ID so a
+    category rename leaves the index as it is. Updates push a new entry and
+    leave the old one behind (lazy deletion); stale entries are skipped at
+    query time and the heaps are compacted once stale entries outnumber live
+    ones. Fetching the first k due items costs O(k log k) heap walking instead
+    of a full scan.
+    """
+
+    def __init__(self):
+        self._entries: Dict[str, Tuple[str, int]] = {}  # id -> (due key, category ID)
+        self._heap: List[Tuple[str, str]] = []
+        self._section_heaps: Dict[int, List[Tuple[str, str]]] = {}
+        self._stale = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def rebuild(self, items: List[Item]):
+        """Rebuild all heaps from scratch (O(n), bulk load only)"""
+        self._entries = {}
+        for item in items:
+            key = due_key(item)
+            if key is not None and item.id is not None:
+                self._entries[item.id] = (key, section_id(item))
+        self._rebuild_heaps()
+        logger.debug(f"⚡ Due index rebuilt: {len(self._entries)} schedulable items")
+
+    def _rebuild_heaps(self):
+        self._heap = [(key, item_id) for item_id, (key, _) in self._entries.items()]
+        heapq.heapify(self._heap)
+        self._section_heaps = {}
+        for item_id, (key, section) in self._entries.items():
+            self._section_heaps.setdefault(section, []).append((key, item_id))
+        for heap in self._section_heaps.values():
+            heapq.heapify(heap)
+        self._stale = 0
+
+    def update(self, item_id: str, item: Optional[Item]):
+        """Re-index one item after it changed (item=None removes it) - O(log n)"""
+        old = self._entries.get(item_id)
+        key = due_key(item) if item is not None else None
+        new = (key, section_id(item)) if key is not None else None
+        if old == new:
+            return
+
+        if new is None:
+            del self._entries[item_id]
+            self._stale += 2
+        else:
+            self._entries[item_id] = new
+            if old is None or old[0] != new[0]:
+                heapq.heappush(self._heap, (key, item_id))
+            heapq.heappush(self._section_heaps.setdefault(new[1], []), (key, item_id))
+            if old is not None:
+                self._stale += 2 if old[0] != new[0] else 1
+
+        if self._stale > len(self._entries) + 64:
+            self._rebuild_heaps()
+
+    def due(self, today: str, limit: int, section: Optional[str] = None) -> List[str]:
+        """IDs of up to ``limit`` items due on or before ``today``, most overdue first"""
+        category_id = None if section is None else registry.get_id(section)
+        heap = self._heap if section is None else self._section_heaps.get(category_id, [])
+        result: List[str] = []
+        seen = set()
+        if not heap or limit <= 0:
+            return result
+
+        # Best-first walk of the heap array: only the nodes we emit and their
+        # children are ever looked at
+        frontier = [(heap[0], 0)]
+        while frontier and len(result) < limit:
+            (key, item_id), position = heapq.heappop(frontier)
+            if key > today:
+                break
+            current = self._entries.get(item_id)
+            if (
+                current is not None
+                and current[0] == key
+                and (section is None or current[1] == category_id)
+                and item_id not in seen
+            ):
+                seen.add(item_id)
+                result.append(item_id)
+            for child in (2 * position + 1, 2 * position + 2):
+                if child < len(heap):
+                    heapq.heappush(frontier, (heap[child], child))
+        return result
@@ -0,0 +1,75 @@
+import asyncio
+import logging
+from typing import Dict, Set
+
+logger = logging.getLogger(__name__)
+
+
+class TooManySubscribersError(Exception):
+    """Raised when the subscriber cap is reached"""
+    pass
+
+
+class Subscription:
+    """One subscriber's bounded event queue"""
+
+    def __init__(self, queue_size: int):
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+        self.dropped = 0
+
+    def offer(self, event: Dict):
+        """Queue an event without blocking the publisher.
+
+        A slow consumer whose queue is full loses its backlog and gets a single
+        resync event instead, so memory stays bounded and the client knows it
+        has to re-fetch.
+        """
+        try:
+            self.queue.put_nowait(event)
+        except asyncio.QueueFull:
+            self.dropped += self.queue.qsize()
+            while not self.queue.empty():
+                self.queue.get_nowait()
+            self.queue.put_nowait({"type": "resync", "reason": "slow consumer"})
+
+
+class EventBus:
+    """Fan-out of data change events to server-sent event subscribers"""
+
+    def __init__(self, max_subscribers: int = 100, queue_size: int = 100):
+        self.max_subscribers = max_subscribers
+        self.queue_size = queue_size
+        self._subscribers: Set[Subscription] = set()
+        self.published = 0
+
+    def __len__(self) -> int:
+        return len(self._subscribers)
+
+    def is_full(self) -> bool:
+        return len(self._subscribers) >= self.max_subscribers
+
+    def subscribe(self) -> Subscription:
+        if self.is_full():
+            raise TooManySubscribersError(f"Subscriber limit of {self.max_subscribers} reached")
+        subscription = Subscription(self.queue_size)
+        self._subscribers.add(subscription)
+        logger.info(f"📡 Event subscriber connected ({len(self._subscribers)} active)")
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription):
+        self._subscribers.discard(subscription)
+        logger.info(f"📡 Event subscriber disconnected ({len(self._subscribers)} active)")
+
+    def publish(self, event: Dict):
+        """Deliver an event to every subscriber - never blocks"""
+        self.published += 1
+        for subscription in self._subscribers:
+            subscription.offer(event)
+
+    def stats(self) -> dict:
+        return {
+            "subscribers": len(self._subscribers),
+            "max_subscribers": self.max_subscribers,
+            "published": self.published,
+            "dropped": sum(subscription.dropped for subscription in self._subscribers)
+        }
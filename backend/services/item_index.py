@@ -0,0 +1,87 @@
+import logging
+import uuid
+from typing import Dict, List, Optional
+from models import Item
+
+logger = logging.getLogger(__name__)
+
+
+class ItemIndex:
+    """Position index over a list of items keyed by item ID.
+
+    Keeps an ``id -> position`` map in sync with the backing list so lookups,
+    replacements and removals are O(1) regardless of deck size. Removal moves
+    the last item into the freed slot, so list order is not preserved across
+    deletes. Every item has a unique ID: a rebuild gives items without one,
+    or with one already taken, a fresh ID.
+    """
+
+    def __init__(self, items: Optional[List[Item]] = None):
+        self.items: List[Item] = []
+        self._positions: Dict[str, int] = {}
+        self._size = 0  # Length the backing list has after our own edits
+        self.rebuild(items if items is not None else [])
+
+    def rebuild(self, items: List[Item]):
+        """Point the index at a new backing list (O(n), bulk load only)"""
+        self.items = items
+        self._positions = {}
+        for i, item in enumerate(items):
+            if item.id is None or item.id in self._positions:
+                old_id = item.id
+                item.id = str(uuid.uuid4())
+                logger.warning(f"⚠️  Item {i} has a missing or duplicate id {old_id!r} - assigned {item.id}")
+            self._positions[item.id] = i
+        self._size = len(items)
+        logger.debug(f"⚡ Item index rebuilt: {len(self._positions)} items")
+
+    def is_synced_with(self, items: List[Item]) -> bool:
+        """Cheap check that the index still describes the given list"""
+        return self.items is items and len(items) == self._size
+
+    def __len__(self) -> int:
+        return len(self._positions)
+
+    def __contains__(self, item_id: str) -> bool:
+        return item_id in self._positions
+
+    def get(self, item_id: str) -> Optional[Item]:
+        """Return the item with the given ID, or None"""
+        position = self._positions.get(item_id)
+        if position is None:
+            return None
+        return self.items[position]
+
+    def position(self, item_id: str) -> Optional[int]:
+        """Position of the item in the backing list, or None"""
+        return self._positions.get(item_id)
+
+    def append(self, item: Item):
+        """Add a new item at the end of the backing list"""
+        if item.id in self._positions:
+            raise ValueError(f"Duplicate item id: {item.id}")
+        self._positions[item.id] = len(self.items)
+        self.items.append(item)
+        self._size += 1
+
+    def replace(self, item_id: str, item: Item) -> Optional[Item]:
+        """Replace the item with the given ID in place, returning the old item"""
+        position = self._positions.get(item_id)
+        if position is None:
+            return None
+        old_item = self.items[position]
+        self.items[position] = item
+        return old_item
+
+    def remove(self, item_id: str) -> Optional[Item]:
+        """Remove the item with the given ID, returning it (swap-with-last)"""
+        position = self._positions.pop(item_id, None)
+        if position is None:
+            return None
+        removed = self.items[position]
+        last = self.items.pop()
+        self._size -= 1
+        if position < len(self.items):
+            self.items[position] = last
+            self._positions[last.id] = position
+        return removed
@@ -0,0 +1,375 @@
+import operator
+from array import array
+from collections.abc import Mapping
+from datetime import date, datetime, timedelta
+from functools import lru_cache
+from typing import Callable, Dict, Iterator, Optional, Union
+from models import Item
+from .category_registry import CategoryRegistry, registry
+
+# Item fields in model order
+_FIELDS = Item.model_fields
+_FIELD_NAMES = frozenset(_FIELDS)
+
+_EPOCH = datetime(1970, 1, 1)
+
+
+def encode_date(value: Optional[str]) -> Union[int, str, None]:
+    """Pack an ISO date or datetime string into an int when that is lossless.
+
+    "YYYY-MM-DD" becomes ``day_ordinal * 2 + 1`` and a naive datetime
+    becomes ``microseconds_since_1970 * 2``. Anything that would not print
+    back identically (time zones, other precisions, free text, "") is kept
+    as the string it is.
+    """
+    if not value or type(value) is not str:
+        return value
+    length = len(value)
+    # Only the exact shapes isoformat() prints - anything else wouldn't round-trip
+    if value[4:5] != "-" or value[7:8] != "-":
+        return value
+    try:
+        if length == 10:
+            return date.fromisoformat(value).toordinal() * 2 + 1
+        if (
+            (length == 19 or (length == 26 and value[19] == "."))
+            and value[10] == "T" and value[13] == ":" and value[16] == ":"
+        ):
+            moment = datetime.fromisoformat(value)
+            # isoformat() drops a zero fraction and prints the offset of aware values
+            if moment.tzinfo is None and (length == 19) == (moment.microsecond == 0):
+                delta = moment - _EPOCH
+                return ((delta.days * 86400 + delta.seconds) * 1_000_000 + delta.microseconds) * 2
+    except ValueError:
+        pass
+    return value
+
+
+def decode_date(value: Union[int, str, None]) -> Optional[str]:
+    """Inverse of encode_date"""
+    if type(value) is not int:
+        return value
+    if value & 1:
+        return date.fromordinal(value >> 1).isoformat()
+    return (_EPOCH + timedelta(microseconds=value >> 1)).isoformat()
+
+
+# Review dates are days shared by many items - memoize their packing
+_encode_day_cached = lru_cache(maxsize=4096)(encode_date)
+
+
+def _encode_day(value: Optional[str]) -> Union[int, str, None]:
+    try:
+        return _encode_day_cached(value)
+    except TypeError:  # Unhashable junk - left for validation at hydration
+        return value
+
+
+def _encode_date_list(values: list):
+    """array('q') of packed dates - a tuple of the strings if any of them doesn't pack"""
+    if not values:
+        return ()
+    try:
+        return array("q", map(_encode_day_cached, values))
+    except TypeError:
+        return tuple(values)
+
+
+def _decode_date_list(values) -> list:
+    if type(values) is tuple:
+        return list(values)
+    return [decode_date(value) for value in values]
+
+
+def _encode_list(values: list) -> tuple:
+    return tuple(values) if values else ()
+
+
+def _encode_section(value: str) -> Union[int, str]:
+    return registry.id_for(value) if type(value) is str else value
+
+
+def _decode_section(value: Union[int, str]) -> str:
+    return registry.name(value) if type(value) is int else value
+
+
+def _rename_offset(section: Union[int, str]) -> int:
+    return registry.renames(section) if type(section) is int else 0
+
+
+def _unchanged(value):
+    return value
+
+
+# Field -> (encode, decode) for fields not stored as-is. Section and revision
+# have hand-written properties on ItemRecord; the codecs fill the slots.
+_CODECS = {
+    "section": (_encode_section, _decode_section),
+    "revision": (_unchanged, _unchanged),
+    "problem_images": (_encode_list, list),
+    "answer_images": (_encode_list, list),
+    "next_review_date": (_encode_day, decode_date),
+    "review_dates": (_encode_date_list, _decode_date_list),
+    "created_date": (encode_date, decode_date),
+    "last_accessed": (encode_date, decode_date),
+}
+
+
+def _slot_name(name: str) -> str:
+    return f"_{name}" if name in _CODECS else name
+
+
+def _codec_property(slot: str, encode, decode) -> property:
+    def get(self):
+        return decode(getattr(self, slot))
+
+    def set(self, value):
+        setattr(self, slot, encode(value))
+
+    return property(get, set)
+
+
+class ItemRecord(Mapping):
+    """An item kept in compact form until an ``Item`` is needed.
+
+    Reads and writes like an Item (``record.section``) and is a read-only
+    Mapping of the Item fields, so it serializes like the item's dict. Each
+    record is a slotted object: the section is a category ID and the revision
+    is stored net of that category's renames (see ``CategoryRegistry``), so a
+    rename doesn't touch the record; dates are packed
+    ints (see ``encode_date``), the review history is an ``array('q')`` and
+    image lists are tuples. List fields read as fresh lists - assign to
+    change them. Records come from our own persisted data, which was
+    validated when it was written; ``hydrate()`` runs full validation when a
+    route needs a model.
+    """
+    __slots__ = tuple(_slot_name(name) for name in _FIELDS)
+
+    def __getitem__(self, name: str):
+        if name not in _FIELD_NAMES:
+            raise KeyError(name)
+        return getattr(self, name)
+
+    def __iter__(self):
+        return iter(_FIELDS)
+
+    def __len__(self) -> int:
+        return len(_FIELDS)
+
+    def __repr__(self) -> str:
+        return f"ItemRecord({dict(self)!r})"
+
+    @property
+    def section(self) -> str:
+        return _decode_section(self._section)
+
+    @section.setter
+    def section(self, value: str):
+        revision = self.revision
+        self._section = _encode_section(value)
+        self.revision = revision
+
+    @property
+    def revision(self) -> int:
+        offset = _rename_offset(self._section)
+        return self._revision + offset if offset else self._revision
+
+    @revision.setter
+    def revision(self, value: int):
+        offset = _rename_offset(self._section)
+        self._revision = value - offset if offset else value
+
+    @property
+    def section_id(self) -> int:
+        """Category ID of the section, without resolving the name"""
+        return self._section
+
+    def hydrate(self) -> Item:
+        return Item(**self)
+
+    def copy(self, update: Optional[dict] = None) -> "ItemRecord":
+        """New record with the same fields, `update` applied - like ``Item.copy``"""
+        record = ItemRecord()
+        for slot in ItemRecord.__slots__:
+            _set_slot(record, slot, getattr(self, slot))
+        for name, value in (update or {}).items():
+            setattr(record, name, value)
+        return record
+
+
+for _name, (_encode, _decode) in _CODECS.items():
+    if _name not in ItemRecord.__dict__:
+        setattr(ItemRecord, _name, _codec_property(_slot_name(_name), _encode, _decode))
+
+# Model-order (field, slot, encode or None, default factory or None if required)
+_SETTERS = tuple(
+    (
+        name,
+        _slot_name(name),
+        _CODECS[name][0] if name in _CODECS else None,
+        None if field.is_required() else (list if isinstance(field.default, list) else (lambda d=field.default: d))
+    )
+    for name, field in _FIELDS.items()
+)
+_PLAIN_FIELDS = tuple(name for name in _FIELDS if name not in _CODECS)
+_get_plain_fields = operator.itemgetter(*_PLAIN_FIELDS)
+_PLAIN_SETTERS = tuple(ItemRecord.__dict__[name].__set__ for name in _PLAIN_FIELDS)
+_CODEC_SETTERS = tuple((name, ItemRecord.__dict__[f"_{name}"].__set__, encode) for name, (encode, _) in _CODECS.items())
+_set_slot = object.__setattr__
+_get_fields = operator.attrgetter(*_FIELDS)
+_FIELD_ORDER = tuple(_FIELDS)
+
+
+def make_item_record(raw: dict) -> ItemRecord:
+    """Item record from a stored item dict, with defaults filled and unknown keys ignored"""
+    record = ItemRecord()
+    if raw.keys() >= _FIELD_NAMES:
+        # Every field present (what save_data writes) - the load hot path
+        for set_slot, value in zip(_PLAIN_SETTERS, _get_plain_fields(raw)):
+            set_slot(record, value)
+        for name, set_slot, encode in _CODEC_SETTERS:
+            set_slot(record, encode(raw[name]))
+        _rebase_revision(record)
+        return record
+
+    # Older or hand-edited data - fill in defaults
+    for name, slot, encode, default in _SETTERS:
+        if name in raw:
+            value = raw[name]
+        elif default is None:
+            raise ValueError(f"Item {raw.get('id')!r} is missing required field {name!r}")
+        else:
+            value = default()
+        _set_slot(record, slot, value if encode is None else encode(value))
+    _rebase_revision(record)
+    return record
+
+
+class LazyItemRecord(ItemRecord):
+    """ItemRecord made with some fields set and the rest read on first access.
+
+    ``source.item_fields(row)`` returns the item's stored field dict - a row
+    of a memory-mapped snapshot, say. The first read of a field that isn't
+    set yet fills every unset slot from it (defaults for fields it lacks) and
+    drops the source; after that the record behaves like any other.
+    Loading twice from two threads is harmless - both write the same values.
+    """
+    __slots__ = ("_source", "_row")
+
+    def __getattr__(self, name: str):
+        # Only reached for unset slots and unknown names
+        if name not in _LAZY_NAMES:
+            raise AttributeError(name)
+        source = _get_source(self)
+        if source is None:
+            raise AttributeError(name)
+        fields = source.item_fields(_get_row(self))
+        for field, slot, encode, default in _SETTERS:
+            try:
+                _get_slot(self, slot)
+                continue
+            except AttributeError:
+                pass
+            if field in fields:
+                value = fields[field]
+            elif default is None:
+                raise ValueError(f"Item {fields.get('id')!r} is missing required field {field!r}")
+            else:
+                value = default()
+            _set_slot(self, slot, value if encode is None else encode(value))
+        # Cleared last, so a concurrent reader never sees unset slots without a source
+        _set_slot(self, "_source", None)
+        return getattr(self, name)
+
+
+_LAZY_NAMES = frozenset(_FIELDS) | frozenset(ItemRecord.__slots__)
+_get_source = LazyItemRecord.__dict__["_source"].__get__
+_get_row = LazyItemRecord.__dict__["_row"].__get__
+_set_source = LazyItemRecord.__dict__["_source"].__set__
+_set_row = LazyItemRecord.__dict__["_row"].__set__
+_new_lazy_record = object.__new__
+_SLOT_GETTERS = {slot: ItemRecord.__dict__[slot].__get__ for slot in ItemRecord.__slots__}
+
+
+def _get_slot(record: ItemRecord, slot: str):
+    return _SLOT_GETTERS[slot](record)
+
+
+def lazy_item_records(columns: Dict[str, list], source) -> Iterator[LazyItemRecord]:
+    """Records built column by column: item i gets the i-th value of every
+    column now and the rest from ``source.item_fields(i)`` when first read.
+
+    Include section along with revision when the stored data has both - the
+    revision is rebased on the section's renames as it is read.
+    """
+    names = list(columns)
+    encoded = []
+    for name in names:
+        encode = _CODECS[name][0] if name in _CODECS else None
+        encoded.append(columns[name] if encode is None else list(map(encode, columns[name])))
+    if "revision" in columns and "section" in columns:
+        sections = encoded[names.index("section")]
+        revisions = encoded[names.index("revision")]
+        encoded[names.index("revision")] = [
+            revision - _rename_offset(section) for revision, section in zip(revisions, sections)
+        ]
+    setters = [ItemRecord.__dict__[_slot_name(name)].__set__ for name in names]
+    for row, values in enumerate(zip(*encoded)):
+        record = _new_lazy_record(LazyItemRecord)
+        _set_source(record, source)
+        _set_row(record, row)
+        for set_slot, value in zip(setters, values):
+            set_slot(record, value)
+        yield record
+
+
+def _rebase_revision(record: ItemRecord):
+    """Store a freshly read revision net of its category's renames so far"""
+    offset = _rename_offset(record._section)
+    if offset:
+        record._revision -= offset
+
+
+def section_id(item: Union[Item, ItemRecord]) -> int:
+    """Category ID of an item's section"""
+    if isinstance(item, ItemRecord):
+        return item._section
+    return registry.id_for(item.section)
+
+
+def field_getter(name: str, categories: Optional[CategoryRegistry] = None) -> Callable:
+    """Getter for one field of Items and ItemRecords.
+
+    With `categories` (a ``registry.snapshot()``) record sections and
+    revisions resolve through it, like ``item_to_dict``.
+    """
+    get = operator.attrgetter(name)
+    if categories is None or name not in ("section", "revision"):
+        return get
+
+    def get_resolved(item):
+        if isinstance(item, ItemRecord) and type(item._section) is int:
+            if name == "section":
+                return categories.name(item._section)
+            return item._revision + categories.renames(item._section)
+        return get(item)
+
+    return get_resolved
+
+
+def item_to_dict(item: Union[Item, ItemRecord], categories: Optional[CategoryRegistry] = None) -> dict:
+    """Plain dict of an Item or ItemRecord.
+
+    `categories` is a ``registry.snapshot()`` to resolve record sections
+    through instead of the live registry - the item as it was when the
+    snapshot was taken, even if its category has been renamed since.
+    """
+    if isinstance(item, ItemRecord):
+        # One C-level getter call instead of the Mapping protocol - the
+        # serialization hot path for saves and exports
+        fields = dict(zip(_FIELD_ORDER, _get_fields(item)))
+        if categories is not None and type(item._section) is int:
+            fields["section"] = categories.name(item._section)
+            fields["revision"] = item._revision + categories.renames(item._section)
+        return fields
+    return item.dict()
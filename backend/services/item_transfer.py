@@ -0,0 +1,283 @@
+import codecs
+import csv
+import io
+import json
+import zlib
+from typing import Any, AsyncIterator, Dict, Iterable, Iterator, List, Optional, Tuple
+from pydantic import ValidationError
+from models import Item
+from .category_registry import CategoryRegistry
+from .item_record import item_to_dict
+
+# Bulk import/export formats
+FORMAT_NDJSON = "ndjson"
+FORMAT_CSV = "csv"
+FORMAT_JSON = "json"
+
+MEDIA_TYPES = {
+    FORMAT_NDJSON: "application/x-ndjson",
+    FORMAT_CSV: "text/csv; charset=utf-8",
+    FORMAT_JSON: "application/json",
+}
+
+# Export output is sent in chunks of about this many bytes
+EXPORT_CHUNK_BYTES = 64 * 1024
+
+# CSV columns, in model order. List fields are JSON arrays in one cell,
+# booleans "true"/"false", missing optionals empty cells
+CSV_FIELDS = tuple(Item.model_fields)
+LIST_FIELDS = frozenset(name for name in CSV_FIELDS if Item.model_fields[name].annotation == List[str])
+
+# Longest accepted import line - longer lines are reported and skipped so a
+# single bad line can't grow the buffer without bound
+MAX_LINE_CHARS = 1024 * 1024
+
+# (line number, item fields, error) - exactly one of fields/error is set
+ImportRecord = Tuple[int, Optional[Dict[str, Any]], Optional[str]]
+
+
+def validation_message(error: ValidationError) -> str:
+    """One-line summary of a pydantic validation error"""
+    return "; ".join(
+        f"{'.'.join(str(part) for part in detail['loc']) or 'item'}: {detail['msg']}"
+        for detail in error.errors()
+    )
+
+
+class _LineSplitter:
+    """Split a stream of text chunks into numbered lines.
+
+    Only the current partial line is buffered. Lines longer than
+    ``max_chars`` are yielded as None and the rest of them is dropped.
+    """
+
+    def __init__(self, max_chars: int):
+        self._max_chars = max_chars
+        self._buffer: List[str] = []
+        self._buffered = 0
+        self._too_long = False
+        self._line_no = 0
+
+    def feed(self, text: str) -> Iterator[Tuple[int, Optional[str]]]:
+        start = 0
+        while True:
+            end = text.find("\n", start)
+            if end < 0:
+                self._append(text[start:])
+                return
+            self._append(text[start:end])
+            yield self._take()
+            start = end + 1
+
+    def close(self) -> Iterator[Tuple[int, Optional[str]]]:
+        if self._buffered or self._too_long:
+            yield self._take()
+
+    def _append(self, part: str):
+        if self._too_long or not part:
+            return
+        self._buffered += len(part)
+        if self._buffered > self._max_chars:
+            self._buffer, self._too_long = [], True
+        else:
+            self._buffer.append(part)
+
+    def _take(self) -> Tuple[int, Optional[str]]:
+        self._line_no += 1
+        line = None if self._too_long else "".join(self._buffer).rstrip("\r")
+        self._buffer, self._buffered, self._too_long = [], 0, False
+        return self._line_no, line
+
+
+class _NdjsonParser:
+    """One JSON object per line, blank lines ignored"""
+
+    def parse(self, line_no: int, line: str) -> Iterator[ImportRecord]:
+        if not line.strip():
+            return
+        try:
+            fields = json.loads(line)
+        except json.JSONDecodeError as e:
+            yield line_no, None, f"Invalid JSON ({e.msg})"
+            return
+        if not isinstance(fields, dict):
+            yield line_no, None, "Expected a JSON object"
+            return
+        yield line_no, fields, None
+
+    def finish(self) -> Iterator[ImportRecord]:
+        return iter(())
+
+
+class _CsvParser:
+    """Header row with item field names, then one item per record.
+
+    Quoted cells may span lines - a record is complete once its quotes balance.
+    """
+
+    def __init__(self, max_chars: int):
+        self._max_chars = max_chars
+        self._header: Optional[List[str]] = None
+        self._pending: List[str] = []
+        self._pending_chars = 0
+        self._start = 0
+
+    def parse(self, line_no: int, line: str) -> Iterator[ImportRecord]:
+        if not self._pending:
+            if not line.strip():
+                return
+            self._start = line_no
+        self._pending.append(line)
+        self._pending_chars += len(line) + 1
+        text = "\n".join(self._pending)
+        if text.count('"') % 2:
+            if self._pending_chars > self._max_chars:
+                self._pending, self._pending_chars = [], 0
+                yield self._start, None, "Record too long"
+            return
+        self._pending, self._pending_chars = [], 0
+
+        row = next(csv.reader([text]))
+        if self._header is None:
+            unknown = [name for name in row if name not in Item.model_fields]
+            if unknown:
+                raise ValueError(f"Unknown CSV columns: {', '.join(unknown)}")
+            self._header = row
+            return
+        if len(row) != len(self._header):
+            yield self._start, None, f"Expected {len(self._header)} columns, found {len(row)}"
+            return
+        try:
+            yield self._start, parse_csv_row(self._header, row), None
+        except ValueError as e:
+            yield self._start, None, str(e)
+
+    def finish(self) -> Iterator[ImportRecord]:
+        if self._pending:
+            yield self._start, None, "Unterminated quoted field"
+
+
+def parse_csv_row(header: List[str], row: List[str]) -> Dict[str, Any]:
+    """Item fields from one CSV row - empty cells fall back to the model defaults"""
+    fields: Dict[str, Any] = {}
+    for name, value in zip(header, row):
+        if value == "":
+            continue
+        if name in LIST_FIELDS:
+            try:
+                value = json.loads(value)
+            except json.JSONDecodeError:
+                raise ValueError(f"{name}: expected a JSON array")
+            if not isinstance(value, list):
+                raise ValueError(f"{name}: expected a JSON array")
+        fields[name] = value
+    return fields
+
+
+async def iter_import_records(
+    chunks: AsyncIterator[bytes],
+    format: str = FORMAT_NDJSON,
+    max_line_chars: int = MAX_LINE_CHARS
+) -> AsyncIterator[ImportRecord]:
+    """Parse a streamed UTF-8 NDJSON or CSV body into item field dicts.
+
+    Memory is bounded by the longest line/record, not the body size. Bad
+    records are yielded with an error so the caller can report them and carry
+    on; a CSV header naming unknown columns raises ValueError.
+    """
+    decoder = codecs.getincrementaldecoder("utf-8-sig")(errors="replace")
+    splitter = _LineSplitter(max_line_chars)
+    parser = _CsvParser(max_line_chars) if format == FORMAT_CSV else _NdjsonParser()
+
+    def records(lines: Iterator[Tuple[int, Optional[str]]]) -> Iterator[ImportRecord]:
+        for line_no, line in lines:
+            if line is None:
+                yield line_no, None, f"Line longer than {max_line_chars} characters"
+            else:
+                yield from parser.parse(line_no, line)
+
+    async for chunk in chunks:
+        for record in records(splitter.feed(decoder.decode(chunk))):
+            yield record
+    for record in records(splitter.feed(decoder.decode(b"", final=True))):
+        yield record
+    for record in records(splitter.close()):
+        yield record
+    for record in parser.finish():
+        yield record
+
+
+def _csv_list(value: list) -> str:
+    return json.dumps(value, ensure_ascii=False) if value else "[]"
+
+
+def _csv_bool(value: bool) -> str:
+    return "true" if value else "false"
+
+
+# (column, converter) for the cells csv.writer can't write as-is - None
+# already becomes an empty cell
+_CSV_CONVERTERS = tuple(
+    (column, _csv_list if name in LIST_FIELDS else _csv_bool)
+    for column, name in enumerate(CSV_FIELDS)
+    if name in LIST_FIELDS or Item.model_fields[name].annotation is bool
+)
+
+
+def iter_ndjson(items: Iterable, categories: Optional[CategoryRegistry] = None) -> Iterator[str]:
+    """One JSON object per item. `categories` as for ``item_to_dict``"""
+    for item in items:
+        yield json.dumps(item_to_dict(item, categories), ensure_ascii=False) + "\n"
+
+
+def iter_csv(items: Iterable, categories: Optional[CategoryRegistry] = None) -> Iterator[str]:
+    """Header row plus one row per item - the format POST /api/items/import reads"""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(CSV_FIELDS)
+    for item in items:
+        row = list(item_to_dict(item, categories).values())
+        for column, convert in _CSV_CONVERTERS:
+            row[column] = convert(row[column])
+        writer.writerow(row)
+        if buffer.tell() >= EXPORT_CHUNK_BYTES:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+    yield buffer.getvalue()
+
+
+def iter_json(items: Iterable, meta: dict, categories: Optional[CategoryRegistry] = None) -> Iterator[str]:
+    """The data file layout ({"items": [...], "categories", "settings", ...}), item by item"""
+    yield '{"items": ['
+    separator = ""
+    for item in items:
+        yield separator + json.dumps(item_to_dict(item, categories), ensure_ascii=False)
+        separator = ", "
+    yield "]"
+    for key, value in meta.items():
+        yield f", {json.dumps(key)}: {json.dumps(value, ensure_ascii=False)}"
+    yield "}\n"
+
+
+def encode_chunks(parts: Iterable[str], gzip: bool = False, chunk_bytes: int = EXPORT_CHUNK_BYTES) -> Iterator[bytes]:
+    """UTF-8 encode (and optionally gzip) text parts into chunks of about `chunk_bytes`"""
+    compressor = zlib.compressobj(wbits=31) if gzip else None  # wbits=31: gzip container
+    pending: List[bytes] = []
+    size = 0
+    for part in parts:
+        data = part.encode("utf-8")
+        pending.append(data)
+        size += len(data)
+        if size >= chunk_bytes:
+            chunk = b"".join(pending)
+            pending, size = [], 0
+            if compressor is not None:
+                chunk = compressor.compress(chunk)
+            if chunk:
+                yield chunk
+    chunk = b"".join(pending)
+    if compressor is not None:
+        chunk = compressor.compress(chunk) + compressor.flush()
+    if chunk:
+        yield chunk
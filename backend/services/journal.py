@@ -0,0 +1,122 @@
+import json
+import os
+import logging
+from typing import Dict, List
+from models import AppData, Item, Settings
+
+logger = logging.getLogger(__name__)
+
+# Record operations written to the journal
+OP_ITEM_UPSERT = "item_upsert"
+OP_ITEM_DELETE = "item_delete"
+OP_SETTINGS = "settings"
+OP_CATEGORY_ADD = "category_add"
+OP_CATEGORY_DELETE = "category_delete"
+OP_CATEGORY_RENAME = "category_rename"
+
+
+class MutationJournal:
+    """Append-only log of per-mutation records stored next to the data file.
+
+    Each line is one JSON record. The journal is replayed on top of the last
+    full snapshot at startup and truncated whenever a new snapshot is written,
+    so write cost scales with the size of a change instead of the deck.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.records_since_snapshot = 0
+
+    def append(self, records: List[Dict]):
+        """Append records as JSON lines and flush them to disk"""
+        if not records:
+            return
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        lines = "".join(json.dumps(record, separators=(",", ":")) + "\n" for record in records)
+        with open(self.path, "a") as f:
+            f.write(lines)
+            f.flush()
+            os.fsync(f.fileno())
+        self.records_since_snapshot += len(records)
+
+    def read(self) -> List[Dict]:
+        """Read all complete records (a torn trailing line is ignored)"""
+        records = []
+        if not os.path.exists(self.path):
+            return records
+        with open(self.path, "r") as f:
+            for line_number, line in enumerate(f, 1):
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    records.append(json.loads(line))
+                except json.JSONDecodeError:
+                    logger.warning(f"⚠️  Ignoring unreadable journal record at line {line_number}")
+                    break
+        return records
+
+    def replay(self, data: AppData) -> int:
+        """Apply all journal records to data in order, returns the record count"""
+        records = self.read()
+        apply_records(data, records)
+        self.records_since_snapshot = len(records)
+        if records:
+            logger.info(f"📜 Replayed {len(records)} journal records")
+        return len(records)
+
+    def reset(self):
+        """Discard the journal after a full snapshot has been written"""
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
+        self.records_since_snapshot = 0
+
+
+def apply_records(data: AppData, records: List[Dict]):
+    """Apply journal records to an AppData instance in place"""
+    positions = {item.id: i for i, item in enumerate(data.items)}
+
+    for record in records:
+        op = record.get("op")
+        if op == OP_ITEM_UPSERT:
+            item = Item(**record["item"])
+            position = positions.get(item.id)
+            if position is None:
+                positions[item.id] = len(data.items)
+                data.items.append(item)
+            else:
+                data.items[position] = item
+        elif op == OP_ITEM_DELETE:
+            position = positions.pop(record["id"], None)
+            if position is not None:
+                last = data.items.pop()
+                if position < len(data.items):
+                    data.items[position] = last
+                    positions[last.id] = position
+        elif op == OP_SETTINGS:
+            data.settings = Settings(**record["settings"])
+        elif op == OP_CATEGORY_ADD:
+            if record["name"] not in data.categories:
+                data.categories.append(record["name"])
+        elif op == OP_CATEGORY_DELETE:
+            if record["name"] in data.categories:
+                data.categories.remove(record["name"])
+        elif op == OP_CATEGORY_RENAME:
+            old_name, new_name = record["old"], record["new"]
+            if old_name in data.categories:
+                data.categories[data.categories.index(old_name)] = new_name
+            for item in data.items:
+                if item.section == old_name:
+                    item.section = new_name
+                    item.revision += 1
+        else:
+            logger.warning(f"⚠️  Unknown journal op: {op}")
+
+        if "last_updated" in record:
+            data.last_updated = record["last_updated"]
+        if "data_version" in record:
+            data.data_version = record["data_version"]
@@ -0,0 +1,119 @@
+import json
+from typing import Any, Iterator, TextIO, Tuple
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+_WHITESPACE = " \t\n\r"
+_NUMBER_CONTINUATION = ".eE+-"
+_decoder = json.JSONDecoder()
+
+
+class _ChunkedReader:
+    """Text buffer over a file-like object that is refilled one chunk at a time"""
+
+    def __init__(self, fp: TextIO, chunk_size: int):
+        self._fp = fp
+        self._chunk_size = chunk_size
+        self._buffer = ""
+        self._position = 0
+        self._consumed = 0  # Characters dropped from the front of the buffer
+        self._eof = False
+
+    def _fill(self):
+        """Drop what was consumed and append the next chunk"""
+        if self._position:
+            self._consumed += self._position
+            self._buffer = self._buffer[self._position:]
+            self._position = 0
+        # Grow the read for values larger than a chunk so retries stay linear
+        chunk = self._fp.read(max(self._chunk_size, len(self._buffer)))
+        if not chunk:
+            self._eof = True
+        self._buffer += chunk
+
+    def error(self, message: str) -> ValueError:
+        return ValueError(f"{message} at offset {self._consumed + self._position}")
+
+    def peek(self) -> str:
+        """Next non-whitespace character without consuming it ('' at end of input)"""
+        while True:
+            while self._position < len(self._buffer) and self._buffer[self._position] in _WHITESPACE:
+                self._position += 1
+            if self._position < len(self._buffer):
+                return self._buffer[self._position]
+            if self._eof:
+                return ""
+            self._fill()
+
+    def next_char(self) -> str:
+        char = self.peek()
+        self._position += 1
+        return char
+
+    def expect(self, char: str):
+        found = self.next_char()
+        if found != char:
+            raise self.error(f"Expected {char!r}, found {found!r}")
+
+    def value(self) -> Any:
+        """Decode one complete JSON value, reading more input as needed"""
+        self.peek()
+        while True:
+            try:
+                value, end = _decoder.raw_decode(self._buffer, self._position)
+                # A number may be cut short by the chunk boundary ("1.5" of
+                # "1.5e10") - only trust a value once the character after it
+                # is visible and can't continue it
+                if self._eof or (end < len(self._buffer) and self._buffer[end] not in _NUMBER_CONTINUATION):
+                    self._position = end
+                    return value
+            except json.JSONDecodeError as e:
+                if self._eof:
+                    raise self.error(f"Invalid JSON ({e.msg})")
+            self._fill()
+
+
+def iter_members(
+    fp: TextIO,
+    stream_keys: Tuple[str, ...] = ("items",),
+    chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> Iterator[Tuple[str, Any]]:
+    """Incrementally parse a top-level JSON object from a text stream.
+
+    Yields ``(key, value)`` for each member. Array members named in
+    ``stream_keys`` are not built as a whole: they yield ``(key, element)``
+    once per element, so only one element is held in memory at a time.
+    Only ``chunk_size`` characters (or one element, if larger) are buffered.
+    """
+    reader = _ChunkedReader(fp, chunk_size)
+    reader.expect("{")
+    if reader.peek() == "}":
+        reader.next_char()
+        return
+
+    while True:
+        key = reader.value()
+        if not isinstance(key, str):
+            raise reader.error("Expected an object key")
+        reader.expect(":")
+
+        if key in stream_keys and reader.peek() == "[":
+            reader.expect("[")
+            if reader.peek() == "]":
+                reader.next_char()
+            else:
+                while True:
+                    yield key, reader.value()
+                    separator = reader.next_char()
+                    if separator == "]":
+                        break
+                    if separator != ",":
+                        raise reader.error(f"Expected ',' or ']', found {separator!r}")
+        else:
+            yield key, reader.value()
+
+        separator = reader.next_char()
+        if separator == "}":
+            return
+        if separator != ",":
+            raise reader.error(f"Expected ',' or '}}', found {separator!r}")
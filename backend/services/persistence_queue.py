@@ -0,0 +1,122 @@
+import asyncio
+import logging
+from typing import Awaitable, Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class PersistenceQueue:
+    """Single background worker that coalesces save requests.
+
+    Any number of ``request_save()`` calls collapse into at most one
+    in-flight save plus one pending save. The pending save waits for a quiet
+    period of ``debounce_seconds`` but never longer than ``max_delay_seconds``
+    after the first request, and always persists the latest state because the
+    snapshot is taken by ``save_fn`` when the save actually starts.
+    """
+
+    def __init__(
+        self,
+        save_fn: Callable[[], Awaitable[bool]],
+        debounce_seconds: float = 0.5,
+        max_delay_seconds: float = 5.0
+    ):
+        self._save_fn = save_fn
+        self.debounce_seconds = debounce_seconds
+        self.max_delay_seconds = max_delay_seconds
+
+        self._task: Optional[asyncio.Task] = None
+        self._wake: Optional[asyncio.Event] = None
+        self._idle: Optional[asyncio.Event] = None
+        self._pending = False
+        self._first_pending_at = 0.0
+
+        # Counters
+        self.requested = 0
+        self.coalesced = 0
+        self.executed = 0
+        self.failed = 0
+
+    def _ensure_worker(self):
+        """Start the worker on the running loop (restarts if the loop changed)"""
+        loop = asyncio.get_running_loop()
+        if self._task is not None and not self._task.done() and self._task.get_loop() is loop:
+            return
+        self._wake = asyncio.Event()
+        self._idle = asyncio.Event()
+        self._idle.set()
+        self._task = loop.create_task(self._run())
+
+    def request_save(self):
+        """Schedule a save of the latest state - never blocks"""
+        self._ensure_worker()
+        self.requested += 1
+        if self._pending:
+            self.coalesced += 1
+        else:
+            self._pending = True
+            self._first_pending_at = asyncio.get_running_loop().time()
+        self._idle.clear()
+        self._wake.set()
+
+    async def flush(self):
+        """Wait until every requested save has been executed"""
+        if self._task is None or self._task.done():
+            return
+        if self._task.get_loop() is not asyncio.get_running_loop():
+            return
+        # Skip the debounce window - we want the data out now
+        self._first_pending_at = float("-inf")
+        self._wake.set()
+        await self._idle.wait()
+
+    async def _wait_for_quiet_period(self):
+        """Debounce: wait until requests stop arriving or max delay is reached"""
+        loop = asyncio.get_running_loop()
+        while True:
+            self._wake.clear()
+            remaining = self.max_delay_seconds - (loop.time() - self._first_pending_at)
+            if remaining <= 0:
+                return
+            try:
+                await asyncio.wait_for(self._wake.wait(), timeout=min(self.debounce_seconds, remaining))
+            except asyncio.TimeoutError:
+                return
+
+    async def _run(self):
+        while True:
+            await self._wake.wait()
+            if not self._pending:
+                self._wake.clear()
+                self._idle.set()
+                continue
+
+            await self._wait_for_quiet_period()
+
+            # Anything requested from now on becomes the next pending save
+            self._pending = False
+            self.executed += 1
+            try:
+                success = await self._save_fn()
+                if not success:
+                    self.failed += 1
+            except Exception as e:
+                self.failed += 1
+                logger.error(f"💥 Persistence worker save failed: {e}")
+
+            if self._pending:
+                self._wake.set()
+            else:
+                self._idle.set()
+
+    def stats(self) -> dict:
+        """Counters for coalesced vs. executed writes"""
+        return {
+            "requested": self.requested,
+            "coalesced": self.coalesced,
+            "executed": self.executed,
+            "failed": self.failed,
+            "pending": self._pending,
+            "debounce_seconds": self.debounce_seconds,
+            "max_delay_seconds": self.max_delay_seconds
+        }
@@ -0,0 +1,92 @@
+import json
+import logging
+from collections import OrderedDict
+from typing import Any, Callable, Optional, Tuple
+from fastapi.encoders import jsonable_encoder
+
+logger = logging.getLogger(__name__)
+
+
+def encode_json(content: Any) -> bytes:
+    """Encode content exactly like FastAPI's default JSONResponse"""
+    return json.dumps(
+        jsonable_encoder(content),
+        ensure_ascii=False,
+        allow_nan=False,
+        indent=None,
+        separators=(",", ":"),
+    ).encode("utf-8")
+
+
+def etag_for_version(version: int, variant: Optional[str] = None) -> str:
+    """Strong ETag for a dataset version, or for one representation (`variant`) of it"""
+    return f'"{version}-{variant}"' if variant else f'"{version}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Check an If-None-Match header against an ETag (weak comparison per RFC 9110)"""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    candidates = (tag.strip() for tag in if_none_match.split(","))
+    return any(tag.removeprefix("W/") == etag for tag in candidates)
+
+
+def etag_matches_strong(if_match: Optional[str], etag: str) -> bool:
+    """Check an If-Match header against an ETag (strong comparison per RFC 9110).
+
+    Weak tags (W/"...") never match; "*" matches any current representation.
+    """
+    if not if_match:
+        return False
+    if if_match.strip() == "*":
+        return True
+    return any(tag.strip() == etag for tag in if_match.split(","))
+
+
+class ResponseCache:
+    """Already-encoded response bodies for one dataset version.
+
+    Entries are keyed by endpoint/variant. Any version change drops every
+    entry, so a repeated read between two writes costs a dict lookup instead
+    of re-encoding the object graph.
+    """
+
+    def __init__(self, max_entries: int = 64):
+        self.max_entries = max_entries
+        self._version = None
+        self._entries: "OrderedDict[Tuple, bytes]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get_or_build(self, key: Tuple, version: int, build: Callable[[], Any]) -> bytes:
+        """Return cached bytes for key at version, encoding build() on a miss"""
+        if version != self._version:
+            self._entries.clear()
+            self._version = version
+
+        body = self._entries.get(key)
+        if body is not None:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return body
+
+        self.misses += 1
+        body = encode_json(build())
+        self._entries[key] = body
+        if len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        return body
+
+    def clear(self):
+        self._entries.clear()
+        self._version = None
+
+    def stats(self) -> dict:
+        return {
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "version": self._version
+        }
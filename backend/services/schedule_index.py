@@ -0,0 +1,150 @@
+import logging
+from datetime import date
+from typing import Dict, List, Optional
+import numpy as np
+from models import Item
+from .due_index import due_key
+
+logger = logging.getLogger(__name__)
+
+# Due ordinals for items that are not scheduled on a date
+DUE_NEW = 0                            # Never reviewed - due immediately
+DUE_NEVER = np.iinfo(np.int32).max     # Archived, or reviewed without a next date
+
+_INITIAL_CAPACITY = 1024
+
+# stats() buckets, in due order
+_BUCKETS = ("new", "overdue", "due_today", "upcoming")
+
+
+def due_ordinal(item: Item) -> int:
+    """Day ordinal the item is due on (DUE_NEW / DUE_NEVER for unscheduled items)"""
+    key = due_key(item)
+    if key is None:
+        return DUE_NEVER
+    if not key:
+        return DUE_NEW
+    try:
+        return date.fromisoformat(key).toordinal()
+    except ValueError:
+        return DUE_NEVER  # Not a date - the queue can't place it either
+
+
+class ScheduleIndex:
+    """NumPy columns of due day ordinals and section codes, row-aligned with ItemIndex.
+
+    Row i describes ``ItemIndex.items[i]``: callers mirror every append,
+    in-place replace and swap-with-last removal. Aggregate questions (how
+    many due, overdue, due in the next N days, per category) become
+    vectorized mask operations over contiguous arrays - a few milliseconds
+    for a million items - instead of a walk over every item.
+    """
+
+    def __init__(self):
+        self._sections: List[str] = []
+        self._section_codes: Dict[str, int] = {}
+        self._reset(0)
+
+    def _reset(self, capacity: int):
+        capacity = max(capacity, _INITIAL_CAPACITY)
+        self._due = np.full(capacity, DUE_NEVER, dtype=np.int32)
+        self._section = np.zeros(capacity, dtype=np.int32)
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def _code(self, section: str) -> int:
+        code = self._section_codes.get(section)
+        if code is None:
+            code = self._section_codes[section] = len(self._sections)
+            self._sections.append(section)
+        return code
+
+    def rebuild(self, items: List[Item]):
+        """Rebuild the columns from the item index's backing list (O(n), bulk load only)"""
+        self._sections = []
+        self._section_codes = {}
+        self._reset(len(items) * 2)
+        count = len(items)
+        self._due[:count] = np.fromiter((due_ordinal(item) for item in items), dtype=np.int32, count=count)
+        self._section[:count] = np.fromiter((self._code(item.section) for item in items), dtype=np.int32, count=count)
+        self._size = count
+        logger.debug(f"⚡ Schedule index rebuilt: {count} rows, {len(self._sections)} sections")
+
+    def append(self, item: Item):
+        """Add a row for an item appended to the item index"""
+        if self._size == len(self._due):
+            self._due = np.concatenate([self._due, np.full(self._size, DUE_NEVER, dtype=np.int32)])
+            self._section = np.concatenate([self._section, np.zeros(self._size, dtype=np.int32)])
+        self.set(self._size, item)
+        self._size += 1
+
+    def set(self, position: int, item: Item):
+        """Overwrite the row of an item replaced in place"""
+        self._due[position] = due_ordinal(item)
+        self._section[position] = self._code(item.section)
+
+    def remove(self, position: int):
+        """Drop a row the way ItemIndex.remove does - the last row moves into its place"""
+        last = self._size - 1
+        self._due[position] = self._due[last]
+        self._section[position] = self._section[last]
+        self._size = last
+
+    def rename_section(self, old_name: str, new_name: str):
+        """Move every row of a section to a new name - O(1) unless merging into an existing one"""
+        old_code = self._section_codes.pop(old_name, None)
+        if old_code is None:
+            return
+        new_code = self._section_codes.get(new_name)
+        if new_code is None:
+            self._sections[old_code] = new_name
+            self._section_codes[new_name] = old_code
+        else:
+            rows = self._section[:self._size]
+            rows[rows == old_code] = new_code
+
+    def count_due(self, today: int, section: Optional[str] = None) -> int:
+        """Number of items due on or before the given day ordinal"""
+        mask = self._due[:self._size] <= today
+        if section is not None:
+            code = self._section_codes.get(section)
+            if code is None:
+                return 0
+            mask &= self._section[:self._size] == code
+        return int(np.count_nonzero(mask))
+
+    def stats(self, today: int, days: int = 7) -> dict:
+        """Review workload as of a day ordinal, overall and per section.
+
+        ``new`` items were never reviewed, ``overdue`` ones were due before
+        today, ``due_today`` ones are due today, and ``upcoming`` ones fall in
+        the next ``days`` days. ``due`` is new + overdue + due_today.
+        """
+        due = self._due[:self._size]
+        sections = self._section[:self._size]
+        # Bucket per row by summing threshold tests: 0 new, 1 overdue,
+        # 2 due today, 3 upcoming, 4 later or never - then count every
+        # (bucket, section) pair with a single bincount
+        bucket = (
+            (due > DUE_NEW).view(np.int8)
+            + (due >= today).view(np.int8)
+            + (due > today).view(np.int8)
+            + (due > today + days).view(np.int8)
+        )
+        section_count = max(len(self._sections), 1)  # Rows always have a section - none means no rows
+        counts = np.bincount(
+            bucket.astype(np.intp) * section_count + sections,
+            minlength=len(_BUCKETS) * section_count + section_count
+        ).reshape(-1, section_count)[:len(_BUCKETS)]
+
+        totals = {name: int(total) for name, total in zip(_BUCKETS, counts.sum(axis=1))}
+        totals["due"] = totals["new"] + totals["overdue"] + totals["due_today"]
+        categories = {}
+        for section, code in self._section_codes.items():
+            section_counts = {name: int(count) for name, count in zip(_BUCKETS, counts[:, code])}
+            if any(section_counts.values()):
+                section_counts["due"] = section_counts["new"] + section_counts["overdue"] + section_counts["due_today"]
+                categories[section] = section_counts
+        return {**totals, "categories": categories}
@@ -0,0 +1,240 @@
+import bisect
+import heapq
+import logging
+import math
+import re
+import unicodedata
+from collections import Counter
+from typing import Callable, Dict, List, Optional, Set, Tuple
+from models import Item
+
+logger = logging.getLogger(__name__)
+
+# Hiragana, Katakana, CJK ideographs (incl. extension A and compatibility)
+_CJK_RANGES = "\u3040-\u30ff\u3400-\u4dbf\u4e00-\u9fff\uf900-\ufaff"
+_TOKEN_RE = re.compile(f"([{_CJK_RANGES}]+)|([^\\W_{_CJK_RANGES}]+)")
+
+# Indexed fields and their term-frequency weight
+FIELD_WEIGHTS = {
+    "name": 2,
+    "problem_text": 1,
+    "answer_text": 1,
+    "side_note": 1,
+}
+
+# BM25 parameters
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+# Upper bound on how many index terms a single prefix may expand to
+MAX_PREFIX_EXPANSIONS = 50
+
+
+def tokenize(text: str) -> List[str]:
+    """Split text into search terms.
+
+    Text is NFKC-normalized (full-width Latin and half-width Katakana become
+    their standard forms) and lowercased. Latin/digit runs become word tokens,
+    CJK runs become overlapping character bigrams so Japanese matches without
+    a dictionary-based segmenter. A single CJK character is kept as-is.
+    """
+    if not text:
+        return []
+    text = unicodedata.normalize("NFKC", text).lower()
+    tokens = []
+    for cjk_run, word in _TOKEN_RE.findall(text):
+        if word:
+            tokens.append(word)
+        elif len(cjk_run) == 1:
+            tokens.append(cjk_run)
+        else:
+            tokens.extend(cjk_run[i:i + 2] for i in range(len(cjk_run) - 1))
+    return tokens
+
+
+def _item_fields(item: Item) -> Tuple[str, ...]:
+    return tuple(getattr(item, field) or "" for field in FIELD_WEIGHTS)
+
+
+class SearchIndex:
+    """In-memory inverted index over item text with BM25 ranking.
+
+    Maintained incrementally: ``update()`` re-indexes a single item and is a
+    no-op when none of its text fields changed (e.g. a review). Postings are
+    grouped by (term frequency, document length) - every document in a group
+    gets the same BM25 contribution from the term - so a search can visit
+    groups best first and stop as soon as nothing unvisited can make the top k.
+    """
+
+    def __init__(self):
+        self._reset()
+
+    def _reset(self):
+        # term -> (tf, doc length) -> item IDs
+        self._postings: Dict[str, Dict[Tuple[int, int], Set[str]]] = {}
+        self._doc_freqs: Dict[str, int] = {}
+        self._doc_terms: Dict[str, Dict[str, int]] = {}
+        self._doc_lengths: Dict[str, int] = {}
+        self._doc_signatures: Dict[str, int] = {}
+        self._sorted_terms: List[str] = []
+        self._total_length = 0
+
+    def __len__(self) -> int:
+        return len(self._doc_lengths)
+
+    def rebuild(self, items: List[Item]):
+        """Rebuild the whole index (O(total text), bulk load only)"""
+        self._reset()
+        for item in items:
+            if item.id is not None:
+                self._add(item.id, item, keep_sorted=False)
+        self._sorted_terms = sorted(self._postings)
+        logger.debug(f"⚡ Search index rebuilt: {len(self)} items, {len(self._postings)} terms")
+
+    def update(self, item_id: str, item: Optional[Item]):
+        """Re-index one item (item=None removes it)"""
+        fields = _item_fields(item) if item is not None else None
+        if fields is not None and self._doc_signatures.get(item_id) == hash(fields):
+            return
+        self._remove(item_id)
+        if item is not None:
+            self._add(item_id, item)
+
+    def _add(self, item_id: str, item: Item, keep_sorted: bool = True):
+        fields = _item_fields(item)
+        counts = Counter()
+        for weight, text in zip(FIELD_WEIGHTS.values(), fields):
+            for token in tokenize(text):
+                counts[token] += weight
+
+        length = sum(counts.values())
+        for term, tf in counts.items():
+            groups = self._postings.get(term)
+            if groups is None:
+                groups = self._postings[term] = {}
+                self._doc_freqs[term] = 0
+                if keep_sorted:
+                    bisect.insort(self._sorted_terms, term)
+            group = groups.get((tf, length))
+            if group is None:
+                group = groups[(tf, length)] = set()
+            group.add(item_id)
+            self._doc_freqs[term] += 1
+
+        self._doc_terms[item_id] = dict(counts)
+        self._doc_lengths[item_id] = length
+        self._doc_signatures[item_id] = hash(fields)
+        self._total_length += length
+
+    def _remove(self, item_id: str):
+        terms = self._doc_terms.pop(item_id, None)
+        if terms is None:
+            return
+        length = self._doc_lengths.pop(item_id)
+        for term, tf in terms.items():
+            groups = self._postings[term]
+            group = groups[(tf, length)]
+            group.discard(item_id)
+            if not group:
+                del groups[(tf, length)]
+            self._doc_freqs[term] -= 1
+            if not groups:
+                del self._postings[term]
+                del self._doc_freqs[term]
+                position = bisect.bisect_left(self._sorted_terms, term)
+                if position < len(self._sorted_terms) and self._sorted_terms[position] == term:
+                    del self._sorted_terms[position]
+        self._total_length -= length
+        del self._doc_signatures[item_id]
+
+    def _expand_prefix(self, prefix: str) -> List[str]:
+        """Index terms that start with prefix (the term itself included)"""
+        start = bisect.bisect_left(self._sorted_terms, prefix)
+        terms = []
+        for term in self._sorted_terms[start:start + MAX_PREFIX_EXPANSIONS]:
+            if not term.startswith(prefix):
+                break
+            terms.append(term)
+        return terms
+
+    def _query_terms(self, query: str) -> List[str]:
+        """Query terms with prefix expansion for the last (possibly partial) word"""
+        tokens = tokenize(query)
+        if not tokens:
+            return []
+        terms = set(tokens[:-1])
+        last = tokens[-1]
+        # Latin words and single CJK characters may be incomplete while typing
+        if len(last) == 1 or not _TOKEN_RE.fullmatch(last).group(1):
+            terms.update(self._expand_prefix(last))
+        terms.add(last)
+        return [term for term in terms if term in self._postings]
+
+    def search(
+        self,
+        query: str,
+        limit: int = 20,
+        include: Optional[Callable[[str], bool]] = None
+    ) -> List[Tuple[str, float]]:
+        """Top `limit` (item_id, score) pairs for the query, best first.
+
+        Exact BM25 top-k with early termination: posting groups are visited
+        in order of their contribution, each new document is scored in full,
+        and the scan stops once the k-th best score reaches the most any
+        unvisited document could still get.
+        """
+        doc_count = len(self._doc_lengths)
+        terms = self._query_terms(query)
+        if doc_count == 0 or not terms or limit <= 0:
+            return []
+        average_length = self._total_length / doc_count or 1.0
+        norm_scale = BM25_K1 * BM25_B / average_length
+        norm_base = BM25_K1 * (1 - BM25_B)
+
+        idfs = {}
+        queues = []  # per term: [(contribution, item IDs)] best first
+        for term in terms:
+            doc_freq = self._doc_freqs[term]
+            idf = idfs[term] = math.log(1 + (doc_count - doc_freq + 0.5) / (doc_freq + 0.5))
+            queue = [
+                (idf * tf * (BM25_K1 + 1) / (tf + norm_base + norm_scale * length), group)
+                for (tf, length), group in self._postings[term].items()
+            ]
+            queue.sort(key=lambda entry: entry[0], reverse=True)
+            queues.append(queue)
+
+        def full_score(item_id: str) -> float:
+            norm = norm_base + norm_scale * self._doc_lengths[item_id]
+            doc_terms = self._doc_terms[item_id]
+            score = 0.0
+            for term, idf in idfs.items():
+                tf = doc_terms.get(term)
+                if tf:
+                    score += idf * tf * (BM25_K1 + 1) / (tf + norm)
+            return score
+
+        positions = [0] * len(queues)
+        top: List[Tuple[float, str]] = []
+        seen: Set[str] = set()
+        while True:
+            # Most an unvisited document can score: the next group of every term
+            heads = [queue[position][0] if position < len(queue) else 0.0 for queue, position in zip(queues, positions)]
+            bound = sum(heads)
+            if bound <= 0.0 or (len(top) == limit and top[0][0] >= bound):
+                break
+            best = heads.index(max(heads))
+            for item_id in queues[best][positions[best]][1]:
+                if item_id in seen:
+                    continue
+                seen.add(item_id)
+                if include is not None and not include(item_id):
+                    continue
+                entry = (full_score(item_id), item_id)
+                if len(top) < limit:
+                    heapq.heappush(top, entry)
+                elif entry > top[0]:
+                    heapq.heapreplace(top, entry)
+                if len(top) == limit and top[0][0] >= bound:
+                    break
+            positions[best] += 1
+        return [(item_id, score) for score, item_id in sorted(top, reverse=True)]
@@ -0,0 +1,128 @@
+import logging
+from typing import Dict, Iterable, Optional
+from models import Item
+from .schedule_index import DUE_NEVER, DUE_NEW, due_ordinal
+
+logger = logging.getLogger(__name__)
+
+# Counts reported per section
+COUNTS = ("total", "active", "archived", "new", "overdue", "due_today")
+
+
+class _SectionCounters:
+    """Counters for one section. ``due_days`` maps day ordinal -> scheduled active items"""
+    __slots__ = ("total", "archived", "new", "due_days", "day", "overdue", "due_today")
+
+    def __init__(self):
+        self.total = 0
+        self.archived = 0
+        self.new = 0
+        self.due_days: Dict[int, int] = {}
+        self.day: Optional[int] = None  # Day the overdue/due_today counters are for
+        self.overdue = 0
+        self.due_today = 0
+
+    def add(self, item: Item, delta: int):
+        self.total += delta
+        if item.archived:
+            self.archived += delta
+        due = due_ordinal(item)
+        if due == DUE_NEW:
+            self.new += delta
+        elif due != DUE_NEVER:
+            count = self.due_days.get(due, 0) + delta
+            if count:
+                self.due_days[due] = count
+            else:
+                del self.due_days[due]
+            if self.day is not None:
+                if due < self.day:
+                    self.overdue += delta
+                elif due == self.day:
+                    self.due_today += delta
+
+    def merge(self, other: "_SectionCounters"):
+        self.total += other.total
+        self.archived += other.archived
+        self.new += other.new
+        for due, count in other.due_days.items():
+            self.due_days[due] = self.due_days.get(due, 0) + count
+        self.day = None
+
+    def counts(self, today: int) -> dict:
+        if self.day != today:
+            # New day - derive once from the histogram, then kept current by add()
+            self.overdue = sum(count for due, count in self.due_days.items() if due < today)
+            self.due_today = self.due_days.get(today, 0)
+            self.day = today
+        return {
+            "total": self.total,
+            "active": self.total - self.archived,
+            "archived": self.archived,
+            "new": self.new,
+            "overdue": self.overdue,
+            "due_today": self.due_today,
+        }
+
+
+class SectionStats:
+    """Per-section item counters kept current by O(1) updates.
+
+    Total, active and archived counts are plain counters. Due counts depend
+    on the day, so each section also keeps a histogram of its scheduled items
+    by due day: the overdue and due-today counters are derived from it the
+    first time a day is asked for and then adjusted by every update, so
+    reading them is O(1) for the rest of that day.
+    """
+
+    def __init__(self):
+        self._sections: Dict[str, _SectionCounters] = {}
+
+    def rebuild(self, items: Iterable[Item]):
+        """Recount every section from scratch (O(n), bulk load only)"""
+        self._sections = {}
+        for item in items:
+            self._counters(item.section).add(item, 1)
+        logger.debug(f"⚡ Section stats rebuilt: {len(self._sections)} sections")
+
+    def _counters(self, section: str) -> _SectionCounters:
+        counters = self._sections.get(section)
+        if counters is None:
+            counters = self._sections[section] = _SectionCounters()
+        return counters
+
+    def update(self, old_item: Optional[Item], new_item: Optional[Item]):
+        """Apply one insert/update/delete - O(1)"""
+        if old_item is not None:
+            counters = self._counters(old_item.section)
+            counters.add(old_item, -1)
+            if not counters.total:
+                del self._sections[old_item.section]
+        if new_item is not None:
+            self._counters(new_item.section).add(new_item, 1)
+
+    def rename(self, old_name: str, new_name: str):
+        """Move a section's counters to a new name - O(1) unless merging into an existing one"""
+        counters = self._sections.pop(old_name, None)
+        if counters is None:
+            return
+        existing = self._sections.get(new_name)
+        if existing is None:
+            self._sections[new_name] = counters
+        else:
+            existing.merge(counters)
+
+    def count(self, section: str) -> int:
+        """Number of items in a section, archived included - O(1)"""
+        counters = self._sections.get(section)
+        return counters.total if counters is not None else 0
+
+    def counts(self, section: str, today: int) -> dict:
+        """Counters of one section as of a day ordinal (all zero for an unused section)"""
+        counters = self._sections.get(section)
+        if counters is None:
+            return _SectionCounters().counts(today)
+        return counters.counts(today)
+
+    def sections(self) -> Iterable[str]:
+        return self._sections.keys()
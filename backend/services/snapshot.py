@@ -0,0 +1,330 @@
+import json
+import mmap
+import os
+import struct
+import sys
+import logging
+from array import array
+from typing import Dict, Iterator, List, Optional, Tuple
+from models import AppData, Item, Settings
+from .category_registry import CategoryRegistry
+from .item_record import ItemRecord, field_getter, lazy_item_records
+
+logger = logging.getLogger(__name__)
+
+# Binary snapshot layout (all integers little-endian):
+#
+#   magic "MNEMSNAP" | u32 format version | u32 header length | header JSON
+#   sections, each: u64 payload length | payload | zero padding to 8 bytes
+#
+# The header holds the small top-level fields (categories, settings,
+# last_updated), the item count and the column list. Sections follow in a
+# fixed order: string table offsets (u32 x strings+1), string table bytes,
+# then one section per column - or two for list columns (u32 offsets x
+# items+1, then u32 string IDs). Every string is stored once in the string
+# table; columns only hold IDs, so repeated sections and dates cost 4 bytes.
+SNAPSHOT_MAGIC = b"MNEMSNAP"
+SNAPSHOT_VERSION = 1
+
+# Column kinds
+KIND_STR = "str"            # u32 string ID per item (NONE_ID for None)
+KIND_BOOL = "bool"          # u8 per item
+KIND_INT = "int"            # i64 per item
+KIND_STR_LIST = "str_list"  # u32 offsets + u32 string IDs
+
+NONE_ID = 0xFFFFFFFF
+
+_PREAMBLE = struct.Struct("<8sII")
+_SECTION_LENGTH = struct.Struct("<Q")
+_LITTLE_ENDIAN = sys.byteorder == "little"
+
+
+class SnapshotError(Exception):
+    """Raised for unreadable or incompatible snapshot files"""
+    pass
+
+
+def _column_kind(annotation) -> str:
+    if annotation in (str, Optional[str]):
+        return KIND_STR
+    if annotation == List[str]:
+        return KIND_STR_LIST
+    if annotation is bool:
+        return KIND_BOOL
+    if annotation is int:
+        return KIND_INT
+    raise TypeError(f"No snapshot column kind for {annotation}")
+
+
+# One column per Item field, in model order
+COLUMNS: Tuple[Tuple[str, str], ...] = tuple(
+    (name, _column_kind(field.annotation)) for name, field in Item.model_fields.items()
+)
+
+# Fields the in-memory indexes (item, due, schedule, section stats, search)
+# read for every item while loading - decoded up front. The rest stays in the
+# map until an item is actually used.
+EAGER_FIELDS = (
+    "id", "name", "section", "side_note", "problem_text", "answer_text",
+    "reviewed", "next_review_date", "archived", "revision"
+)
+
+
+def _to_bytes(values: array) -> bytes:
+    if not _LITTLE_ENDIAN:
+        values = array(values.typecode, values)
+        values.byteswap()
+    return values.tobytes()
+
+
+def _view(buffer, typecode: str):
+    """Zero-copy typed view of a little-endian section (copies on big-endian hosts)"""
+    if _LITTLE_ENDIAN:
+        return memoryview(buffer).cast(typecode)
+    values = array(typecode, bytes(buffer))
+    values.byteswap()
+    return values
+
+
+def encode_snapshot(data: AppData, categories: Optional[CategoryRegistry] = None) -> bytes:
+    """Encode AppData into the binary snapshot format.
+
+    `categories` is a ``registry.snapshot()`` to resolve record sections
+    through (see ``item_to_dict``) - needed when encoding off the event loop.
+    """
+    string_ids: Dict[str, int] = {}
+    strings: List[bytes] = []
+
+    def intern(value: Optional[str]) -> int:
+        if value is None:
+            return NONE_ID
+        string_id = string_ids.get(value)
+        if string_id is None:
+            string_id = string_ids[value] = len(strings)
+            strings.append(value.encode("utf-8"))
+        return string_id
+
+    items = data.items
+    column_sections: List[bytes] = []
+    for name, kind in COLUMNS:
+        values = list(map(field_getter(name, categories), items))
+        if kind == KIND_STR:
+            column_sections.append(_to_bytes(array("I", map(intern, values))))
+        elif kind == KIND_BOOL:
+            column_sections.append(bytes(bool(value) for value in values))
+        elif kind == KIND_INT:
+            column_sections.append(_to_bytes(array("q", values)))
+        else:
+            offsets = array("I", [0])
+            ids = array("I")
+            for value in values:
+                ids.extend(map(intern, value))
+                offsets.append(len(ids))
+            column_sections.append(_to_bytes(offsets))
+            column_sections.append(_to_bytes(ids))
+
+    string_offsets = array("I", [0])
+    position = 0
+    for encoded in strings:
+        position += len(encoded)
+        string_offsets.append(position)
+
+    header = json.dumps({
+        "item_count": len(items),
+        "categories": data.categories,
+        "settings": data.settings.dict(),
+        "last_updated": data.last_updated,
+        "data_version": data.data_version,
+        "columns": COLUMNS
+    }, ensure_ascii=False).encode("utf-8")
+
+    parts = [_PREAMBLE.pack(SNAPSHOT_MAGIC, SNAPSHOT_VERSION, len(header)), header]
+    parts.append(b"\0" * (-(_PREAMBLE.size + len(header)) % 8))
+    for section in [_to_bytes(string_offsets), b"".join(strings), *column_sections]:
+        parts.append(_SECTION_LENGTH.pack(len(section)))
+        parts.append(section)
+        parts.append(b"\0" * (-len(section) % 8))
+    return b"".join(parts)
+
+
+def write_snapshot(data: AppData, path: str):
+    """Write a binary snapshot atomically (temp file + rename)"""
+    payload = encode_snapshot(data)
+    temp_path = path + ".tmp"
+    with open(temp_path, "wb") as f:
+        f.write(payload)
+    os.replace(temp_path, path)
+
+
+class SnapshotReader:
+    """Memory-mapped binary snapshot with lazy per-item decoding.
+
+    Opening only parses the header and section offsets; ``reader[i]`` decodes
+    a single item from the mapped columns, iterating decodes everything
+    column by column, and ``records()`` decodes only the EAGER_FIELDS columns,
+    leaving the rest of each item to be read from the map on first access.
+    Items are rebuilt without re-validation - they were validated when the
+    snapshot was written.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        # The map keeps its own handle on the file
+        with open(path, "rb") as f:
+            try:
+                self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                raise SnapshotError(f"Empty snapshot file: {path}")
+        try:
+            self._parse()
+            return
+        except SnapshotError as e:
+            message = str(e)
+        except Exception as e:
+            message = f"Corrupt snapshot: {e!r}"
+        # Close outside the except block - the traceback keeps views of the map alive
+        self.close()
+        raise SnapshotError(message)
+
+    def _parse(self):
+        buffer = memoryview(self._mmap)
+        if len(buffer) < _PREAMBLE.size:
+            raise SnapshotError("Truncated snapshot header")
+        magic, version, header_length = _PREAMBLE.unpack_from(buffer, 0)
+        if magic != SNAPSHOT_MAGIC:
+            raise SnapshotError("Not a mnemos snapshot file")
+        if version != SNAPSHOT_VERSION:
+            raise SnapshotError(f"Unsupported snapshot version {version} (expected {SNAPSHOT_VERSION})")
+
+        position = _PREAMBLE.size
+        self.header = json.loads(bytes(buffer[position:position + header_length]).decode("utf-8"))
+        position += header_length
+        position += -position % 8
+
+        sections = []
+        while position < len(buffer):
+            (length,) = _SECTION_LENGTH.unpack_from(buffer, position)
+            position += _SECTION_LENGTH.size
+            if position + length > len(buffer):
+                raise SnapshotError("Truncated snapshot section")
+            sections.append(buffer[position:position + length])
+            position += length + (-length % 8)
+
+        sections.reverse()
+        self._string_offsets = _view(sections.pop(), "I")
+        self._strings = sections.pop()
+        self._columns = {}
+        for name, kind in self.header["columns"]:
+            if kind == KIND_STR:
+                self._columns[name] = (kind, _view(sections.pop(), "I"))
+            elif kind == KIND_BOOL:
+                self._columns[name] = (kind, sections.pop())
+            elif kind == KIND_INT:
+                self._columns[name] = (kind, _view(sections.pop(), "q"))
+            elif kind == KIND_STR_LIST:
+                offsets = _view(sections.pop(), "I")
+                self._columns[name] = (kind, (offsets, _view(sections.pop(), "I")))
+            else:
+                raise SnapshotError(f"Unknown column kind {kind!r}")
+        self._fields = [name for name, _ in COLUMNS if name in self._columns]
+
+    def __len__(self) -> int:
+        return self.header["item_count"]
+
+    def _string(self, string_id: int) -> Optional[str]:
+        if string_id == NONE_ID:
+            return None
+        start, end = self._string_offsets[string_id], self._string_offsets[string_id + 1]
+        return str(self._strings[start:end], "utf-8")
+
+    def _make_item(self, fields: dict) -> Item:
+        # Fields added to Item after the snapshot was written get their defaults
+        return Item.model_construct(**fields)
+
+    def item_fields(self, index: int) -> dict:
+        """Decode one item's fields as a dict"""
+        if not 0 <= index < len(self):
+            raise IndexError(index)
+        fields = {}
+        for name in self._fields:
+            kind, column = self._columns[name]
+            if kind == KIND_STR:
+                fields[name] = self._string(column[index])
+            elif kind == KIND_BOOL:
+                fields[name] = bool(column[index])
+            elif kind == KIND_INT:
+                fields[name] = column[index]
+            else:
+                offsets, ids = column
+                fields[name] = [self._string(string_id) for string_id in ids[offsets[index]:offsets[index + 1]]]
+        return fields
+
+    def __getitem__(self, index: int) -> Item:
+        return self._make_item(self.item_fields(index))
+
+    def _decoded_strings(self) -> List[str]:
+        offsets = self._string_offsets.tolist()
+        return [str(self._strings[start:end], "utf-8") for start, end in zip(offsets, offsets[1:])]
+
+    def _decode_column(self, name: str, strings: List[str]) -> list:
+        """Decode one column for all items at once"""
+        kind, column = self._columns[name]
+        if kind == KIND_STR:
+            return [strings[string_id] if string_id != NONE_ID else None for string_id in column.tolist()]
+        if kind == KIND_BOOL:
+            return [value != 0 for value in column]
+        if kind == KIND_INT:
+            return column.tolist()
+        offsets, ids = column
+        offsets, ids = offsets.tolist(), ids.tolist()
+        return [
+            [strings[string_id] for string_id in ids[offsets[index]:offsets[index + 1]]]
+            for index in range(len(self))
+        ]
+
+    def __iter__(self) -> Iterator[Item]:
+        """All items, decoded column by column (each string is decoded once)"""
+        strings = self._decoded_strings()
+        columns = [self._decode_column(name, strings) for name in self._fields]
+        names = self._fields
+        for values in zip(*columns):
+            yield self._make_item(dict(zip(names, values)))
+
+    def records(self) -> Iterator[ItemRecord]:
+        """All items as records holding only EAGER_FIELDS - the rest is decoded
+        from the map on first access, so the reader must stay open while they live"""
+        strings = self._decoded_strings()
+        columns = {name: self._decode_column(name, strings) for name in EAGER_FIELDS if name in self._columns}
+        return lazy_item_records(columns, self)
+
+    def to_app_data(self) -> AppData:
+        """AppData with lazily decoded item records (see ``records()``)"""
+        return AppData.model_construct(
+            items=list(self.records()),
+            categories=list(self.header["categories"]),
+            settings=Settings(**self.header["settings"]),
+            last_updated=self.header["last_updated"],
+            data_version=self.header.get("data_version", 0)
+        )
+
+    def close(self):
+        # Typed views must be released before the map can be closed
+        self._string_offsets = self._strings = None
+        self._columns = {}
+        self._mmap.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def read_snapshot(path: str) -> AppData:
+    """Load a binary snapshot file into AppData.
+
+    Items are records that read most fields from the mapped file when first
+    used, so the file stays mapped until all of them are loaded or dropped -
+    replace it (``os.replace``), never rewrite it in place.
+    """
+    return SnapshotReader(path).to_app_data()
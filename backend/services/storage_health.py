@@ -0,0 +1,111 @@
+import asyncio
+import logging
+import time
+from typing import Awaitable, Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+# Circuit states
+STATE_CLOSED = "closed"  # Backend healthy - writes go through
+STATE_OPEN = "open"      # Tripped after consecutive failures - writes skipped until a probe succeeds
+
+
+class StorageHealth:
+    """Cached storage availability with a circuit breaker.
+
+    ``is_available()`` never touches the network: it answers from cached
+    state. Real save outcomes feed the state (a successful upload counts as a
+    fresh health check), ``failure_threshold`` consecutive failures trip the
+    circuit, and probes run as background tasks - once the cached state is
+    older than ``ttl_seconds``, and every ``retry_seconds`` while the circuit
+    is open until the backend answers again.
+    """
+
+    def __init__(
+        self,
+        probe: Callable[[], Awaitable[bool]],
+        ttl_seconds: float = 60.0,
+        failure_threshold: int = 3,
+        retry_seconds: float = 30.0,
+        on_recovery: Optional[Callable[[], None]] = None
+    ):
+        self._probe = probe
+        self.ttl_seconds = ttl_seconds
+        self.failure_threshold = failure_threshold
+        self.retry_seconds = retry_seconds
+        self._on_recovery = on_recovery
+
+        self.state = STATE_CLOSED
+        self.consecutive_failures = 0
+        self._checked_at: Optional[float] = None  # None = never checked
+        self._probe_task: Optional[asyncio.Task] = None
+
+        # Counters
+        self.probes = 0
+        self.trips = 0
+
+    def is_available(self) -> bool:
+        """Cached availability - O(1), schedules a background probe if stale"""
+        stale = self._checked_at is None or time.monotonic() - self._checked_at > self.ttl_seconds
+        if self.state == STATE_OPEN or stale:
+            self._schedule_probe()
+        return self.state == STATE_CLOSED
+
+    def record_success(self):
+        """A storage call succeeded"""
+        recovered = self.state == STATE_OPEN
+        self.state = STATE_CLOSED
+        self.consecutive_failures = 0
+        self._checked_at = time.monotonic()
+        if recovered:
+            logger.info("✅ Storage circuit closed - backend reachable again")
+            if self._on_recovery is not None:
+                self._on_recovery()
+
+    def record_failure(self):
+        """A storage call failed - trips the circuit after failure_threshold in a row"""
+        self.consecutive_failures += 1
+        self._checked_at = time.monotonic()
+        if self.state == STATE_CLOSED and self.consecutive_failures >= self.failure_threshold:
+            self.state = STATE_OPEN
+            self.trips += 1
+            logger.warning(f"⚡ Storage circuit opened after {self.consecutive_failures} consecutive failures")
+
+    async def check(self) -> bool:
+        """Probe the backend now and update the cached state"""
+        self.probes += 1
+        try:
+            available = await self._probe()
+        except Exception as e:
+            logger.warning(f"❌ Storage health probe failed: {e}")
+            available = False
+        if available:
+            self.record_success()
+        else:
+            self.record_failure()
+        return available
+
+    def _schedule_probe(self):
+        if self._probe_task is not None and not self._probe_task.done():
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return  # No event loop (sync caller) - the next async caller will probe
+        self._probe_task = loop.create_task(self._probe_loop())
+
+    async def _probe_loop(self):
+        """Probe once; while the circuit is open keep retrying until it closes"""
+        while not await self.check() and self.state == STATE_OPEN:
+            await asyncio.sleep(self.retry_seconds)
+
+    def stats(self) -> dict:
+        return {
+            "state": self.state,
+            "consecutive_failures": self.consecutive_failures,
+            "seconds_since_check": (
+                round(time.monotonic() - self._checked_at, 1) if self._checked_at is not None else None
+            ),
+            "probes": self.probes,
+            "trips": self.trips
+        }
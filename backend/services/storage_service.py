@@ -1,12 +1,77 @@
 import asyncio
 import json
 import os
+import shutil
 import logging
-from typing import Optional, Dict, Any
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Any, Callable, Dict, Optional, TextIO, TypeVar
 from pathlib import Path
+from config import STORAGE_IO_CONCURRENCY
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+# Bounded pool for blocking storage calls - shared by all storage services
+_io_executor: Optional[ThreadPoolExecutor] = None
+
+def _get_io_executor() -> ThreadPoolExecutor:
+    global _io_executor
+    if _io_executor is None:
+        _io_executor = ThreadPoolExecutor(
+            max_workers=STORAGE_IO_CONCURRENCY,
+            thread_name_prefix="storage-io"
+        )
+    return _io_executor
+
+async def run_blocking(fn, *args, **kwargs):
+    """Run a blocking call in the storage I/O pool without stalling the event loop"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_get_io_executor(), partial(fn, *args, **kwargs))
+
+def _read_json_file(file_path: Path) -> Dict[Any, Any]:
+    with open(file_path, 'r') as f:
+        return json.load(f)
+
+def _write_json_file(file_path: Path, data: Dict[Any, Any]):
+    json_data = json.dumps(data, indent=2)
+    with open(file_path, 'w') as f:
+        f.write(json_data)
+
+def _parse_file(file_path: Path, parse: Callable[[TextIO], T]) -> T:
+    with open(file_path, 'r') as f:
+        return parse(f)
+
+def _parse_blob(blob, parse: Callable[[TextIO], T]) -> Optional[T]:
+    """exists + chunked download parsed as it arrives, in one pool round-trip"""
+    if not blob.exists():
+        return None
+    with blob.open("rt", encoding="utf-8") as f:
+        return parse(f)
+
+def _write_bytes_file(file_path: Path, payload: bytes):
+    with open(file_path, 'wb') as f:
+        f.write(payload)
+
+def _download_blob_to_file(blob, path: str) -> bool:
+    """exists + download to a local file in one pool round-trip (False if missing)"""
+    if not blob.exists():
+        return False
+    blob.download_to_filename(path)
+    return True
+
+def _download_blob_json(blob) -> Optional[Dict[Any, Any]]:
+    """exists + download + parse in one pool round-trip (None if missing)"""
+    if not blob.exists():
+        return None
+    return json.loads(blob.download_as_text())
+
+def _upload_blob_json(blob, data: Dict[Any, Any]):
+    """Serialize + upload in one pool round-trip"""
+    json_data = json.dumps(data, indent=2)
+    blob.upload_from_string(json_data, content_type='application/json')
+
 class FileStorageService:
     """File-based storage service for testing async patterns locally"""
     
@@ -22,10 +87,9 @@ class FileStorageService:
         
         file_path = self.storage_dir / filename
         try:
-            with open(file_path, 'r') as f:
-                data = json.load(f)
-                logger.info(f"Successfully downloaded {filename} from file storage")
-                return data
+            data = await run_blocking(_read_json_file, file_path)
+            logger.info(f"Successfully downloaded {filename} from file storage")
+            return data
         except FileNotFoundError:
             logger.warning(f"File {filename} not found in storage")
             return None
@@ -33,6 +97,19 @@ class FileStorageService:
             logger.error(f"Failed to parse JSON from {filename}: {e}")
             return None
     
+    async def read_json_stream(self, filename: str, parse: Callable[[TextIO], T]) -> Optional[T]:
+        """Run parse() over the stored JSON as a text stream (None if missing)"""
+        # Simulate network delay
+        await asyncio.sleep(0.05)
+        
+        file_path = self.storage_dir / filename
+        if not file_path.exists():
+            logger.warning(f"File {filename} not found in storage")
+            return None
+        result = await run_blocking(_parse_file, file_path, parse)
+        logger.info(f"Successfully streamed {filename} from file storage")
+        return result
+    
     async def upload_json(self, filename: str, data: Dict[Any, Any]) -> bool:
         """Upload JSON data to file storage (simulates Cloud Storage upload)"""
         # Simulate network delay
@@ -40,14 +117,39 @@ class FileStorageService:
         
         file_path = self.storage_dir / filename
         try:
-            with open(file_path, 'w') as f:
-                json.dump(data, f, indent=2)
+            await run_blocking(_write_json_file, file_path, data)
             logger.info(f"Successfully uploaded {filename} to file storage")
             return True
         except Exception as e:
             logger.error(f"Failed to upload {filename}: {e}")
             return False
     
+    async def upload_bytes(self, filename: str, payload: bytes) -> bool:
+        """Upload a binary blob to file storage"""
+        await asyncio.sleep(0.1)
+        try:
+            await run_blocking(_write_bytes_file, self.storage_dir / filename, payload)
+            logger.info(f"Successfully uploaded {filename} to file storage ({len(payload)} bytes)")
+            return True
+        except Exception as e:
+            logger.error(f"Failed to upload {filename}: {e}")
+            return False
+    
+    async def download_to_file(self, filename: str, path: str) -> bool:
+        """Copy a stored blob to a local file (False if it doesn't exist)"""
+        await asyncio.sleep(0.05)
+        file_path = self.storage_dir / filename
+        if not file_path.exists():
+            logger.warning(f"File {filename} not found in storage")
+            return False
+        try:
+            await run_blocking(shutil.copyfile, file_path, path)
+            logger.info(f"Successfully downloaded {filename} from file storage")
+            return True
+        except Exception as e:
+            logger.error(f"Failed to download {filename}: {e}")
+            return False
+    
     def is_available(self) -> bool:
         """Check if storage is available"""
         try:
@@ -98,14 +200,11 @@ class CloudStorageService:
             
             blob = bucket.blob(filename)
             
-            # Check if blob exists
-            if not blob.exists():
+            # Check existence, download and parse JSON off the event loop
+            data = await run_blocking(_download_blob_json, blob)
+            if data is None:
                 logger.warning(f"File {filename} not found in Cloud Storage bucket {self.bucket_name}")
                 return None
-            
-            # Download and parse JSON
-            json_data = blob.download_as_text()
-            data = json.loads(json_data)
             logger.info(f"Successfully downloaded {filename} from Cloud Storage")
             return data
             
@@ -113,6 +212,25 @@ class CloudStorageService:
             logger.error(f"Failed to download {filename} from Cloud Storage: {e}")
             return None
     
+    async def read_json_stream(self, filename: str, parse: Callable[[TextIO], T]) -> Optional[T]:
+        """Run parse() over a blob as a chunked text stream (None if missing).
+
+        The blob is read in chunks while parse() consumes it, so the full text
+        is never held in memory. Parse errors propagate to the caller.
+        """
+        client, bucket = self._get_client()
+        if client is None or bucket is None:
+            logger.warning(f"Cannot download {filename}: Cloud Storage client not available")
+            return None
+        
+        blob = bucket.blob(filename)
+        result = await run_blocking(_parse_blob, blob, parse)
+        if result is None:
+            logger.warning(f"File {filename} not found in Cloud Storage bucket {self.bucket_name}")
+            return None
+        logger.info(f"Successfully streamed {filename} from Cloud Storage")
+        return result
+    
     async def upload_json(self, filename: str, data: Dict[Any, Any]) -> bool:
         """Upload JSON data to Cloud Storage"""
         try:
@@ -123,11 +241,8 @@ class CloudStorageService:
             
             blob = bucket.blob(filename)
             
-            # Convert data to JSON string
-            json_data = json.dumps(data, indent=2)
-            
-            # Upload to Cloud Storage
-            blob.upload_from_string(json_data, content_type='application/json')
+            # Convert to JSON and upload off the event loop
+            await run_blocking(_upload_blob_json, blob, data)
             logger.info(f"Successfully uploaded {filename} to Cloud Storage")
             return True
             
@@ -135,6 +250,42 @@ class CloudStorageService:
             logger.error(f"Failed to upload {filename} to Cloud Storage: {e}")
             return False
     
+    async def upload_bytes(self, filename: str, payload: bytes) -> bool:
+        """Upload a binary blob to Cloud Storage"""
+        try:
+            client, bucket = self._get_client()
+            if client is None or bucket is None:
+                logger.warning(f"Cannot upload {filename}: Cloud Storage client not available")
+                return False
+            
+            blob = bucket.blob(filename)
+            await run_blocking(blob.upload_from_string, payload, content_type='application/octet-stream')
+            logger.info(f"Successfully uploaded {filename} to Cloud Storage ({len(payload)} bytes)")
+            return True
+            
+        except Exception as e:
+            logger.error(f"Failed to upload {filename} to Cloud Storage: {e}")
+            return False
+    
+    async def download_to_file(self, filename: str, path: str) -> bool:
+        """Download a blob to a local file (False if it doesn't exist)"""
+        try:
+            client, bucket = self._get_client()
+            if client is None or bucket is None:
+                logger.warning(f"Cannot download {filename}: Cloud Storage client not available")
+                return False
+            
+            blob = bucket.blob(filename)
+            if not await run_blocking(_download_blob_to_file, blob, path):
+                logger.warning(f"File {filename} not found in Cloud Storage bucket {self.bucket_name}")
+                return False
+            logger.info(f"Successfully downloaded {filename} from Cloud Storage")
+            return True
+            
+        except Exception as e:
+            logger.error(f"Failed to download {filename} from Cloud Storage: {e}")
+            return False
+    
     def is_available(self) -> bool:
         """Check if Cloud Storage is available"""
         try:
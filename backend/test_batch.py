@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+"""
+Test script for POST /api/batch (many operations, one commit)
+"""
+import time
+from fastapi.testclient import TestClient
+from services import data_service
+import routes.batch
+from test_support import temp_client
+
+TODAY = "2025-07-10"
+
+
+def _new_item(name: str, section: str = "Kanji", **fields) -> dict:
+    return {"name": name, "section": section, "created_date": "", "last_accessed": "", **fields}
+
+
+def _snapshot(client: TestClient) -> tuple:
+    items = client.get("/api/items").json()
+    return (
+        data_service.get_data_version(),
+        sorted((item["id"], item["name"], item["section"], item["revision"]) for item in items),
+        client.get("/api/categories").json(),
+        client.get("/api/settings").json()
+    )
+
+
+def test_mixed_operations():
+    """Item, category and settings operations apply in order, later ones seeing earlier ones"""
+    print("🧪 Testing mixed batch...")
+    with temp_client() as client:
+        first = client.post("/api/items", json=_new_item("First")).json()
+        second = client.post("/api/items", json=_new_item("Second")).json()
+
+        response = client.post("/api/batch", json={"operations": [
+            {"op": "settings.update", "settings": {"confident_days": 9, "medium_days": 4, "wtf_days": 1}},
+            {"op": "category.add", "name": "Grammar"},
+            {"op": "item.create", "item": _new_item("Third", "Grammar")},
+            {"op": "item.patch", "id": first["id"], "fields": {"name": "First (edited)"}, "if_match": '"1"'},
+            {"op": "item.review", "id": first["id"], "rating": "confident", "today": TODAY},
+            {"op": "category.rename", "old_name": "Kanji", "new_name": "Kana"},
+            {"op": "item.delete", "id": second["id"], "if_match": '"2"'},
+            {"op": "category.delete", "name": "Default"},
+        ]})
+        assert response.status_code == 200, response.text
+        body = response.json()
+        assert body["applied"] == 8
+        assert [result["index"] for result in body["results"]] == list(range(8))
+        assert body["results"][4]["item"]["next_review_date"] == "2025-07-19"
+        assert body["results"][5]["items_updated"] == 2
+
+        items = {item["name"]: item for item in client.get("/api/items").json()}
+        assert set(items) == {"First (edited)", "Third"}
+        assert items["First (edited)"]["section"] == "Kana"
+        assert items["First (edited)"]["revision"] == 4
+        assert items["Third"]["id"] and items["Third"]["created_date"]
+        assert client.get("/api/categories").json() == ["Kana", "Grammar"]
+        print("   ✅ All operations applied in order")
+
+
+def test_failure_rejects_whole_batch():
+    """One bad operation leaves items, categories, settings and the version untouched"""
+    print("🧪 Testing all-or-nothing...")
+    with temp_client() as client:
+        item = client.post("/api/items", json=_new_item("Item")).json()
+        before = _snapshot(client)
+
+        cases = [
+            ({"op": "item.delete", "id": "missing"}, 404),
+            ({"op": "item.update", "id": item["id"], "item": _new_item("X"), "if_match": '"7"'}, 409),
+            ({"op": "item.patch", "id": item["id"], "fields": {"bogus": 1}}, 400),
+            ({"op": "item.patch", "id": item["id"], "fields": {"revision": 10}}, 400),
+            ({"op": "item.patch", "id": item["id"], "fields": {"reviewed": "maybe"}}, 422),
+            ({"op": "item.review", "id": item["id"], "rating": "wtf", "days": 3}, 400),
+            ({"op": "category.add", "name": "kanji"}, 409),
+            ({"op": "category.add", "name": "all"}, 400),
+            ({"op": "category.delete", "name": "Kanji"}, 409),
+            ({"op": "category.rename", "old_name": "Nope", "new_name": "Other"}, 404),
+            ({"op": "settings.update", "settings": {"confident_days": 0, "medium_days": 1, "wtf_days": 1}}, 400),
+        ]
+        for failing, status in cases:
+            response = client.post("/api/batch", json={"operations": [
+                {"op": "item.patch", "id": item["id"], "fields": {"name": "Changed"}},
+                {"op": "category.add", "name": "Added"},
+                failing,
+            ]})
+            assert response.status_code == status, (failing, response.text)
+            detail = response.json()["message"]
+            assert (detail["index"], detail["op"]) == (2, failing["op"])
+            assert _snapshot(client) == before
+        print(f"   ✅ {len(cases)} failing operations, nothing applied")
+
+
+def test_checks_see_earlier_operations():
+    """Checks run against the planned state, not the stored one"""
+    print("🧪 Testing planned state...")
+    with temp_client() as client:
+        item = client.post("/api/items", json=_new_item("Item")).json()
+
+        # Moving the only item out makes the category deletable
+        response = client.post("/api/batch", json={"operations": [
+            {"op": "item.patch", "id": item["id"], "fields": {"section": "Vocabulary"}},
+            {"op": "category.delete", "name": "Kanji"},
+        ]})
+        assert response.status_code == 200, response.text
+
+        # A rename bumps the revision, so the old ETag is stale afterwards
+        response = client.post("/api/batch", json={"operations": [
+            {"op": "category.rename", "old_name": "Vocabulary", "new_name": "Words"},
+            {"op": "item.delete", "id": item["id"], "if_match": '"2"'},
+        ]})
+        assert response.status_code == 409
+        response = client.post("/api/batch", json={"operations": [
+            {"op": "category.rename", "old_name": "Vocabulary", "new_name": "Words"},
+            {"op": "category.delete", "name": "Words"},
+        ]})
+        assert response.status_code == 409
+        assert response.json()["message"]["index"] == 1
+
+        # A deleted item can't be touched again, a created section is in use
+        response = client.post("/api/batch", json={"operations": [
+            {"op": "item.delete", "id": item["id"]},
+            {"op": "item.review", "id": item["id"], "rating": "wtf"},
+        ]})
+        assert response.status_code == 404
+        response = client.post("/api/batch", json={"operations": [
+            {"op": "item.create", "item": _new_item("New", "Fresh")},
+            {"op": "category.delete", "name": "Fresh"},
+        ]})
+        assert response.status_code == 409
+        print("   ✅ Renames, moves, deletes and creates are seen by later checks")
+
+
+def test_request_limits():
+    """Empty batches, unknown operations and oversized batches are rejected"""
+    print("🧪 Testing request limits...")
+    with temp_client() as client:
+        assert client.post("/api/batch", json={"operations": []}).status_code == 422
+        assert client.post("/api/batch", json={"operations": [{"op": "item.explode"}]}).status_code == 422
+
+        limit = routes.batch.BATCH_MAX_OPERATIONS
+        routes.batch.BATCH_MAX_OPERATIONS = 2
+        try:
+            operations = [{"op": "category.add", "name": f"C{i}"} for i in range(3)]
+            assert client.post("/api/batch", json={"operations": operations}).status_code == 413
+            assert client.post("/api/batch", json={"operations": operations[:2]}).status_code == 200
+        finally:
+            routes.batch.BATCH_MAX_OPERATIONS = limit
+        print("   ✅ Limits enforced")
+
+
+def test_single_persist():
+    """The whole batch is persisted with one save"""
+    print("🧪 Testing single persist...")
+    with temp_client() as client:
+        ids = [client.post("/api/items", json=_new_item(f"Card {i}")).json()["id"] for i in range(200)]
+
+        saves = []
+        save_data = routes.batch.save_data
+
+        async def counting_save(data):
+            saves.append(len(data.items))
+            await save_data(data)
+
+        routes.batch.save_data = counting_save
+        try:
+            operations = [{"op": "item.patch", "id": item_id, "fields": {"reviewed": True}} for item_id in ids]
+            assert client.post("/api/batch", json={"operations": operations}).status_code == 200
+        finally:
+            routes.batch.save_data = save_data
+
+        assert saves == [200]
+        saved = data_service._load_from_local_file()
+        assert all(item.reviewed for item in saved.items)
+        print("   ✅ 200 patches, 1 save")
+
+
+def benchmark_batch_vs_requests(count: int = 300):
+    """Patch `count` items one request each vs. one batch"""
+    print(f"\n📊 Benchmarking {count} patches...")
+    with temp_client() as client:
+        ids = [client.post("/api/items", json=_new_item(f"Card {i}")).json()["id"] for i in range(count)]
+
+        start = time.perf_counter()
+        for item_id in ids:
+            item = client.get(f"/api/items/{item_id}").json()
+            client.put(f"/api/items/{item_id}", json={**item, "reviewed": True})
+        single_s = time.perf_counter() - start
+
+        start = time.perf_counter()
+        operations = [{"op": "item.patch", "id": item_id, "fields": {"reviewed": False}} for item_id in ids]
+        assert client.post("/api/batch", json={"operations": operations}).status_code == 200
+        batch_s = time.perf_counter() - start
+
+        print(f"   Requests: {single_s * 1000:.0f}ms ({2 * count} round trips, {count} saves)")
+        print(f"   Batch:    {batch_s * 1000:.0f}ms (1 round trip, 1 save)")
+        print(f"   Speedup:  {single_s / batch_s:.1f}x")
+
+
+if __name__ == "__main__":
+    test_mixed_operations()
+    test_failure_rejects_whole_batch()
+    test_checks_see_earlier_operations()
+    test_request_limits()
+    test_single_persist()
+    benchmark_batch_vs_requests()
+    print("\n🎉 All batch tests passed!")
@@ -0,0 +1,219 @@
+#!/usr/bin/env python3
+"""
+Test script and benchmark for category IDs (O(1) renames) and the case-insensitive category lookup
+"""
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+from services import data_service
+from services.category_registry import CategoryLookup, CategoryRegistry
+from services.data_service import dump_app_data
+from services.item_record import ItemRecord
+from services.item_transfer import iter_ndjson
+from test_support import loaded_client
+
+
+def _document(count: int) -> dict:
+    return {
+        "items": [
+            {
+                "id": f"item-{i}",
+                "name": f"Item {i}",
+                "section": "Kanji" if i % 2 else "Math",
+                "reviewed": i % 3 == 0,
+                "next_review_date": "2025-01-01" if i % 3 == 0 else None,
+                "created_date": "2024-01-01T00:00:00",
+                "last_accessed": "2024-01-01T00:00:00",
+                "revision": 3,
+                "archived": i % 10 == 0
+            }
+            for i in range(count)
+        ],
+        "categories": ["Kanji", "Math"],
+        "settings": {"confident_days": 7, "medium_days": 3, "wtf_days": 1},
+        "last_updated": "2025-01-01T00:00:00"
+    }
+
+
+def test_rename_leaves_records_alone():
+    """A rename changes the registry entry; records read the new name and a bumped revision"""
+    print("🧪 Testing O(1) rename...")
+    with loaded_client(_document(20)) as client:
+        assert client.get("/api/items/item-1").headers["etag"] == '"3"'
+        before = list(data_service.load_data().items)
+
+        response = client.put("/api/categories/Kanji", json={"name": "漢字"})
+        assert response.json()["items_updated"] == 10
+        items = data_service.load_data().items
+        assert all(new is old for new, old in zip(items, before) if isinstance(old, ItemRecord))
+        assert {item.section for item in items} == {"漢字", "Math"}
+        assert {item.revision for item in items if item.section == "漢字"} == {4}
+        assert {item.revision for item in items if item.section == "Math"} == {3}
+
+        # item-1 was hydrated before the rename - it is copied along
+        assert client.get("/api/items/item-1").json()["section"] == "漢字"
+        stale = client.put("/api/items/item-1", json={"name": "x", "section": "Kanji", "created_date": "", "last_accessed": ""},
+                           headers={"If-Match": '"3"'})
+        assert stale.status_code == 409
+        assert data_service.count_category_items("漢字") == 10
+        assert [item.section for item in data_service.get_due_items(50, section="漢字", today="2025-01-01")] == ["漢字"] * 10
+        assert data_service.get_due_items(50, section="Kanji", today="2025-01-01") == []
+
+        saved = data_service._load_from_local_file()
+        assert dump_app_data(saved) == dump_app_data(data_service.load_data())
+        print("   ✅ Records untouched, names, revisions and indexes follow the rename")
+
+
+def test_merge_into_used_section():
+    """Renaming onto a name other items already use merges item by item"""
+    print("🧪 Testing rename onto a used section...")
+    with loaded_client(_document(20)):
+        data_service.remove_category("Math")
+        assert data_service.rename_category("Kanji", "Math") == 10
+        items = data_service.load_data().items
+        assert {item.section for item in items} == {"Math"}
+        assert sorted(item.revision for item in items) == [3] * 10 + [4] * 10
+        assert data_service.count_category_items("Math") == 20
+        assert len(data_service.get_due_items(50, section="Math", today="2025-01-01")) == 18
+        print("   ✅ Sections merged")
+
+
+def test_case_insensitive_checks():
+    """Duplicate checks ignore case, exact-name checks don't"""
+    print("🧪 Testing category lookup...")
+    with loaded_client(_document(4)) as client:
+        assert client.post("/api/categories", json={"name": "kanji"}).status_code == 409
+        assert client.put("/api/categories/Math", json={"name": "KANJI"}).status_code == 409
+        assert client.put("/api/categories/Math", json={"name": "MATH"}).status_code == 200
+        assert client.delete("/api/categories/math").status_code == 404
+        assert client.get("/api/categories").json() == ["Kanji", "MATH"]
+
+        lookup = CategoryLookup()
+        lookup.rebuild(["Straße", "Kana"])
+        assert lookup.find("STRASSE") == "Straße" and "Straße" in lookup and "straße" not in lookup
+        assert lookup.find("Kana", ignore="Kana") is None
+        lookup.rename("Kana", "KANA")
+        assert lookup.find("kana") == "KANA" and "Kana" not in lookup
+        print("   ✅ Case-folded duplicates found, renames and deletes need the exact name")
+
+
+def test_registry():
+    """IDs are stable across renames and never reused"""
+    print("🧪 Testing category registry...")
+    registry = CategoryRegistry()
+    kanji = registry.id_for("Kanji")
+    assert registry.id_for("Kanji") == kanji and registry.get_id("Math") is None
+    frozen = registry.snapshot()
+    registry.rename(kanji, "Kana")
+    assert (registry.name(kanji), registry.renames(kanji)) == ("Kana", 1)
+    assert registry.get_id("Kanji") is None and registry.id_for("Kanji") != kanji
+    assert (frozen.name(kanji), frozen.renames(kanji)) == ("Kanji", 0)
+
+    # A name that belongs to another ID is only taken over once released
+    math = registry.id_for("Math")
+    try:
+        registry.rename(kanji, "Math")
+        assert False, "expected ValueError"
+    except ValueError:
+        pass
+    assert registry.name(kanji) == "Kana" and registry.get_id("Math") == math
+    registry.release("Math")
+    registry.rename(kanji, "Math")
+    assert registry.get_id("Math") == kanji and registry.name(math) == "Math"
+    print("   ✅ Rename keeps the ID, snapshots keep the old name, taken names are refused")
+
+
+def test_registry_threads():
+    """Concurrent first lookups of a name from several threads agree on one ID"""
+    print("🧪 Testing registry registration from threads...")
+    registry = CategoryRegistry()
+    names = [f"Section {i % 50}" for i in range(20_000)]
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        ids = list(pool.map(registry.id_for, names, chunksize=100))
+    assert len(registry) == 50
+    assert all(registry.name(category_id) == name for name, category_id in zip(names, ids))
+    print("   ✅ One ID per name")
+
+
+def test_rename_onto_emptied_section():
+    """Renaming onto a name whose items are all gone reuses the name, not its old ID"""
+    print("🧪 Testing rename onto an emptied section...")
+    with loaded_client(_document(20)) as client:
+        for i in range(0, 20, 2):
+            client.delete(f"/api/items/item-{i}")
+        data_service.remove_category("Math")
+        assert data_service.rename_category("Kanji", "Math") == 10
+        created = client.post("/api/items", json={"name": "New", "section": "Math", "created_date": "", "last_accessed": ""})
+        assert created.status_code == 200
+        assert data_service.count_category_items("Math") == 11
+        assert {item.section for item in data_service.load_data().items} == {"Math"}
+        print("   ✅ Stale ID released, items and counters agree")
+
+
+def test_sync_export_and_events_see_the_rename():
+    """Delta sync expands the rename into upserts; exports taken before it don't change"""
+    print("🧪 Testing delta sync, events and export across a rename...")
+    with loaded_client(_document(20)):
+        version = data_service.get_data_version()
+        _, items, _, categories = data_service.get_export_snapshot()
+        exported = list(iter_ndjson(items, categories))
+        subscription = data_service.get_event_bus().subscribe()
+        try:
+            data_service.rename_category("Kanji", "Kana")
+            data_service._publish_committed_changes()
+            changes = [change for event in [subscription.queue.get_nowait()] for change in event["changes"]]
+        finally:
+            data_service.get_event_bus().unsubscribe(subscription)
+        assert {"op": "moved", "section": "Kana"} in changes
+
+        delta = data_service.get_changes_since(version)
+        moved = {item.id: item for item in delta["upserts"]}
+        assert set(moved) == {f"item-{i}" for i in range(1, 20, 2) if i % 10}
+        assert {(item.section, item.revision) for item in moved.values()} == {("Kana", 4)}
+        assert "Kana" in delta["categories"]
+
+        assert list(iter_ndjson(items, categories)) == exported
+        assert {json.loads(line)["section"] for line in exported} == {"Kanji", "Math"}
+        assert {json.loads(line)["revision"] for line in exported} == {3}
+        print("   ✅ Moved items synced, published once, old export unchanged")
+
+
+def _rename_by_scan(old_name: str, new_name: str) -> int:
+    """The previous rename - copy every item of the section"""
+    moved = 0
+    for item in data_service.load_data().items:
+        if item.section == old_name:
+            item.copy(update={"section": new_name, "revision": item.revision + 1})
+            moved += 1
+    return moved
+
+
+def benchmark_rename(count: int = 200_000) -> dict:
+    """Registry rename vs. rewriting the section's items"""
+    print(f"\n📊 Category rename benchmark ({count:,} items)")
+    with loaded_client(_document(count)):
+        start = time.perf_counter()
+        moved = _rename_by_scan("Kanji", "Kana")
+        scan_ms = (time.perf_counter() - start) * 1000
+        start = time.perf_counter()
+        assert data_service.rename_category("Kanji", "Kana") == moved
+        rename_ms = (time.perf_counter() - start) * 1000
+        print(f"   rename {rename_ms:8.3f}ms   rewriting {moved:,} items {scan_ms:8.1f}ms")
+        return {"rename_ms": rename_ms, "scan_ms": scan_ms}
+
+
+def test_rename_is_fast_on_large_deck():
+    results = benchmark_rename(50_000)
+    assert results["rename_ms"] * 20 < results["scan_ms"]
+
+
+if __name__ == "__main__":
+    test_rename_leaves_records_alone()
+    test_merge_into_used_section()
+    test_case_insensitive_checks()
+    test_registry()
+    test_registry_threads()
+    test_rename_onto_emptied_section()
+    test_sync_export_and_events_see_the_rename()
+    benchmark_rename()
+    print("\n🎉 All category ID tests passed!")
@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+"""
+Test script and benchmark for the incremental per-category counters and GET /api/categories/stats
+"""
+import random
+import time
+from datetime import date, datetime, timedelta
+from fastapi.testclient import TestClient
+from models import Item, AppData
+from services import data_service
+from services.schedule_index import DUE_NEW, DUE_NEVER, due_ordinal
+from services.section_stats import COUNTS, SectionStats
+from test_support import temp_storage
+
+TODAY = "2025-07-10"
+SECTIONS = ["Kanji", "Grammar", "Vocab"]
+
+
+def _random_item(rng: random.Random, item_id: str) -> Item:
+    now = datetime.now().isoformat()
+    scheduled = rng.random() < 0.8
+    return Item(
+        id=item_id,
+        name=f"Item {item_id}",
+        section=rng.choice(SECTIONS),
+        reviewed=scheduled or rng.random() < 0.3,
+        next_review_date=(date(2025, 7, 10) + timedelta(days=rng.randint(-20, 20))).isoformat() if scheduled else None,
+        archived=rng.random() < 0.1,
+        created_date=now,
+        last_accessed=now
+    )
+
+
+def _load(items: list):
+    data_service._cached_data = AppData(items=items, categories=list(SECTIONS), last_updated=datetime.now().isoformat())
+    data_service._rebuild_indexes()
+
+
+def _brute_force_counts(today: str) -> dict:
+    """Same numbers as get_category_stats, by walking every item"""
+    day = date.fromisoformat(today).toordinal()
+    data = data_service.load_data()
+    sections = list(dict.fromkeys([*data.categories, *(item.section for item in data.items)]))
+    categories = {section: dict.fromkeys(COUNTS, 0) for section in sections}
+    for item in data.items:
+        counts = categories[item.section]
+        counts["total"] += 1
+        counts["archived" if item.archived else "active"] += 1
+        due = due_ordinal(item)
+        if due == DUE_NEW:
+            counts["new"] += 1
+        elif due < day:
+            counts["overdue"] += 1
+        elif due == day:
+            counts["due_today"] += 1
+    totals = {key: sum(counts[key] for counts in categories.values()) for key in COUNTS}
+    return {"date": today, **totals, "categories": categories}
+
+
+def test_counters_match_brute_force_under_mutations():
+    """Counters stay exact through adds, edits, archives, deletes, renames and day changes"""
+    print("🧪 Testing section counters against a full scan...")
+    rng = random.Random(24)
+    _load([_random_item(rng, f"item-{i}") for i in range(300)])
+
+    next_id = 300
+    for step in range(1500):
+        action = rng.random()
+        ids = [item.id for item in data_service.load_data().items]
+        if action < 0.5 and ids:
+            item_id = rng.choice(ids)
+            data_service.replace_item(item_id, _random_item(rng, item_id))
+        elif action < 0.6 and ids:
+            data_service.review_item(rng.choice(ids), rng.randint(0, 5), TODAY)
+        elif action < 0.75 and ids:
+            data_service.remove_item(rng.choice(ids))
+        elif action < 0.92:
+            data_service.add_item(_random_item(rng, f"item-{next_id}"))
+            next_id += 1
+        else:
+            old, new = rng.sample(SECTIONS, 2)
+            data_service.rename_category(old, new)  # Merge into an existing section
+            data_service.rename_category(new, old) if rng.random() < 0.5 else data_service.add_category(old)
+
+        if step % 50 == 0:
+            # Alternate days so the cached due counters get re-derived and then updated
+            today = (date.fromisoformat(TODAY) + timedelta(days=rng.choice([-3, 0, 0, 4]))).isoformat()
+            assert data_service.get_category_stats(today) == _brute_force_counts(today), f"step {step}"
+            for section in SECTIONS:
+                expected = sum(1 for item in data_service.load_data().items if item.section == section)
+                assert data_service.count_category_items(section) == expected
+    print("   ✅ Counters consistent after 1500 random mutations")
+
+
+def test_unscheduled_items():
+    """Reviewed items without a date and archived items are never due"""
+    print("🧪 Testing unscheduled items...")
+    now = datetime.now().isoformat()
+    stats = SectionStats()
+    stats.rebuild([
+        Item(name="a", section="S", reviewed=True, created_date=now, last_accessed=now),
+        Item(name="b", section="S", reviewed=True, next_review_date="2025-07-01", archived=True, created_date=now, last_accessed=now),
+        Item(name="c", section="S", created_date=now, last_accessed=now),
+    ])
+    today = date.fromisoformat(TODAY).toordinal()
+    assert stats.counts("S", today) == {"total": 3, "active": 2, "archived": 1, "new": 1, "overdue": 0, "due_today": 0}
+    assert stats.counts("Missing", today) == dict.fromkeys(COUNTS, 0)
+    assert DUE_NEVER > today
+    print("   ✅ Only new and scheduled active items count as due")
+
+
+def test_category_routes():
+    """GET /api/categories/stats and the counter-based delete check"""
+    print("🧪 Testing category routes...")
+    with temp_storage():
+        import main
+        now = datetime.now().isoformat()
+        _load([
+            Item(id="overdue", name="a", section="Kanji", reviewed=True, next_review_date="2025-07-01", created_date=now, last_accessed=now),
+            Item(id="today", name="b", section="Kanji", reviewed=True, next_review_date=TODAY, created_date=now, last_accessed=now),
+            Item(id="archived", name="c", section="Grammar", archived=True, created_date=now, last_accessed=now),
+        ])
+        data_service._service_ready = True
+        client = TestClient(main.app)
+
+        stats = client.get("/api/categories/stats", params={"today": TODAY}).json()
+        assert list(stats["categories"]) == SECTIONS
+        assert stats["categories"]["Kanji"] == {"total": 2, "active": 2, "archived": 0, "new": 0, "overdue": 1, "due_today": 1}
+        assert stats["categories"]["Vocab"] == dict.fromkeys(COUNTS, 0)
+        assert (stats["total"], stats["archived"]) == (3, 1)
+        assert client.get("/api/categories/stats", params={"today": "July 10"}).status_code == 400
+
+        response = client.delete("/api/categories/Grammar")
+        assert response.status_code == 409
+        assert "1 item(s)" in response.json()["message"]
+        data_service.remove_item("archived")
+        assert client.delete("/api/categories/Grammar").status_code == 200
+        print("   ✅ Stats per category, delete blocked while in use")
+
+
+def benchmark_category_stats(count: int = 200_000) -> dict:
+    """Counter reads vs. scanning the deck"""
+    print(f"\n📊 Category stats benchmark ({count} items)")
+    rng = random.Random(1)
+    _load([_random_item(rng, f"item-{i}") for i in range(count)])
+    data = data_service.load_data()
+
+    start = time.perf_counter()
+    for _ in range(100):
+        data_service.get_category_stats(TODAY)
+    stats_ms = (time.perf_counter() - start) * 1000 / 100
+    start = time.perf_counter()
+    for _ in range(100):
+        data_service.count_category_items("Kanji")
+    count_us = (time.perf_counter() - start) * 1e6 / 100
+    start = time.perf_counter()
+    scanned = sum(1 for item in data.items if item.section == "Kanji")
+    scan_ms = (time.perf_counter() - start) * 1000
+    start = time.perf_counter()
+    for i in range(1000):
+        data_service.replace_item(f"item-{i}", _random_item(rng, f"item-{i}"))
+    update_us = (time.perf_counter() - start) * 1e6 / 1000
+    assert scanned > 0
+    print(f"   stats {stats_ms:6.3f}ms   in-use check {count_us:6.2f}µs (scan {scan_ms:6.1f}ms)   replace_item {update_us:6.1f}µs")
+    return {"stats_ms": stats_ms, "count_us": count_us, "scan_ms": scan_ms}
+
+
+def test_stats_are_fast_on_large_deck():
+    results = benchmark_category_stats(50_000)
+    assert results["stats_ms"] < 5
+    assert results["count_us"] * 100 < results["scan_ms"] * 1000
+
+
+if __name__ == "__main__":
+    test_counters_match_brute_force_under_mutations()
+    test_unscheduled_items()
+    test_category_routes()
+    benchmark_category_stats()
+    print("\n🎉 All category stats tests passed!")
@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+Test script for delta sync via GET /api/items/changes
+"""
+from fastapi.testclient import TestClient
+from services.change_log import ChangeLog
+from test_support import temp_client
+
+
+def _new_item(name: str, section: str = "Kanji", **fields) -> dict:
+    return {"name": name, "section": section, "created_date": "", "last_accessed": "", **fields}
+
+
+def _version(client: TestClient) -> int:
+    return int(client.get("/api/items").headers["etag"].strip('"'))
+
+
+def test_changes_since_version():
+    """A client one edit behind gets just that edit"""
+    print("🧪 Testing changes since version...")
+    with temp_client() as client:
+        keep = client.post("/api/items", json=_new_item("Keep")).json()
+        edit = client.post("/api/items", json=_new_item("Edit")).json()
+        gone = client.post("/api/items", json=_new_item("Gone")).json()
+        archive = client.post("/api/items", json=_new_item("Archive")).json()
+        synced = _version(client)
+
+        client.put(f"/api/items/{edit['id']}", json=_new_item("Edited"))
+        client.delete(f"/api/items/{gone['id']}")
+        client.put(f"/api/items/{archive['id']}", json=_new_item("Archive", archived=True))
+        new = client.post("/api/items", json=_new_item("New")).json()
+
+        changes = client.get("/api/items/changes", params={"since": synced}).json()
+        assert changes["full_resync"] is False
+        assert changes["version"] == _version(client)
+        assert sorted(item["id"] for item in changes["upserts"]) == sorted([edit["id"], new["id"]])
+        assert sorted(changes["tombstones"]) == sorted([gone["id"], archive["id"]])
+        assert keep["id"] not in {item["id"] for item in changes["upserts"]}
+        assert changes["categories"] is None and changes["settings"] is None
+
+        # Already up to date
+        up_to_date = client.get("/api/items/changes", params={"since": changes["version"]}).json()
+        assert up_to_date["upserts"] == [] and up_to_date["tombstones"] == []
+        print("   ✅ Only changed items are returned")
+
+
+def test_category_rename_is_synced():
+    """Renaming a category reports the moved items and the new category list"""
+    with temp_client() as client:
+        item = client.post("/api/items", json=_new_item("Card", section="Vocab")).json()
+        synced = _version(client)
+        client.put("/api/categories/Vocab", json={"name": "Words"})
+        changes = client.get("/api/items/changes", params={"since": synced}).json()
+        assert [moved["section"] for moved in changes["upserts"] if moved["id"] == item["id"]] == ["Words"]
+        assert "Words" in changes["categories"]
+
+
+def test_full_resync_when_log_truncated():
+    """Versions older than the retained log require a full resync"""
+    print("🧪 Testing truncation fallback...")
+    log = ChangeLog(max_entries=3)
+    log.reset(100)
+    for version in range(101, 106):
+        log.append(version, "upsert", f"item-{version}")
+    assert log.since(100, 105) is None
+    assert [entry[0] for entry in log.since(102, 105)] == [103, 104, 105]
+    assert log.since(106, 105) is None
+
+    with temp_client() as client:
+        stale = client.get("/api/items/changes", params={"since": 1}).json()
+        assert stale["full_resync"] is True
+        print("   ✅ Full resync signalled")
+
+
+if __name__ == "__main__":
+    test_changes_since_version()
+    test_category_rename_is_synced()
+    test_full_resync_when_log_truncated()
+    print("\n🎉 All delta sync tests passed!")
@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+Test script and memory benchmark for the compact item representation
+"""
+import gc
+import json
+import sys
+import time
+import tracemalloc
+from array import array
+from datetime import date, datetime, timedelta
+from models import Item
+from services.item_record import decode_date, encode_date, make_item_record
+
+SECTIONS = ["Kanji", "Math", "English", "History", "Physics"]
+
+
+def _stored_items(count: int):
+    """Fully-populated items as JSON text, the way save_data writes them"""
+    start = date(2024, 1, 1)
+    for i in range(count):
+        created = datetime(2024, 1, 1, 8, 30) + timedelta(seconds=i * 37)
+        yield json.dumps({
+            "id": f"item-{i}",
+            "name": f"Item {i}",
+            "section": SECTIONS[i % len(SECTIONS)],
+            "side_note": "",
+            "problem_text": f"Question {i}",
+            "problem_url": None,
+            "problem_image": None,
+            "problem_images": [f"/images/{i}.png"] if i % 5 == 0 else [],
+            "answer_text": f"Answer {i}",
+            "answer_url": None,
+            "answer_image": None,
+            "answer_images": [],
+            "reviewed": i % 3 == 0,
+            "next_review_date": (start + timedelta(days=i % 90)).isoformat(),
+            "review_dates": [(start + timedelta(days=(i + day) % 60)).isoformat() for day in range(i % 8)],
+            "created_date": created.isoformat(),
+            "last_accessed": created.isoformat(),
+            "archived": i % 10 == 0,
+            "revision": 1
+        })
+
+
+def test_date_codec_round_trips():
+    """Dates pack into ints only when they print back identically"""
+    print("🧪 Testing date packing...")
+    packed = ["2025-01-31", "1999-12-31T23:59:59", "2024-02-29T08:00:00.000001", "1969-07-20T20:17:40"]
+    kept = [None, "", "tomorrow", "2024-02-30", "2024-01-01 08:00:00", "2024-01-01T08:00:00+09:00",
+            "2024-01-01T08:00:00.000000", "2024-1-1"]
+    for value in packed:
+        assert type(encode_date(value)) is int, value
+        assert decode_date(encode_date(value)) == value
+    for value in kept:
+        assert encode_date(value) is value, value
+    assert encode_date("2025-01-01") < encode_date("2025-01-02")
+    print("   ✅ Lossless for every value")
+
+
+def test_record_is_compact_and_equivalent():
+    """A record reads, writes and hydrates like the item it was made from"""
+    print("🧪 Testing compact record...")
+    raw = json.loads(next(_stored_items(1)))
+    raw["review_dates"] = ["2025-01-01", "2025-01-05"]
+    record = make_item_record(dict(raw))
+    assert dict(record) == raw
+    assert record.hydrate() == Item(**raw)
+    assert record.section is sys.intern("Kanji")
+    assert isinstance(record._review_dates, array)
+    assert isinstance(record._created_date, int)
+    assert not hasattr(record, "__dict__")
+
+    # Free-form review entries fall back to strings, still in order
+    record.review_dates = ["2025-01-01", "yesterday"]
+    assert record.review_dates == ["2025-01-01", "yesterday"]
+    # Lists read as copies - assignment is the way to change them
+    record.problem_images.append("/images/lost.png")
+    assert record.problem_images == ["/images/0.png"]
+    record.section = "Math"
+    record.revision += 1
+    assert (record["section"], record["revision"]) == ("Math", 2)
+    print("   ✅ Same fields, compact storage")
+
+
+def _measure(build, lines: list) -> tuple:
+    """Parse and build every item under tracemalloc - retained memory includes the strings"""
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    loaded = [build(json.loads(line)) for line in lines]
+    seconds = time.perf_counter() - start
+    retained = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del loaded
+    return seconds, retained
+
+
+FORMS = {
+    "Item": lambda raw: Item(**raw),
+    "dict": lambda raw: raw,
+    "compact": make_item_record,
+}
+
+
+def benchmark_item_memory(count: int = 100_000, forms=tuple(FORMS)) -> dict:
+    """Retained memory per item: pydantic Items vs. plain dicts vs. compact records"""
+    print(f"\n📊 Memory benchmark ({count} items)")
+    lines = list(_stored_items(count))
+    results = {}
+    for name in forms:
+        build = FORMS[name]
+        seconds, retained = _measure(build, lines)
+        results[name] = retained
+        print(f"   {name:<8} {retained / count:6.0f} bytes/item  {retained / 2**20:8.1f} MiB  ({seconds:.2f}s traced)")
+    return results
+
+
+def test_compact_uses_less_memory():
+    results = benchmark_item_memory(5_000)
+    assert results["compact"] * 2 < results["dict"] < results["Item"]
+
+
+if __name__ == "__main__":
+    test_date_codec_round_trips()
+    test_record_is_compact_and_equivalent()
+    benchmark_item_memory(10_000)
+    benchmark_item_memory(100_000)
+    # Several GB as Items or dicts (plus tracemalloc's own per-block records)
+    benchmark_item_memory(1_000_000, forms=("compact",))
+    print("\n🎉 All compact item tests passed!")
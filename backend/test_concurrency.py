@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+Test script for optimistic concurrency (item revisions + If-Match) and a
+lost-update stress test
+"""
+import asyncio
+import httpx
+from models import Item
+from services import data_service
+from test_support import temp_client
+
+
+def _new_item(name: str, section: str = "Kanji", **fields) -> dict:
+    return {"name": name, "section": section, "created_date": "", "last_accessed": "", **fields}
+
+
+def test_revisions_and_if_match():
+    """Stale If-Match is rejected with 409, current one is applied"""
+    print("🧪 Testing item revisions and If-Match...")
+    with temp_client() as client:
+        created = client.post("/api/items", json=_new_item("Counter")).json()
+        assert created["revision"] == 1
+
+        response = client.get(f"/api/items/{created['id']}")
+        etag = response.headers["etag"]
+        assert etag == '"1"'
+
+        updated = client.put(f"/api/items/{created['id']}", json=_new_item("First"), headers={"If-Match": etag})
+        assert updated.status_code == 200
+        assert updated.json()["revision"] == 2
+        assert updated.headers["etag"] == '"2"'
+
+        stale = client.put(f"/api/items/{created['id']}", json=_new_item("Second"), headers={"If-Match": etag})
+        assert stale.status_code == 409
+        assert client.get(f"/api/items/{created['id']}").json()["name"] == "First"
+
+        # Without If-Match the last write wins, as before
+        assert client.put(f"/api/items/{created['id']}", json=_new_item("Third")).status_code == 200
+        assert client.put(f"/api/items/{created['id']}", json=_new_item("Any"), headers={"If-Match": "*"}).status_code == 200
+
+        # Renaming the category changes the item, so its revision moves too
+        revision = client.get(f"/api/items/{created['id']}").json()["revision"]
+        client.put("/api/categories/Kanji", json={"name": "Kanji N5"})
+        assert client.get(f"/api/items/{created['id']}").json()["revision"] == revision + 1
+        print("   ✅ Revisions bump and conflicts are detected")
+
+
+def test_if_match_is_strong():
+    """Weak validators never satisfy If-Match, on PUT or in a batch"""
+    print("🧪 Testing strong If-Match comparison...")
+    with temp_client() as client:
+        created = client.post("/api/items", json=_new_item("Strong")).json()
+
+        weak = client.put(f"/api/items/{created['id']}", json=_new_item("Weak"), headers={"If-Match": 'W/"1"'})
+        assert weak.status_code == 409
+        listed = client.put(f"/api/items/{created['id']}", json=_new_item("Listed"), headers={"If-Match": '"7", "1"'})
+        assert listed.status_code == 200
+
+        response = client.post("/api/batch", json={"operations": [
+            {"op": "item.patch", "id": created["id"], "fields": {"name": "Batch"}, "if_match": 'W/"2"'}
+        ]})
+        assert response.status_code == 409
+        assert client.get(f"/api/items/{created['id']}").json()["name"] == "Listed"
+        print("   ✅ Weak ETags are rejected, strong lists still match")
+
+
+def test_commit_section_serializes():
+    """Coroutines holding the commit section never interleave"""
+    print("🧪 Testing commit section serialization...")
+    trace = []
+
+    async def worker(name: str):
+        async with data_service.commit_section():
+            trace.append(("enter", name))
+            await asyncio.sleep(0)
+            trace.append(("exit", name))
+
+    async def scenario():
+        await asyncio.gather(*(worker(str(i)) for i in range(5)))
+
+    asyncio.run(scenario())
+    for position in range(0, len(trace), 2):
+        assert trace[position][0] == "enter" and trace[position + 1] == ("exit", trace[position][1])
+    print("   ✅ No interleaving inside the commit section")
+
+
+async def _increment(client: httpx.AsyncClient, item_id: str, use_if_match: bool) -> int:
+    """Read-modify-write one counter stored in side_note; returns conflicts seen"""
+    conflicts = 0
+    while True:
+        response = await client.get(f"/api/items/{item_id}")
+        item = response.json()
+        # Yield so other clients read the same revision before we write
+        await asyncio.sleep(0)
+        item["side_note"] = str(int(item["side_note"] or "0") + 1)
+        headers = {"If-Match": response.headers["etag"]} if use_if_match else {}
+        result = await client.put(f"/api/items/{item_id}", json=item, headers=headers)
+        if result.status_code == 200:
+            return conflicts
+        assert result.status_code == 409
+        conflicts += 1
+
+
+def run_lost_update_stress(writers: int = 20, use_if_match: bool = True) -> dict:
+    """Concurrent increments of one item; lost updates = writers - final count"""
+    import main
+    with temp_client():
+        item = Item(**_new_item("Stress", side_note="0"))
+        item.id = "stress"
+        data_service.add_item(item)
+
+        async def scenario():
+            transport = httpx.ASGITransport(app=main.app)
+            async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+                conflicts = await asyncio.gather(*(_increment(client, "stress", use_if_match) for _ in range(writers)))
+                final = (await client.get("/api/items/stress")).json()
+            return sum(conflicts), int(final["side_note"])
+
+        conflicts, final = asyncio.run(scenario())
+        result = {"writers": writers, "conflicts": conflicts, "lost_updates": writers - final}
+        print(f"   If-Match={use_if_match}: {result}")
+        return result
+
+
+def test_no_lost_updates_with_if_match():
+    """With If-Match + retry every increment survives; without it some are lost"""
+    print("🧪 Stress testing concurrent read-modify-write...")
+    unguarded = run_lost_update_stress(use_if_match=False)
+    guarded = run_lost_update_stress(use_if_match=True)
+    assert unguarded["lost_updates"] > 0
+    assert guarded["lost_updates"] == 0 and guarded["conflicts"] > 0
+    print("   ✅ No lost updates with optimistic concurrency")
+
+
+if __name__ == "__main__":
+    test_revisions_and_if_match()
+    test_if_match_is_strong()
+    test_commit_section_serializes()
+    test_no_lost_updates_with_if_match()
+    print("\n🎉 All concurrency tests passed!")
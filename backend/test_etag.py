@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Test script for ETag / If-None-Match conditional GETs on read routes
+"""
+from test_support import temp_client
+
+READ_ROUTES = ["/api/items", "/api/data", "/api/categories", "/api/settings"]
+
+
+def _new_item(name: str, section: str = "Kanji") -> dict:
+    return {"name": name, "section": section, "created_date": "", "last_accessed": ""}
+
+
+def test_conditional_get_returns_304():
+    """A matching If-None-Match gets 304 with no body"""
+    print("🧪 Testing 304 Not Modified...")
+    with temp_client() as client:
+        for route in READ_ROUTES:
+            response = client.get(route)
+            etag = response.headers["etag"]
+            assert response.status_code == 200 and etag.startswith('"')
+
+            cached = client.get(route, headers={"If-None-Match": etag})
+            assert cached.status_code == 304, route
+            assert cached.content == b""
+            assert cached.headers["etag"] == etag
+
+            assert client.get(route, headers={"If-None-Match": '"stale", ' + etag}).status_code == 304
+            assert client.get(route, headers={"If-None-Match": '"stale"'}).status_code == 200
+        print("   ✅ All read routes revalidate")
+
+
+def test_etag_changes_after_each_kind_of_mutation():
+    """Every mutation route changes the ETag of every read route"""
+    print("🧪 Testing ETag changes per mutation...")
+    with temp_client() as client:
+        state = {}
+
+        def etags() -> dict:
+            return {route: client.get(route).headers["etag"] for route in READ_ROUTES}
+
+        def assert_changed(label: str):
+            current = etags()
+            for route in READ_ROUTES:
+                assert current[route] != state.get(route), f"{route} ETag unchanged after {label}"
+                # The old ETag must no longer validate
+                if route in state:
+                    assert client.get(route, headers={"If-None-Match": state[route]}).status_code == 200
+            state.update(current)
+            print(f"   ✅ {label}")
+
+        state.update(etags())
+        item = client.post("/api/items", json=_new_item("Card")).json()
+        assert_changed("create item")
+
+        client.put(f"/api/items/{item['id']}", json=_new_item("Edited", section="Grammar"))
+        assert_changed("update item")
+
+        client.put(f"/api/items/{item['id']}", json={**_new_item("Edited", section="Grammar"), "archived": True})
+        assert_changed("archive item")
+
+        client.put("/api/settings", json={"confident_days": 9, "medium_days": 4, "wtf_days": 2})
+        assert_changed("update settings")
+        assert client.get("/api/settings").json()["confident_days"] == 9
+
+        client.post("/api/categories", json={"name": "Vocab"})
+        assert_changed("add category")
+
+        client.put("/api/categories/Vocab", json={"name": "Words"})
+        assert_changed("rename category")
+
+        client.delete("/api/categories/Words")
+        assert_changed("delete category")
+
+        client.delete(f"/api/items/{item['id']}")
+        assert_changed("delete item")
+
+
+def test_invalid_parameters_beat_304():
+    """Bad query parameters are rejected even when the ETag still matches"""
+    print("🧪 Testing validation before revalidation...")
+    with temp_client() as client:
+        for route in ["/api/items", "/api/data"]:
+            etag = client.get(route).headers["etag"]
+            assert client.get(route, params={"cursor": "%%%"}, headers={"If-None-Match": etag}).status_code == 400
+            assert client.get(route, params={"fields": "nope"}, headers={"If-None-Match": etag}).status_code == 400
+            assert client.get(route, params={"fields": "name"}, headers={"If-None-Match": etag}).status_code == 304
+        print("   ✅ 400 for a bad cursor or field list, 304 only for valid requests")
+
+
+def test_export_etag_per_representation():
+    """Each export format, scope and compression has its own ETag"""
+    print("🧪 Testing export ETags...")
+    with temp_client() as client:
+        etags = {
+            client.get("/api/export", params=params).headers["etag"]
+            for params in [{}, {"format": "csv"}, {"format": "json"}, {"gzip": True}, {"include_archived": True}]
+        }
+        assert len(etags) == 5
+        print("   ✅ Distinct ETags")
+
+
+if __name__ == "__main__":
+    test_conditional_get_returns_304()
+    test_etag_changes_after_each_kind_of_mutation()
+    test_invalid_parameters_beat_304()
+    test_export_etag_per_representation()
+    print("\n🎉 All ETag tests passed!")
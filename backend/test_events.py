@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+"""
+Test script for the GET /api/events push channel
+"""
+import asyncio
+import json
+from services import data_service
+from services.event_bus import EventBus, TooManySubscribersError
+from routes import events
+from test_support import temp_client
+
+
+def _new_item(name: str, section: str = "Kanji", **fields) -> dict:
+    return {"name": name, "section": section, "created_date": "", "last_accessed": "", **fields}
+
+
+def _drain(subscription) -> list:
+    events = []
+    while not subscription.queue.empty():
+        events.append(subscription.queue.get_nowait())
+    return events
+
+
+def test_slow_consumer_gets_resync():
+    """A full queue is replaced by a single resync event instead of growing"""
+    print("🧪 Testing backpressure on slow consumers...")
+
+    async def scenario():
+        bus = EventBus(max_subscribers=2, queue_size=3)
+        fast, slow = bus.subscribe(), bus.subscribe()
+        for version in range(3):
+            bus.publish({"type": "changes", "version": version})
+            _drain(fast)
+        bus.publish({"type": "changes", "version": 3})
+        assert [event["version"] for event in _drain(fast)] == [3]
+        assert _drain(slow) == [{"type": "resync", "reason": "slow consumer"}]
+        assert bus.stats()["dropped"] == 3
+
+    asyncio.run(scenario())
+    print("   ✅ Slow consumer told to resync, memory bounded")
+
+
+def test_subscriber_cap():
+    """Subscribing past the cap fails until someone leaves"""
+    print("🧪 Testing subscriber cap...")
+
+    async def scenario():
+        bus = EventBus(max_subscribers=1)
+        first = bus.subscribe()
+        try:
+            bus.subscribe()
+            assert False, "expected TooManySubscribersError"
+        except TooManySubscribersError:
+            pass
+        bus.unsubscribe(first)
+        bus.subscribe()
+
+    asyncio.run(scenario())
+    print("   ✅ Cap enforced")
+
+
+def test_save_publishes_item_changes():
+    """Each committed mutation is pushed with its version and item IDs"""
+    print("🧪 Testing change notifications from save_data...")
+    with temp_client() as client:
+        subscription = data_service.get_event_bus().subscribe()
+        try:
+            _drain(subscription)
+            created = client.post("/api/items", json=_new_item("Pushed")).json()
+            client.delete(f"/api/items/{created['id']}")
+
+            events = _drain(subscription)
+            changes = [change for event in events for change in event["changes"]]
+            assert all(event["type"] == "changes" for event in events)
+            assert {"op": "upsert", "id": created["id"]} in changes
+            assert changes[-1] == {"op": "delete", "id": created["id"]}
+            assert events[-1]["version"] == data_service.get_data_version()
+        finally:
+            data_service.get_event_bus().unsubscribe(subscription)
+        print("   ✅ Version bumps and item changes published")
+
+
+def test_stream_frames_and_heartbeat():
+    """The stream starts with hello, relays events and pings when idle"""
+    print("🧪 Testing SSE stream framing...")
+
+    class _Request:
+        async def is_disconnected(self):
+            return False
+
+    async def scenario():
+        bus = data_service.get_event_bus()
+        before = set(bus._subscribers)
+        stream = events._event_stream(_Request())
+        assert len(bus) == len(before)  # Nothing subscribed until the body is iterated
+        hello = await stream.__anext__()
+        (subscription,) = bus._subscribers - before
+        assert hello.startswith("event: hello\n")
+        assert json.loads(hello.split("data: ", 1)[1])["version"] == data_service.get_data_version()
+
+        subscription.offer({"type": "changes", "version": 1, "changes": []})
+        assert (await stream.__anext__()).startswith("event: changes\n")
+
+        original_heartbeat = events.SSE_HEARTBEAT_SECONDS
+        events.SSE_HEARTBEAT_SECONDS = 0.01
+        try:
+            assert await stream.__anext__() == ": ping\n\n"
+        finally:
+            events.SSE_HEARTBEAT_SECONDS = original_heartbeat
+        await stream.aclose()
+        assert subscription not in data_service.get_event_bus()._subscribers
+
+    asyncio.run(scenario())
+    print("   ✅ Frames, heartbeat and cleanup work")
+
+
+def test_disconnect_after_event_unsubscribes():
+    """A client that went away is noticed after the next event, not only at the heartbeat"""
+    print("🧪 Testing disconnect detection...")
+
+    class _GoneRequest:
+        async def is_disconnected(self):
+            return True
+
+    async def scenario():
+        bus = data_service.get_event_bus()
+        subscribers = len(bus)
+        stream = events._event_stream(_GoneRequest())
+        await stream.__anext__()
+        bus.publish({"type": "changes", "version": 1, "changes": []})
+        assert (await stream.__anext__()).startswith("event: changes\n")
+        try:
+            await stream.__anext__()
+            assert False, "stream should have ended"
+        except StopAsyncIteration:
+            pass
+        assert len(bus) == subscribers
+
+    asyncio.run(scenario())
+    print("   ✅ Stream ends and unsubscribes")
+
+
+def test_cap_returns_503():
+    """The endpoint refuses new subscribers once the cap is reached"""
+    print("🧪 Testing 503 at subscriber cap...")
+    with temp_client() as client:
+        bus = data_service.get_event_bus()
+        original_cap = bus.max_subscribers
+        bus.max_subscribers = len(bus)
+        try:
+            assert client.get("/api/events").status_code == 503
+        finally:
+            bus.max_subscribers = original_cap
+        print("   ✅ 503 when full")
+
+
+if __name__ == "__main__":
+    test_slow_consumer_gets_resync()
+    test_subscriber_cap()
+    test_save_publishes_item_changes()
+    test_stream_frames_and_heartbeat()
+    test_disconnect_after_event_unsubscribes()
+    test_cap_returns_503()
+    print("\n🎉 All event stream tests passed!")
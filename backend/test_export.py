@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""
+Test script for GET /api/export (streamed NDJSON/CSV/JSON export)
+"""
+import gzip
+import json
+import time
+import tracemalloc
+from fastapi.testclient import TestClient
+from models import Item
+from services import data_service
+from services.item_record import make_item_record
+from services.item_transfer import encode_chunks, iter_csv, iter_json, iter_ndjson
+from test_support import temp_client
+
+
+def _new_item(name: str, section: str = "Kanji", **fields) -> dict:
+    return {"name": name, "section": section, "created_date": "", "last_accessed": "", **fields}
+
+
+def _seed(client: TestClient) -> None:
+    client.post("/api/items", json=_new_item("漢字", answer_text="line one\nline two, \"quoted\"", problem_images=["a.png"]))
+    client.post("/api/items", json=_new_item("Reviewed", "Grammar", reviewed=True, review_dates=["2025-07-01"]))
+    client.post("/api/items", json=_new_item("Archived", archived=True))
+
+
+def _sorted(items: list) -> list:
+    return sorted(items, key=lambda item: item["name"])
+
+
+def test_ndjson_export():
+    """One item per line, archived items only on request, version headers set"""
+    print("🧪 Testing NDJSON export...")
+    with temp_client() as client:
+        _seed(client)
+        response = client.get("/api/export")
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/x-ndjson"
+        assert response.headers["x-data-version"] == str(data_service.get_data_version())
+        assert response.headers["etag"] == f'"{data_service.get_data_version()}-ndjson"'
+        assert "attachment" in response.headers["content-disposition"]
+
+        exported = [json.loads(line) for line in response.text.splitlines()]
+        assert _sorted(exported) == _sorted(client.get("/api/items").json())
+        with_archived = client.get("/api/export", params={"include_archived": True}).text.splitlines()
+        assert len(exported) == 2 and len(with_archived) == 3
+        assert client.get("/api/export", params={"format": "xml"}).status_code == 422
+        print("   ✅ Active items by default, headers carry the snapshot version")
+
+
+def test_json_export_is_a_data_file():
+    """format=json has the data file layout, categories and settings included"""
+    print("🧪 Testing JSON export...")
+    with temp_client() as client:
+        _seed(client)
+        exported = client.get("/api/export", params={"format": "json", "include_archived": True}).json()
+        stored = data_service.dump_app_data(data_service.load_data())
+        assert _sorted(exported["items"]) == _sorted(stored["items"])
+        assert {key: value for key, value in exported.items() if key != "items"} == \
+            {key: value for key, value in stored.items() if key != "items"}
+        print("   ✅ Same shape and content as mnemos_data.json")
+
+
+def test_csv_round_trip():
+    """A CSV export imports back into an empty deck unchanged"""
+    print("🧪 Testing CSV export → import...")
+    with temp_client() as client:
+        _seed(client)
+        original = client.get("/api/export", params={"format": "csv", "include_archived": True})
+        assert original.headers["content-type"].startswith("text/csv")
+
+        with temp_client() as fresh:
+            report = fresh.post("/api/items/import", params={"format": "csv"}, content=original.content).json()
+            assert (report["imported"], report["failed"]) == (3, 0)
+            again = fresh.get("/api/export", params={"format": "csv", "include_archived": True})
+            assert sorted(again.text.splitlines()) == sorted(original.text.splitlines())
+            print("   ✅ Lists, booleans, quotes and newlines survive the round trip")
+
+
+def test_gzip_export():
+    """gzip=true streams the same content compressed"""
+    print("🧪 Testing gzip export...")
+    with temp_client() as client:
+        _seed(client)
+        plain = client.get("/api/export", params={"format": "json"}).content
+        response = client.get("/api/export", params={"format": "json", "gzip": True})
+        assert response.headers["content-type"] == "application/gzip"
+        assert response.headers["content-disposition"].endswith('.json.gz"')
+        assert gzip.decompress(response.content) == plain
+        print("   ✅ Decompresses to the plain export")
+
+
+def test_snapshot_ignores_later_changes():
+    """Changes made while an export is streaming don't leak into it"""
+    print("🧪 Testing export snapshot consistency...")
+    with temp_client() as client:
+        for i in range(50):
+            client.post("/api/items", json=_new_item(f"Card {i:02d}"))
+        version, items, meta, categories = data_service.get_export_snapshot()
+        expected = list(iter_ndjson(items, categories))
+
+        parts = iter_ndjson(items, categories)
+        streamed = [next(parts) for _ in range(10)]
+        first_id = json.loads(streamed[0])["id"]
+        last_id = json.loads(expected[-1])["id"]
+        data_service.rename_category("Kanji", "Kana")
+        data_service.remove_item(last_id)
+        data_service.replace_item(json.loads(expected[20])["id"], Item(**_new_item("Edited")))
+        data_service.add_item(Item(**_new_item("Added", id="added")))
+        streamed.extend(parts)
+
+        assert streamed == expected
+        assert data_service.get_data_version() > version
+        assert data_service.get_item(first_id).section == "Kana"
+        print("   ✅ Rename, delete, edit and add during the stream are not in the export")
+
+
+def benchmark_export(count: int = 100_000):
+    """Export memory stays flat as the deck grows"""
+    print(f"\n📊 Benchmarking export of {count:,} items...")
+    items = [make_item_record({
+        "id": f"item-{i}", "name": f"Item {i}", "section": "Kanji", "problem_text": f"Question {i}",
+        "review_dates": ["2025-01-01", "2025-02-01"], "created_date": "2025-01-01T08:00:00",
+        "last_accessed": "2025-01-01T08:00:00"
+    }) for i in range(count)]
+    meta = {"categories": ["Kanji"], "settings": {}, "last_updated": ""}
+
+    for name, parts, compress in [
+        ("ndjson", lambda: iter_ndjson(items), False),
+        ("csv", lambda: iter_csv(items), False),
+        ("json+gzip", lambda: iter_json(items, meta), True),
+    ]:
+        start = time.perf_counter()
+        size = sum(len(chunk) for chunk in encode_chunks(parts(), gzip=compress))
+        elapsed = time.perf_counter() - start
+
+        # Separate pass - tracing slows the encode down several times
+        tracemalloc.start()
+        for _ in encode_chunks(parts(), gzip=compress):
+            pass
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        print(f"   {name:10s} {size / 1024 / 1024:6.1f} MB in {elapsed:.2f}s, peak memory {peak / 1024:.0f} KB")
+
+
+if __name__ == "__main__":
+    test_ndjson_export()
+    test_json_export_is_a_data_file()
+    test_csv_round_trip()
+    test_gzip_export()
+    test_snapshot_ignores_later_changes()
+    benchmark_export()
+    print("\n🎉 All export tests passed!")
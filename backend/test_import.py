@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""
+Test script for POST /api/items/import (streamed NDJSON/CSV bulk import)
+"""
+import asyncio
+import json
+import time
+import tracemalloc
+from services import data_service
+from services.item_transfer import iter_import_records
+from test_support import temp_client
+
+
+def _chunked(text: str, size: int = 7):
+    """Body as small byte chunks, splitting lines and multi-byte characters"""
+    body = text.encode("utf-8")
+    for start in range(0, len(body), size):
+        yield body[start:start + size]
+
+
+def _ndjson_lines(count: int, section: str = "Imported"):
+    for i in range(count):
+        yield json.dumps({"name": f"Card {i}", "section": section, "problem_text": "漢字 " * 5}) + "\n"
+
+
+def test_ndjson_import():
+    """Valid lines are imported in chunks, bad lines reported with their line number"""
+    print("🧪 Testing NDJSON import...")
+    with temp_client() as client:
+        body = "\n".join([
+            json.dumps({"name": "漢字", "section": "Kanji"}),
+            json.dumps({"name": "Missing section"}),
+            "{not json",
+            "",
+            json.dumps(["not", "an", "object"]),
+            json.dumps({"name": "Grammar 1", "section": "Grammar", "review_dates": ["2025-07-01"]}),
+            json.dumps({"name": "Grammar 2", "section": "Grammar", "created_date": "2024-01-01T00:00:00"}),
+            json.dumps({"name": "Kept id", "section": "Kanji", "id": "fixed-id"}),
+        ])
+        response = client.post("/api/items/import", params={"chunk_size": 2}, content=_chunked(body))
+        assert response.status_code == 200, response.text
+        report = response.json()
+        assert (report["format"], report["imported"], report["failed"], report["chunks"]) == ("ndjson", 4, 3, 2)
+        assert [error["line"] for error in report["errors"]] == [2, 3, 5]
+        assert "section" in report["errors"][0]["error"]
+
+        items = {item["name"]: item for item in client.get("/api/items").json()}
+        assert set(items) == {"漢字", "Grammar 1", "Grammar 2", "Kept id"}
+        assert all(item["id"] and item["revision"] == 1 for item in items.values())
+        assert items["Kept id"]["id"] == "fixed-id"
+        assert items["Grammar 2"]["created_date"] == "2024-01-01T00:00:00"
+        assert items["Grammar 1"]["review_dates"] == ["2025-07-01"]
+        assert client.get("/api/categories").json() == ["Default", "Kanji", "Grammar"]
+
+        # Re-importing a taken id is reported, not duplicated
+        again = client.post("/api/items/import", content=json.dumps({"name": "Again", "section": "Kanji", "id": "fixed-id"}))
+        assert (again.json()["imported"], again.json()["errors"][0]["line"]) == (0, 1)
+        assert len(data_service._load_from_local_file().items) == 4
+        print("   ✅ 4 imported in 2 chunks, 3 lines reported")
+
+
+def test_csv_import():
+    """CSV with a header row, quoted multi-line cells and JSON list cells"""
+    print("🧪 Testing CSV import...")
+    with temp_client() as client:
+        body = (
+            "name,section,answer_text,problem_images,reviewed\r\n"
+            'First,Words,"line one\nline two, with comma",[],true\r\n'
+            'Second,Words,"say ""hi""","[""a.png"", ""b.png""]",\r\n'
+            "Short row,Words\r\n"
+            "Bad list,Words,,a.png,false\r\n"
+        )
+        response = client.post(
+            "/api/items/import",
+            content=_chunked(body, 5),
+            headers={"Content-Type": "text/csv; charset=utf-8"}
+        )
+        assert response.status_code == 200, response.text
+        report = response.json()
+        assert (report["format"], report["imported"], report["failed"]) == ("csv", 2, 2)
+        assert [error["line"] for error in report["errors"]] == [5, 6]
+
+        items = {item["name"]: item for item in client.get("/api/items").json()}
+        assert items["First"]["answer_text"] == "line one\nline two, with comma"
+        assert items["First"]["reviewed"] is True
+        assert items["Second"]["answer_text"] == 'say "hi"'
+        assert items["Second"]["problem_images"] == ["a.png", "b.png"]
+        assert items["Second"]["reviewed"] is False
+
+        bad_header = client.post("/api/items/import", params={"format": "csv"}, content="name,colour\nA,red\n")
+        assert bad_header.status_code == 400
+        assert len(client.get("/api/items").json()) == 2
+        print("   ✅ Quoted cells and lists parsed, short rows reported")
+
+
+def test_overlong_lines_are_skipped():
+    """A line over the limit is reported without buffering all of it"""
+    print("🧪 Testing overlong lines...")
+
+    async def chunks():
+        yield b'{"name": "ok", "section": "A"}\n{"name": "'
+        for _ in range(100):
+            yield b"x" * 1000
+        yield b'", "section": "A"}\n{"name": "after", "section": "A"}'
+
+    async def collect():
+        return [record async for record in iter_import_records(chunks(), max_line_chars=10_000)]
+
+    records = asyncio.run(collect())
+    assert [(line, fields and fields["name"], error is not None) for line, fields, error in records] == [
+        (1, "ok", False), (2, None, True), (3, "after", False)
+    ]
+    print("   ✅ Overlong line reported, stream resynced on the next line")
+
+
+def benchmark_import(count: int = 100_000):
+    """Parse memory stays flat; end-to-end import of `count` cards"""
+    print(f"\n📊 Benchmarking import of {count:,} cards...")
+
+    async def chunks():
+        batch = []
+        for line in _ndjson_lines(count):
+            batch.append(line)
+            if len(batch) == 200:
+                yield "".join(batch).encode()
+                batch = []
+        yield "".join(batch).encode()
+
+    async def parse_only():
+        parsed = 0
+        async for _, fields, _ in iter_import_records(chunks()):
+            parsed += fields is not None
+        return parsed
+
+    tracemalloc.start()
+    assert asyncio.run(parse_only()) == count
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    body_bytes = sum(len(line.encode()) for line in _ndjson_lines(count))
+    print(f"   Parse peak memory: {peak / 1024:.0f} KB for a {body_bytes / 1024 / 1024:.1f} MB body")
+
+    with temp_client() as client:
+        start = time.perf_counter()
+        response = client.post(
+            "/api/items/import",
+            params={"chunk_size": 10_000},
+            content=(line.encode() for line in _ndjson_lines(count))
+        )
+        elapsed = time.perf_counter() - start
+        assert response.json()["imported"] == count
+        print(f"   Import: {elapsed:.1f}s ({count / elapsed:,.0f} items/s, {response.json()['chunks']} commits)")
+
+
+if __name__ == "__main__":
+    test_ndjson_import()
+    test_csv_import()
+    test_overlong_lines_are_skipped()
+    benchmark_import()
+    print("\n🎉 All import tests passed!")
@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+"""
+Test script and benchmark for the O(1) item-by-ID index
+"""
+import statistics
+import time
+from datetime import datetime
+from models import Item, AppData
+from services import data_service
+from services.item_index import ItemIndex
+
+
+def _make_items(count: int, prefix: str = "item") -> list:
+    now = datetime.now().isoformat()
+    return [
+        Item(
+            id=f"{prefix}-{i}",
+            name=f"Item {i}",
+            section="Bench",
+            created_date=now,
+            last_accessed=now
+        )
+        for i in range(count)
+    ]
+
+
+def test_index_operations():
+    """Lookup, replace and remove stay consistent with the backing list"""
+    print("🧪 Testing ItemIndex operations...")
+    items = _make_items(5)
+    index = ItemIndex(items)
+
+    assert len(index) == 5
+    assert index.get("item-3").name == "Item 3"
+    assert index.get("missing") is None
+
+    replacement = items[2].copy()
+    replacement.name = "Replaced"
+    old = index.replace("item-2", replacement)
+    assert old.name == "Item 2"
+    assert index.get("item-2").name == "Replaced"
+    assert index.replace("missing", replacement) is None
+
+    removed = index.remove("item-1")
+    assert removed.id == "item-1"
+    assert index.remove("item-1") is None
+    assert len(items) == 4
+    assert "item-1" not in index
+    # Every remaining position must still resolve to the right item
+    for item in items:
+        assert index.get(item.id) is item
+
+    # Removing the last element must not corrupt the index
+    index.remove(items[-1].id)
+    for item in items:
+        assert index.get(item.id) is item
+
+    new_items = _make_items(1, prefix="new")
+    index.append(new_items[0])
+    assert index.get("new-0") is items[-1]
+    print("   ✅ ItemIndex operations consistent")
+
+
+def test_data_service_helpers():
+    """data_service helpers keep the index in sync with AppData.items"""
+    print("🧪 Testing data_service item helpers...")
+    data_service._cached_data = AppData(
+        items=_make_items(3),
+        categories=["Bench"],
+        last_updated=datetime.now().isoformat()
+    )
+    data_service._rebuild_indexes()
+
+    assert data_service.get_item("item-0").name == "Item 0"
+    extra = _make_items(1, prefix="extra")[0]
+    data_service.add_item(extra)
+    assert data_service.get_item("extra-0") is extra
+    assert data_service.remove_item("item-0").id == "item-0"
+    assert data_service.get_item("item-0") is None
+    assert len(data_service.load_data().items) == 3
+
+    # Out-of-band list replacement is detected and the index rebuilt
+    data_service.load_data().items = _make_items(2, prefix="oob")
+    assert data_service.get_item("oob-1").name == "Item 1"
+    assert data_service.get_item("extra-0") is None
+    print("   ✅ Helpers stay in sync with AppData.items")
+
+
+def test_bad_ids_fixed_on_load():
+    """Missing and duplicate IDs get fresh ones instead of forcing a rebuild on every call"""
+    print("🧪 Testing missing/duplicate item IDs...")
+    items = _make_items(4)
+    items[2].id = "item-0"
+    items[3].id = None
+    data_service._cached_data = AppData(items=items, categories=["Bench"], last_updated=datetime.now().isoformat())
+    data_service._rebuild_indexes()
+
+    ids = [item.id for item in items]
+    assert ids[:2] == ["item-0", "item-1"] and len(set(ids)) == 4 and None not in ids
+    assert data_service.get_item("item-0") is items[0]
+    version = data_service.get_data_version()
+    for item_id in ids:
+        assert data_service.get_item(item_id) is not None
+    assert data_service.get_data_version() == version
+    print("   ✅ IDs made unique once, index stays in sync")
+
+
+def test_cache_deltas():
+    """Active/archived caches follow insert/update/delete/archive transitions"""
+    print("🧪 Testing incremental active/archived caches...")
+    data_service._cached_data = AppData(
+        items=_make_items(4),
+        categories=["Bench"],
+        last_updated=datetime.now().isoformat()
+    )
+    data_service._rebuild_indexes()
+    active = data_service.get_active_items()
+    assert len(active) == 4 and data_service.get_archived_items() == []
+
+    # Archive transition moves the item to the other cache
+    archived = data_service.get_item("item-1").copy()
+    archived.archived = True
+    data_service.replace_item("item-1", archived)
+    assert "item-1" not in [item.id for item in data_service.get_active_items()]
+    assert data_service.get_archived_items() == [archived]
+
+    # Plain update keeps the item's position in the active cache
+    position = [item.id for item in data_service.get_active_items()].index("item-2")
+    renamed = data_service.get_item("item-2").copy()
+    renamed.name = "Renamed"
+    data_service.replace_item("item-2", renamed)
+    assert data_service.get_active_items()[position] is renamed
+
+    data_service.add_item(_make_items(1, prefix="new")[0])
+    data_service.remove_item("item-0")
+    data_service.remove_item("item-1")
+
+    # The incremental caches must match a from-scratch split
+    items = data_service.load_data().items
+    assert sorted(i.id for i in data_service.get_active_items()) == sorted(i.id for i in items if not i.archived)
+    assert data_service.get_archived_items() == []
+    # The active cache is the same list object the /api/items fast path serves
+    assert data_service.get_active_items() is active
+    print("   ✅ Caches consistent without full rebuilds")
+
+
+def _time_operations(index: ItemIndex, size: int, rounds: int = 2000) -> float:
+    """Median per-operation latency (µs) for a lookup + replace + remove + append cycle"""
+    samples = []
+    for r in range(rounds):
+        item_id = f"item-{(r * 7919) % size}"
+        start = time.perf_counter()
+        item = index.get(item_id)
+        index.replace(item_id, item)
+        index.remove(item_id)
+        index.append(item)
+        samples.append((time.perf_counter() - start) * 1_000_000)
+    return statistics.median(samples)
+
+
+def benchmark_item_index(sizes=(1_000, 10_000, 100_000, 500_000)) -> dict:
+    """Print per-mutation latency at increasing deck sizes"""
+    print("\n📊 ItemIndex benchmark (lookup + replace + remove + append)")
+    results = {}
+    for size in sizes:
+        index = ItemIndex(_make_items(size))
+        results[size] = _time_operations(index, size)
+        print(f"   {size:>8} items: {results[size]:.2f}µs per cycle")
+    return results
+
+
+def test_latency_is_flat():
+    """Per-mutation latency should not grow with deck size"""
+    results = benchmark_item_index(sizes=(1_000, 100_000))
+    assert results[100_000] < results[1_000] * 10
+
+
+if __name__ == "__main__":
+    test_index_operations()
+    test_data_service_helpers()
+    test_bad_ids_fixed_on_load()
+    test_cache_deltas()
+    benchmark_item_index()
+    print("\n🎉 All item index tests passed!")
@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+Test script for journal mode: per-mutation records, replay and compaction
+"""
+import asyncio
+import os
+from contextlib import contextmanager
+from datetime import datetime
+from models import Item, Settings
+from services import data_service
+from test_support import temp_storage
+
+
+@contextmanager
+def _journal_mode(compact_every: int = 500):
+    """Point data_service at a fresh temp directory with journal mode on, restored afterwards"""
+    saved = data_service.DATA_JOURNAL_ENABLED, data_service.DATA_JOURNAL_COMPACT_EVERY
+    data_service.DATA_JOURNAL_ENABLED = True
+    data_service.DATA_JOURNAL_COMPACT_EVERY = compact_every
+    try:
+        with temp_storage():
+            data_service.initialize_default_data()
+            yield
+    finally:
+        data_service.DATA_JOURNAL_ENABLED, data_service.DATA_JOURNAL_COMPACT_EVERY = saved
+
+
+def _make_item(item_id: str, section: str = "Default") -> Item:
+    now = datetime.now().isoformat()
+    return Item(id=item_id, name=f"Item {item_id}", section=section, created_date=now, last_accessed=now)
+
+
+def _journal_lines() -> int:
+    path = data_service.DATA_FILE + ".journal"
+    if not os.path.exists(path):
+        return 0
+    with open(path) as f:
+        return sum(1 for _ in f)
+
+
+def test_mutations_are_journaled_and_replayed():
+    """Each mutation appends a record; a reload rebuilds the same state"""
+    print("🧪 Testing journal append + replay...")
+    with _journal_mode():
+        async def run():
+            data = data_service.load_data()
+            # First save after load writes the snapshot
+            data_service.add_item(_make_item("a"))
+            await data_service.save_data(data)
+            assert _journal_lines() == 0
+
+            data_service.add_item(_make_item("b"))
+            await data_service.save_data(data)
+            data_service.add_category("Kanji")
+            data_service.replace_item("a", _make_item("a", section="Kanji"))
+            await data_service.save_data(data)
+            data_service.update_settings(Settings(confident_days=10, medium_days=4, wtf_days=2))
+            await data_service.save_data(data)
+            data_service.rename_category("Kanji", "漢字")
+            await data_service.save_data(data)
+            data_service.remove_item("b")
+            await data_service.save_data(data)
+            return data
+
+        data = asyncio.run(run())
+        assert _journal_lines() == 6
+        print(f"   ✅ {_journal_lines()} journal records written")
+
+        reloaded = data_service._load_from_local_file()
+        assert [item.id for item in reloaded.items] == ["a"]
+        assert reloaded.items[0].section == "漢字"
+        assert reloaded.categories == data.categories
+        assert reloaded.settings.confident_days == 10
+        assert reloaded.last_updated == data.last_updated
+        print("   ✅ Snapshot + journal replay matches in-memory state")
+
+
+def test_compaction():
+    """The journal is folded into a new snapshot after N records"""
+    print("🧪 Testing snapshot + compaction...")
+    with _journal_mode(compact_every=5):
+        async def run():
+            data = data_service.load_data()
+            for i in range(12):
+                data_service.add_item(_make_item(f"item-{i}"))
+                await data_service.save_data(data)
+
+        asyncio.run(run())
+        assert _journal_lines() <= 5
+        reloaded = data_service._load_from_local_file()
+        assert len(reloaded.items) == 12
+        print(f"   ✅ Journal compacted ({_journal_lines()} records left), 12 items after replay")
+
+
+def test_torn_record_is_ignored():
+    """A partially written trailing record does not break startup"""
+    print("🧪 Testing torn journal record...")
+    with _journal_mode():
+        async def run():
+            data = data_service.load_data()
+            data_service.add_item(_make_item("a"))
+            await data_service.save_data(data)
+            data_service.add_item(_make_item("b"))
+            await data_service.save_data(data)
+
+        asyncio.run(run())
+        with open(data_service.DATA_FILE + ".journal", "a") as f:
+            f.write('{"op":"item_delete","id":"a"')
+        reloaded = data_service._load_from_local_file()
+        assert sorted(item.id for item in reloaded.items) == ["a", "b"]
+        print("   ✅ Torn record ignored")
+
+
+if __name__ == "__main__":
+    test_mutations_are_journaled_and_replayed()
+    test_compaction()
+    test_torn_record_is_ignored()
+    print("\n🎉 All journal tests passed!")
@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""
+Test script and peak-memory benchmark for the streaming JSON loader
+"""
+import asyncio
+import gc
+import io
+import json
+import os
+import tempfile
+import tracemalloc
+from services import data_service
+from services.data_service import _parse_data_stream, _process_data_dict, dump_app_data
+from services.json_stream import iter_members
+from test_support import temp_storage
+
+
+def _document(count: int) -> dict:
+    return {
+        "categories": ["日本語", "Math"],
+        "items": [
+            {
+                "id": f"item-{i}",
+                "name": f"項目 {i}",
+                "section": "日本語" if i % 2 else "Math",
+                "problem_image": "/images/legacy.png" if i == 0 else None,
+                "problem_text": "x" * (i % 50),
+                "review_dates": ["2025-01-01T08:00:00"] * (i % 3),
+                "next_review_date": "2025-02-01" if i % 3 else None,
+                "created_date": "2025-01-01T00:00:00",
+                "last_accessed": "2025-01-01T00:00:00",
+                "revision": i
+            }
+            for i in range(count)
+        ],
+        "settings": {"confident_days": 7, "medium_days": 3, "wtf_days": 1},
+        "last_updated": "2025-02-22T09:00:00"
+    }
+
+
+def _collect(text: str, chunk_size: int) -> dict:
+    result = {}
+    for key, value in iter_members(io.StringIO(text), chunk_size=chunk_size):
+        if key == "items":
+            result.setdefault("items", []).append(value)
+        else:
+            result[key] = value
+    return result
+
+
+def test_parser_matches_json_loads():
+    """Any chunk size gives the same result as json.loads"""
+    print("🧪 Testing incremental parser against json.loads...")
+    cases = [
+        json.dumps(_document(25), indent=2, ensure_ascii=False),
+        json.dumps(_document(25), separators=(",", ":")),
+        '{"items": [], "n": 12345678901234567890, "f": -1.5e10, "nested": {"items": [1, [2]]}}',
+        '{}',
+        ' { "items" : [ {"a": 1} , {"b": "\\u00e9\\"}"} ] } '
+    ]
+    for text in cases:
+        expected = json.loads(text)
+        for chunk_size in (1, 3, 7, 64, 65536):
+            result = _collect(text, chunk_size)
+            if "items" in expected and not expected["items"]:
+                result.setdefault("items", [])
+            assert result == expected, (text[:40], chunk_size)
+    print("   ✅ Identical results for chunk sizes 1..64k")
+
+
+def test_parser_rejects_malformed():
+    """Broken documents raise ValueError instead of returning partial data"""
+    print("🧪 Testing malformed input...")
+    for text in ['{"items": [1, 2', '{"items": [1 2]}', '[1, 2]', '{"a": 1 "b": 2}', '{"a": tru}', '']:
+        try:
+            _collect(text, 4)
+            assert False, f"expected ValueError for {text!r}"
+        except ValueError:
+            pass
+    print("   ✅ Malformed input rejected")
+
+
+def test_stream_loader_matches_dict_loader():
+    """_parse_data_stream builds the same AppData as the old json.load path"""
+    print("🧪 Testing streamed AppData against json.load + _process_data_dict...")
+    text = json.dumps(_document(200), indent=2)
+    streamed = _parse_data_stream(io.StringIO(text))
+    assert dump_app_data(streamed) == _process_data_dict(json.loads(text)).dict()
+    assert streamed.items[0].problem_images == ["/images/legacy.png"]
+    print("   ✅ Same data, legacy migration applied per item")
+
+
+def test_load_paths_use_streaming():
+    """Storage and local-file loads go through the streaming parser"""
+    print("🧪 Testing storage and local file load paths...")
+    document = _document(50)
+    with temp_storage() as directory:
+        for path in (data_service.DATA_FILE, os.path.join(directory, "storage", "mnemos_data.json")):
+            with open(path, "w") as f:
+                json.dump(document, f, indent=2)
+
+        from_storage = asyncio.run(data_service._load_from_storage())
+        from_file = data_service._load_from_local_file()
+    expected = _process_data_dict(_document(50)).dict()
+    assert dump_app_data(from_storage) == expected and dump_app_data(from_file) == expected
+    print("   ✅ Both load paths stream")
+
+
+def _peak_during(load) -> tuple:
+    """(peak, retained) bytes allocated while running load()"""
+    gc.collect()
+    tracemalloc.start()
+    data = load()
+    retained = tracemalloc.get_traced_memory()[0]
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    del data
+    return peak, retained
+
+
+def benchmark_peak_memory(count: int = 20_000) -> dict:
+    """Peak memory of json.load + validation vs. the streaming loader"""
+    print(f"\n📊 Peak memory while loading {count} items")
+    path = os.path.join(tempfile.mkdtemp(), "mnemos_data.json")
+    with open(path, "w") as f:
+        json.dump(_document(count), f, indent=2)
+
+    def load_whole():
+        with open(path) as f:
+            return _process_data_dict(json.load(f))
+
+    def load_streaming():
+        with open(path) as f:
+            return _parse_data_stream(f)
+
+    results = {}
+    for name, load in (("json.load", load_whole), ("streaming", load_streaming)):
+        peak, retained = _peak_during(load)
+        results[name] = (peak, retained)
+        print(f"   {name:<10} peak {peak / 1e6:6.1f}MB, steady state {retained / 1e6:6.1f}MB "
+              f"({peak / retained:.2f}x)")
+    return results
+
+
+def test_streaming_peak_memory():
+    """Streaming peak stays close to the steady state; json.load does not"""
+    results = benchmark_peak_memory()
+    stream_peak, stream_retained = results["streaming"]
+    whole_peak, whole_retained = results["json.load"]
+    assert stream_peak < stream_retained * 1.1
+    assert stream_peak < whole_peak
+
+
+if __name__ == "__main__":
+    test_parser_matches_json_loads()
+    test_parser_rejects_malformed()
+    test_stream_loader_matches_dict_loader()
+    test_load_paths_use_streaming()
+    benchmark_peak_memory(100_000)
+    print("\n🎉 All streaming loader tests passed!")
@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+"""
+Test script and benchmark for lazy item hydration (ItemRecord)
+"""
+import gc
+import json
+import time
+import tracemalloc
+from pydantic import ValidationError
+from models import Item
+from services import data_service
+from services.data_service import _process_data_dict, dump_app_data
+from services.item_record import ItemRecord, make_item_record
+from services.response_cache import encode_json
+from test_support import loaded_client
+
+
+def _document(count: int) -> dict:
+    return {
+        "items": [
+            {
+                "id": f"item-{i}",
+                "name": f"Item {i}",
+                "section": "Kanji" if i % 2 else "Math",
+                "problem_text": f"Question {i}",
+                "reviewed": i % 3 == 0,
+                "next_review_date": "2025-01-01" if i % 4 else None,
+                "review_dates": ["2024-12-01T08:00:00"] * (i % 3),
+                "created_date": "2024-01-01T00:00:00",
+                "last_accessed": "2024-01-01T00:00:00",
+                "archived": i % 10 == 0
+            }
+            for i in range(count)
+        ],
+        "categories": ["Kanji", "Math"],
+        "settings": {"confident_days": 7, "medium_days": 3, "wtf_days": 1},
+        "last_updated": "2025-01-01T00:00:00"
+    }
+
+
+def _hydrated_count() -> int:
+    return sum(not isinstance(item, ItemRecord) for item in data_service.load_data().items)
+
+
+def test_reads_serve_raw_records():
+    """List endpoints serialize records directly, byte-identical to Items"""
+    print("🧪 Testing reads without hydration...")
+    document = _document(50)
+    with loaded_client(document) as client:
+        assert _hydrated_count() == 0
+
+        eager = _process_data_dict(json.loads(json.dumps(document)))
+        expected_active = [item for item in eager.items if not item.archived]
+        response = client.get("/api/items")
+        assert response.content == encode_json(expected_active)
+        assert client.get("/api/items", params={"fields": "id,name", "limit": 5}).json()["items"][0] == \
+            {"id": "item-1", "name": "Item 1"}
+        assert client.get("/api/data").json()["items"] == json.loads(encode_json(expected_active))
+        assert client.get("/api/review/queue", params={"today": "2025-06-01"}).json()["count"] > 0
+        assert client.get("/api/items/search", params={"q": "question"}).json()["count"] > 0
+        assert _hydrated_count() == 0
+        print("   ✅ No item hydrated by list, page, search or queue reads")
+
+
+def test_get_item_hydrates_once():
+    """get_item() validates a record into an Item and swaps it into every cache"""
+    print("🧪 Testing hydration on access...")
+    with loaded_client(_document(10)):
+        position = [item.id for item in data_service.get_active_items()].index("item-3")
+
+        item = data_service.get_item("item-3")
+        assert isinstance(item, Item)
+        assert data_service.get_item("item-3") is item
+        assert data_service.get_active_items()[position] is item
+        assert _hydrated_count() == 1
+        print("   ✅ Hydrated once, in place")
+
+
+def test_mutations_on_records():
+    """Updates, deletes and renames work on un-hydrated items and persist"""
+    print("🧪 Testing mutations on records...")
+    with loaded_client(_document(20)) as client:
+
+        update = {"name": "Updated", "section": "Kanji", "created_date": "", "last_accessed": ""}
+        assert client.put("/api/items/item-1", json=update).json()["revision"] == 1
+        assert client.delete("/api/items/item-2").status_code == 200
+        assert client.put("/api/categories/Math", json={"name": "Algebra"}).json()["items_updated"] == 9
+        # The rename only changed the category registry - still not hydrated
+        assert _hydrated_count() == 1
+
+        saved = data_service._load_from_local_file()
+        assert dump_app_data(saved) == dump_app_data(data_service.load_data())
+        assert {item.section for item in saved.items} == {"Kanji", "Algebra"}
+        print("   ✅ Mutations persisted")
+
+
+def test_hydration_validates():
+    """A bad record still serializes but fails validation when hydrated"""
+    print("🧪 Testing validation at hydration...")
+    document = _document(3)
+    document["items"][1]["reviewed"] = "not a bool"
+    with loaded_client(document) as client:
+        assert client.get("/api/items").status_code == 200
+        try:
+            data_service.get_item("item-1")
+            assert False, "expected ValidationError"
+        except ValidationError:
+            pass
+        print("   ✅ Validation deferred to hydration")
+
+
+def test_make_item_record_normalizes():
+    """Missing defaults are filled, unknown keys dropped, required fields enforced"""
+    print("🧪 Testing record normalization...")
+    record = make_item_record({"name": "n", "section": "s", "created_date": "", "last_accessed": "", "extra": 1})
+    assert dict(record) == Item(name="n", section="s", created_date="", last_accessed="").dict()
+    assert list(record) == list(Item.model_fields)
+    assert record.problem_images is not make_item_record(dict(record, problem_images=[])).problem_images
+    try:
+        make_item_record({"name": "n"})
+        assert False, "expected ValueError"
+    except ValueError:
+        pass
+    print("   ✅ Records match the Item schema")
+
+
+def benchmark_lazy_load(count: int = 50_000) -> dict:
+    """Load time and retained memory: validated Items vs. ItemRecords"""
+    print(f"\n📊 Load benchmark ({count} items)")
+    # Stored items carry every field - that is what save_data writes
+    items = [Item(**raw).dict() for raw in _document(count)["items"]]
+    results = {}
+    for name, build in (("Item", lambda raw: Item(**raw)), ("ItemRecord", make_item_record)):
+        # Timed without tracemalloc - its per-allocation hook skews the comparison
+        gc.collect()
+        start = time.perf_counter()
+        loaded = [build(dict(raw)) for raw in items]
+        seconds = time.perf_counter() - start
+        del loaded
+        gc.collect()
+        tracemalloc.start()
+        loaded = [build(dict(raw)) for raw in items]
+        retained = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        del loaded
+        results[name] = (seconds, retained)
+        print(f"   {name:<10} {seconds * 1000:7.1f}ms  {retained / count:6.0f} bytes/item")
+    return results
+
+
+def test_records_use_less_memory():
+    """Records retain less memory than validated Items (timing is left to the benchmark)"""
+    print("🧪 Testing record memory footprint...")
+    results = benchmark_lazy_load(20_000)
+    assert results["ItemRecord"][1] < results["Item"][1]
+    print("   ✅ Records are smaller than Items")
+
+
+if __name__ == "__main__":
+    test_reads_serve_raw_records()
+    test_get_item_hydrates_once()
+    test_mutations_on_records()
+    test_hydration_validates()
+    test_make_item_record_normalizes()
+    test_records_use_less_memory()
+    results = benchmark_lazy_load()
+    print(f"   Records load {results['Item'][0] / results['ItemRecord'][0]:.1f}x faster than Items")
+    print("\n🎉 All lazy item tests passed!")
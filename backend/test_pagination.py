@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Test script for cursor pagination and sparse fieldsets on /api/items and /api/data
+"""
+import json
+from datetime import datetime
+from fastapi.testclient import TestClient
+from models import Item, AppData
+from services import data_service
+from test_support import temp_storage
+
+
+def _setup(count: int) -> TestClient:
+    import main
+    now = datetime.now().isoformat()
+    data_service._cached_data = AppData(
+        items=[
+            Item(
+                id=f"item-{i:04d}",
+                name=f"Card {i}",
+                section="Kanji",
+                answer_text="A long answer body " * 50,
+                answer_images=[f"https://example.com/{i}-{n}.jpg" for n in range(3)],
+                next_review_date="2025-07-10",
+                archived=(i % 10 == 9),
+                created_date=now,
+                last_accessed=now
+            )
+            for i in range(count)
+        ],
+        categories=["Kanji"],
+        last_updated=now
+    )
+    data_service._rebuild_indexes()
+    data_service._service_ready = True
+    return TestClient(main.app)
+
+
+def test_cursor_walk_covers_every_active_item_once():
+    """Walking all pages returns each active item exactly once, even with writes in between"""
+    print("🧪 Testing cursor pagination...")
+    with temp_storage():
+        client = _setup(250)
+        seen = []
+        cursor = None
+        deleted = False
+        while True:
+            params = {"limit": 40}
+            if cursor:
+                params["cursor"] = cursor
+            response = client.get("/api/items", params=params)
+            assert response.status_code == 200
+            page = response.json()
+            seen.extend(item["id"] for item in page["items"])
+            if not deleted:
+                # Delete an item we've already seen - must not shift later pages
+                data_service.remove_item(seen[0])
+                deleted = True
+            cursor = page["next_cursor"]
+            if cursor is None:
+                break
+
+        expected = [f"item-{i:04d}" for i in range(250) if i % 10 != 9]
+        assert seen == expected
+        print(f"   ✅ {len(seen)} active items in {len(seen) // 40 + 1} pages, no gaps or duplicates")
+
+
+def test_sparse_fieldsets_shrink_payload():
+    """fields= returns only the requested fields and cuts the payload size"""
+    print("🧪 Testing sparse fieldsets...")
+    with temp_storage():
+        client = _setup(200)
+        full = client.get("/api/items")
+        cards = client.get("/api/items", params={"fields": "name,section,next_review_date"})
+        assert cards.status_code == 200
+        assert set(cards.json()[0]) == {"id", "name", "section", "next_review_date"}
+        ratio = len(full.content) / len(cards.content)
+        print(f"   📊 Full: {len(full.content)} bytes, cards: {len(cards.content)} bytes ({ratio:.0f}x smaller)")
+        assert ratio > 10
+
+        data = client.get("/api/data", params={"fields": "name", "limit": 5}).json()
+        assert len(data["items"]) == 5 and set(data["items"][0]) == {"id", "name"}
+        assert data["categories"] == ["Kanji"] and data["next_cursor"]
+
+        assert client.get("/api/items", params={"fields": "nope"}).status_code == 400
+        assert client.get("/api/items", params={"cursor": "%%%"}).status_code == 400
+        print("   ✅ Projection works and invalid parameters are rejected")
+
+
+def test_single_item_on_demand():
+    """Full bodies load on demand via GET /api/items/{id}"""
+    with temp_storage():
+        client = _setup(3)
+        item = client.get("/api/items/item-0001").json()
+        assert item["answer_text"].startswith("A long answer body")
+        assert client.get("/api/items/missing").status_code == 404
+        # Unparameterized responses keep their original shape
+        assert isinstance(client.get("/api/items").json(), list)
+        assert "next_cursor" not in client.get("/api/data").json()
+
+
+if __name__ == "__main__":
+    test_cursor_walk_covers_every_active_item_once()
+    test_sparse_fieldsets_shrink_payload()
+    test_single_item_on_demand()
+    print("\n🎉 All pagination tests passed!")
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Test script for the write-coalescing persistence queue
+"""
+import asyncio
+from services.persistence_queue import PersistenceQueue
+
+
+class FakeStorage:
+    """Records every upload and simulates network latency"""
+
+    def __init__(self, state: dict, delay: float = 0.02):
+        self.state = state
+        self.delay = delay
+        self.uploads = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def save(self) -> bool:
+        snapshot = dict(self.state)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(self.delay)
+        self.uploads.append(snapshot)
+        self.in_flight -= 1
+        return True
+
+
+def test_burst_is_coalesced():
+    """A burst of 30 saves becomes a single upload of the latest state"""
+    print("🧪 Testing burst coalescing...")
+
+    async def run():
+        state = {"version": 0}
+        storage = FakeStorage(state)
+        queue = PersistenceQueue(storage.save, debounce_seconds=0.05, max_delay_seconds=1.0)
+        for version in range(1, 31):
+            state["version"] = version
+            queue.request_save()
+            await asyncio.sleep(0.001)
+        await queue.flush()
+        return storage, queue
+
+    storage, queue = asyncio.run(run())
+    stats = queue.stats()
+    print(f"   📊 {stats}")
+    assert stats["requested"] == 30
+    assert stats["executed"] == 1
+    assert stats["coalesced"] == 29
+    assert storage.uploads[-1]["version"] == 30
+    print("   ✅ 30 requests → 1 upload of the latest state")
+
+
+def test_single_in_flight_and_ordering():
+    """Saves never overlap and the last upload is always the newest state"""
+    print("🧪 Testing ordering under continuous writes...")
+
+    async def run():
+        state = {"version": 0}
+        storage = FakeStorage(state, delay=0.03)
+        queue = PersistenceQueue(storage.save, debounce_seconds=0.01, max_delay_seconds=0.05)
+        for version in range(1, 101):
+            state["version"] = version
+            queue.request_save()
+            await asyncio.sleep(0.002)
+        await queue.flush()
+        return storage, queue
+
+    storage, queue = asyncio.run(run())
+    versions = [upload["version"] for upload in storage.uploads]
+    print(f"   📊 {len(versions)} uploads for 100 requests: {versions}")
+    assert storage.max_in_flight == 1
+    assert versions == sorted(versions)
+    assert versions[-1] == 100
+    # Max delay forces intermediate uploads even though requests never pause
+    assert 1 < len(versions) < 100
+    print("   ✅ One upload in flight, ordered, bounded delay")
+
+
+if __name__ == "__main__":
+    test_burst_is_coalesced()
+    test_single_in_flight_and_ordering()
+    print("\n🎉 All persistence queue tests passed!")
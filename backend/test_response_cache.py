@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Test script for the version-keyed encoded response cache
+"""
+import asyncio
+import time
+from datetime import datetime
+from fastapi.testclient import TestClient
+from models import Item, AppData
+from services import data_service
+from test_support import temp_storage
+
+
+def test_reads_are_served_from_cache_until_a_write():
+    """Repeated reads hit the cache; any mutation bumps the version and invalidates it"""
+    print("🧪 Testing encoded response cache...")
+    with temp_storage():
+        import main
+        now = datetime.now().isoformat()
+        data_service._cached_data = AppData(
+            items=[Item(id="a", name="Card", section="Kanji", created_date=now, last_accessed=now)],
+            categories=["Kanji"],
+            last_updated=now
+        )
+        data_service._rebuild_indexes()
+        data_service._service_ready = True
+        client = TestClient(main.app)
+
+        first = client.get("/api/items")
+        hits_before = data_service.get_response_cache_stats()["hits"]
+        second = client.get("/api/items")
+        assert first.content == second.content
+        assert data_service.get_response_cache_stats()["hits"] == hits_before + 1
+        assert second.json()[0]["name"] == "Card"
+        assert client.get("/api/categories").json() == ["Kanji"]
+        assert client.get("/api/data").json()["items"][0]["id"] == "a"
+
+        version = data_service.get_data_version()
+        data_service.add_category("Grammar")
+        assert data_service.get_data_version() > version
+        assert client.get("/api/categories").json() == ["Kanji", "Grammar"]
+
+        renamed = data_service.get_item("a").copy()
+        renamed.name = "Renamed"
+        data_service.replace_item("a", renamed)
+        assert client.get("/api/items").json()[0]["name"] == "Renamed"
+        assert client.get("/api/data").json()["items"][0]["name"] == "Renamed"
+        print("   ✅ Cache hits between writes, invalidated by every mutation")
+
+
+def test_version_survives_restart():
+    """A restart resumes above the saved version, even when it is ahead of the clock"""
+    print("🧪 Testing dataset version across a restart...")
+    with temp_storage():
+        now = datetime.now().isoformat()
+        data_service._cached_data = AppData(items=[], categories=["Kanji"], last_updated=now)
+        data_service._rebuild_indexes()
+        # A bulk import moves the version far ahead of the wall clock
+        for _ in range(3):
+            data_service.add_category("Bulk")
+            data_service.remove_category("Bulk")
+        data_service._data_version += 10 ** 12
+        asyncio.run(data_service.save_data(data_service.load_data()))
+        saved = data_service.get_data_version()
+
+        # Restart: the clock seed is below the saved version
+        data_service._data_version = time.time_ns() // 1_000_000
+        data_service._cached_data = data_service._load_from_local_file()
+        assert data_service._cached_data.data_version == saved
+        data_service._rebuild_indexes()
+        assert data_service.get_data_version() > saved
+        print("   ✅ Versions never repeat after a restart")
+
+
+if __name__ == "__main__":
+    test_reads_are_served_from_cache_until_a_write()
+    test_version_survives_restart()
+    print("\n🎉 All response cache tests passed!")
@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+Test script for POST /api/items/{id}/review (server-side scheduling)
+"""
+import json
+from services import data_service
+from test_support import temp_client
+
+TODAY = "2025-07-10"
+
+
+def _new_item(name: str, **fields) -> dict:
+    return {"name": name, "section": "Kanji", "created_date": "", "last_accessed": "", **fields}
+
+
+def test_ratings_follow_settings():
+    """Each rating schedules by its Settings interval and appends today to the history"""
+    print("🧪 Testing review ratings...")
+    with temp_client() as client:
+        client.put("/api/settings", json={"confident_days": 10, "medium_days": 4, "wtf_days": 2})
+        item_id = client.post("/api/items", json=_new_item("Counter")).json()["id"]
+
+        expected = [
+            ({"rating": "confident"}, "2025-07-20"),
+            ({"rating": "medium"}, "2025-07-14"),
+            ({"rating": "wtf"}, "2025-07-12"),
+            ({"rating": "custom", "days": 30}, "2025-08-09"),
+            ({"rating": "custom"}, "2025-07-12"),  # Falls back to wtf_days, like the frontend
+        ]
+        for body, next_date in expected:
+            response = client.post(f"/api/items/{item_id}/review", json={**body, "today": TODAY})
+            assert response.status_code == 200, response.text
+            assert response.json()["next_review_date"] == next_date
+
+        item = response.json()
+        assert item["reviewed"] is True
+        # Re-rating on the same day reschedules without a second history entry
+        assert item["review_dates"] == [TODAY]
+        assert item["revision"] == 1 + len(expected)
+        assert response.headers["etag"] == f'"{item["revision"]}"'
+        print("   ✅ Intervals from Settings, history appended")
+
+
+def test_review_retry_is_idempotent():
+    """Repeating a review (e.g. a retried request) changes nothing"""
+    print("🧪 Testing review retries...")
+    with temp_client() as client:
+        item_id = client.post("/api/items", json=_new_item("Retry", review_dates=["2025-07-01"])).json()["id"]
+        body = {"rating": "medium", "today": TODAY}
+
+        first = client.post(f"/api/items/{item_id}/review", json=body)
+        version = data_service.get_data_version()
+        retried = client.post(f"/api/items/{item_id}/review", json=body)
+        assert retried.status_code == 200
+        assert retried.json() == first.json()
+        assert retried.headers["etag"] == first.headers["etag"]
+        assert data_service.get_data_version() == version
+        assert retried.json()["review_dates"] == ["2025-07-01", TODAY]
+
+        # The next day is a new review again
+        tomorrow = client.post(f"/api/items/{item_id}/review", json={"rating": "medium", "today": "2025-07-11"}).json()
+        assert tomorrow["review_dates"] == ["2025-07-01", TODAY, "2025-07-11"]
+        print("   ✅ Retried reviews are not counted twice")
+
+
+def test_review_updates_queue_and_persists():
+    """A review moves the item out of today's queue and survives a reload"""
+    print("🧪 Testing review side effects...")
+    with temp_client() as client:
+        item_id = client.post("/api/items", json=_new_item("Due", reviewed=True, next_review_date="2025-07-01")).json()["id"]
+        queue = client.get("/api/review/queue", params={"today": TODAY}).json()
+        assert [item["id"] for item in queue["items"]] == [item_id]
+
+        client.post(f"/api/items/{item_id}/review", json={"rating": "medium", "today": TODAY})
+        queue = client.get("/api/review/queue", params={"today": TODAY}).json()
+        assert (queue["count"], queue["total"]) == (0, 0)
+        assert client.get("/api/review/stats", params={"today": TODAY, "days": 7}).json()["upcoming"] == 1
+
+        saved = data_service._load_from_local_file()
+        assert [item.review_dates for item in saved.items] == [[TODAY]]
+        print("   ✅ Due index updated and review persisted")
+
+
+def test_review_keeps_concurrent_edits():
+    """A review only touches review fields - a content edit made meanwhile is kept"""
+    print("🧪 Testing review vs. concurrent edit...")
+    with temp_client() as client:
+        item_id = client.post("/api/items", json=_new_item("Old name", side_note="note")).json()["id"]
+
+        # Another tab edits the content while this one reviews a stale copy
+        client.put(f"/api/items/{item_id}", json=_new_item("New name", side_note="edited"))
+        reviewed = client.post(f"/api/items/{item_id}/review", json={"rating": "confident", "today": TODAY}).json()
+        assert (reviewed["name"], reviewed["side_note"]) == ("New name", "edited")
+        assert reviewed["revision"] == 3
+        print("   ✅ Content edit survives the review")
+
+
+def test_review_errors():
+    """Unknown items, ratings, dates and misplaced days are rejected"""
+    print("🧪 Testing review errors...")
+    with temp_client() as client:
+        item_id = client.post("/api/items", json=_new_item("Item")).json()["id"]
+        assert client.post("/api/items/missing/review", json={"rating": "wtf"}).status_code == 404
+        assert client.post(f"/api/items/{item_id}/review", json={"rating": "great"}).status_code == 422
+        assert client.post(f"/api/items/{item_id}/review", json={"rating": "custom", "days": 0}).status_code == 422
+        assert client.post(f"/api/items/{item_id}/review", json={"rating": "wtf", "days": 3}).status_code == 400
+        assert client.post(f"/api/items/{item_id}/review", json={"rating": "wtf", "today": "20250710"}).status_code == 400
+        assert client.get(f"/api/items/{item_id}").json()["revision"] == 1
+        print("   ✅ Bad requests leave the item untouched")
+
+
+def test_payload_is_small():
+    """The review request is a few bytes, not the whole item"""
+    print("🧪 Testing review payload size...")
+    with temp_client() as client:
+        item = client.post("/api/items", json=_new_item("Long", problem_text="x" * 5000, review_dates=[TODAY] * 50)).json()
+        review_body = json.dumps({"rating": "confident", "today": TODAY})
+        assert len(review_body) < 50 < len(json.dumps(item)) // 100
+        print(f"   📊 {len(review_body)} bytes instead of {len(json.dumps(item))}")
+
+
+if __name__ == "__main__":
+    test_ratings_follow_settings()
+    test_review_retry_is_idempotent()
+    test_review_updates_queue_and_persists()
+    test_review_keeps_concurrent_edits()
+    test_review_errors()
+    test_payload_is_small()
+    print("\n🎉 All review endpoint tests passed!")
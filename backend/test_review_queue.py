@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+Test script for the due-date index and GET /api/review/queue
+"""
+import random
+import time
+from datetime import date, datetime, timedelta
+from fastapi.testclient import TestClient
+from models import Item, AppData
+from services import data_service
+from services.due_index import due_key
+from test_support import temp_storage
+
+TODAY = "2025-07-10"
+SECTIONS = ["Kanji", "Grammar", "Vocab"]
+
+
+def _random_item(rng: random.Random, item_id: str) -> Item:
+    now = datetime.now().isoformat()
+    offset = rng.randint(-20, 20)
+    scheduled = rng.random() < 0.8
+    return Item(
+        id=item_id,
+        name=f"Item {item_id}",
+        section=rng.choice(SECTIONS),
+        reviewed=scheduled or rng.random() < 0.3,
+        next_review_date=(date(2025, 7, 10) + timedelta(days=offset)).isoformat() if scheduled else None,
+        archived=rng.random() < 0.1,
+        created_date=now,
+        last_accessed=now
+    )
+
+
+def _load(items: list):
+    data_service._cached_data = AppData(items=items, categories=list(SECTIONS), last_updated=datetime.now().isoformat())
+    data_service._rebuild_indexes()
+
+
+def _brute_force(limit: int, section=None) -> list:
+    due = [
+        item for item in data_service.load_data().items
+        if due_key(item) is not None and due_key(item) <= TODAY and (section is None or item.section == section)
+    ]
+    due.sort(key=lambda item: (due_key(item), item.id))
+    return [item.id for item in due[:limit]]
+
+
+def test_queue_matches_brute_force_under_mutations():
+    """The heap index agrees with a full scan after random mutations"""
+    print("🧪 Testing due index against a full scan...")
+    rng = random.Random(42)
+    _load([_random_item(rng, f"item-{i}") for i in range(500)])
+
+    next_id = 500
+    for step in range(2000):
+        action = rng.random()
+        ids = [item.id for item in data_service.load_data().items]
+        if action < 0.5 and ids:
+            item_id = rng.choice(ids)
+            data_service.replace_item(item_id, _random_item(rng, item_id))
+        elif action < 0.7 and ids:
+            data_service.remove_item(rng.choice(ids))
+        elif action < 0.9:
+            data_service.add_item(_random_item(rng, f"item-{next_id}"))
+            next_id += 1
+        else:
+            old, new = rng.sample(SECTIONS, 2)
+            data_service.rename_category(old, new)
+            data_service.rename_category(new, old) if rng.random() < 0.5 else data_service.add_category(old)
+
+        if step % 100 == 0:
+            for section in [None] + SECTIONS:
+                got = [item.id for item in data_service.get_due_items(30, section=section, today=TODAY)]
+                assert got == _brute_force(30, section), f"step {step}, section {section}"
+    print("   ✅ Due index consistent after 2000 random mutations")
+
+
+def test_queue_is_fast_on_large_deck():
+    """Fetching 50 due cards does not scan the whole deck"""
+    rng = random.Random(7)
+    _load([_random_item(rng, f"item-{i}") for i in range(100_000)])
+    start = time.perf_counter()
+    for _ in range(100):
+        data_service.get_due_items(50, today=TODAY)
+    elapsed_ms = (time.perf_counter() - start) * 1000 / 100
+    print(f"   📊 50 due items from 100k deck: {elapsed_ms:.3f}ms per query")
+    assert elapsed_ms < 5
+
+
+def test_review_queue_endpoint():
+    """GET /api/review/queue returns due items filtered by category"""
+    print("🧪 Testing GET /api/review/queue...")
+    with temp_storage():
+        import main
+        now = datetime.now().isoformat()
+        _load([
+            Item(id="overdue", name="a", section="Kanji", reviewed=True, next_review_date="2025-07-01", created_date=now, last_accessed=now),
+            Item(id="today", name="b", section="Grammar", reviewed=True, next_review_date=TODAY, created_date=now, last_accessed=now),
+            Item(id="future", name="c", section="Kanji", reviewed=True, next_review_date="2025-08-01", created_date=now, last_accessed=now),
+            Item(id="new", name="d", section="Kanji", created_date=now, last_accessed=now),
+        ])
+        data_service._service_ready = True
+        client = TestClient(main.app)
+
+        response = client.get("/api/review/queue", params={"today": TODAY})
+        assert response.status_code == 200
+        assert [item["id"] for item in response.json()["items"]] == ["new", "overdue", "today"]
+
+        response = client.get("/api/review/queue", params={"today": TODAY, "category": "Kanji", "limit": 1})
+        assert [item["id"] for item in response.json()["items"]] == ["new"]
+
+        assert client.get("/api/review/queue", params={"today": "not-a-date"}).status_code == 400
+        print("   ✅ Endpoint returns due items in order")
+
+
+if __name__ == "__main__":
+    test_queue_matches_brute_force_under_mutations()
+    test_queue_is_fast_on_large_deck()
+    test_review_queue_endpoint()
+    print("\n🎉 All review queue tests passed!")
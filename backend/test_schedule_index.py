@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+"""
+Test script and benchmark for the vectorized schedule index and GET /api/review/stats
+"""
+import random
+import time
+from datetime import date, datetime, timedelta
+from types import SimpleNamespace
+from fastapi.testclient import TestClient
+from models import Item, AppData
+from services import data_service
+from services.schedule_index import DUE_NEW, DUE_NEVER, ScheduleIndex, due_ordinal
+from test_support import temp_storage
+
+TODAY = "2025-07-10"
+SECTIONS = ["Kanji", "Grammar", "Vocab"]
+
+
+def _random_item(rng: random.Random, item_id: str) -> Item:
+    now = datetime.now().isoformat()
+    scheduled = rng.random() < 0.8
+    return Item(
+        id=item_id,
+        name=f"Item {item_id}",
+        section=rng.choice(SECTIONS),
+        reviewed=scheduled or rng.random() < 0.3,
+        next_review_date=(date(2025, 7, 10) + timedelta(days=rng.randint(-20, 20))).isoformat() if scheduled else None,
+        archived=rng.random() < 0.1,
+        created_date=now,
+        last_accessed=now
+    )
+
+
+def _load(items: list):
+    data_service._cached_data = AppData(items=items, categories=list(SECTIONS), last_updated=datetime.now().isoformat())
+    data_service._rebuild_indexes()
+
+
+def _brute_force_stats(days: int) -> dict:
+    """Same numbers as ScheduleIndex.stats, by walking every item"""
+    today = date.fromisoformat(TODAY).toordinal()
+    totals = {"new": 0, "overdue": 0, "due_today": 0, "upcoming": 0}
+    categories = {}
+    for item in data_service.load_data().items:
+        due = due_ordinal(item)
+        bucket = (
+            "new" if due == DUE_NEW
+            else "overdue" if due < today
+            else "due_today" if due == today
+            else "upcoming" if due <= today + days
+            else None
+        )
+        if bucket is None:
+            continue
+        totals[bucket] += 1
+        section = categories.setdefault(item.section, {"new": 0, "overdue": 0, "due_today": 0, "upcoming": 0})
+        section[bucket] += 1
+    for counts in [totals, *categories.values()]:
+        counts["due"] = counts["new"] + counts["overdue"] + counts["due_today"]
+    return {"date": TODAY, "days": days, **totals, "categories": categories}
+
+
+def test_due_ordinal():
+    """Due ordinals follow the review queue rules"""
+    print("🧪 Testing due ordinals...")
+    now = datetime.now().isoformat()
+    item = Item(name="a", section="s", reviewed=True, next_review_date="2025-07-10", created_date=now, last_accessed=now)
+    assert due_ordinal(item) == date(2025, 7, 10).toordinal()
+    assert due_ordinal(item.copy(update={"archived": True})) == DUE_NEVER
+    assert due_ordinal(item.copy(update={"next_review_date": None})) == DUE_NEVER
+    assert due_ordinal(item.copy(update={"next_review_date": None, "reviewed": False})) == DUE_NEW
+    print("   ✅ Archived never due, new items due immediately")
+
+
+def test_stats_match_brute_force_under_mutations():
+    """Columns stay row-aligned with the item index through adds, replaces, deletes and renames"""
+    print("🧪 Testing schedule index against a full scan...")
+    rng = random.Random(19)
+    _load([_random_item(rng, f"item-{i}") for i in range(300)])
+
+    next_id = 300
+    for step in range(1500):
+        action = rng.random()
+        ids = [item.id for item in data_service.load_data().items]
+        if action < 0.5 and ids:
+            item_id = rng.choice(ids)
+            data_service.replace_item(item_id, _random_item(rng, item_id))
+        elif action < 0.7 and ids:
+            data_service.remove_item(rng.choice(ids))
+        elif action < 0.9:
+            data_service.add_item(_random_item(rng, f"item-{next_id}"))
+            next_id += 1
+        else:
+            old, new = rng.sample(SECTIONS, 2)
+            data_service.rename_category(old, new)  # Merge into an existing section
+            data_service.rename_category(new, old) if rng.random() < 0.5 else data_service.add_category(old)
+
+        if step % 100 == 0:
+            days = rng.randint(0, 14)
+            assert data_service.get_review_stats(TODAY, days) == _brute_force_stats(days), f"step {step}"
+            for section in [None] + SECTIONS:
+                expected = sum(1 for item in data_service.get_due_items(10_000, section=section, today=TODAY))
+                assert data_service.count_due_items(section=section, today=TODAY) == expected
+    print("   ✅ Vectorized counts consistent after 1500 random mutations")
+
+
+def test_review_stats_endpoint():
+    """GET /api/review/stats and the queue's total"""
+    print("🧪 Testing GET /api/review/stats...")
+    with temp_storage():
+        import main
+        now = datetime.now().isoformat()
+        _load([
+            Item(id="overdue", name="a", section="Kanji", reviewed=True, next_review_date="2025-07-01", created_date=now, last_accessed=now),
+            Item(id="today", name="b", section="Grammar", reviewed=True, next_review_date=TODAY, created_date=now, last_accessed=now),
+            Item(id="soon", name="c", section="Kanji", reviewed=True, next_review_date="2025-07-12", created_date=now, last_accessed=now),
+            Item(id="later", name="d", section="Kanji", reviewed=True, next_review_date="2025-08-01", created_date=now, last_accessed=now),
+            Item(id="new", name="e", section="Kanji", created_date=now, last_accessed=now),
+        ])
+        data_service._service_ready = True
+        client = TestClient(main.app)
+
+        stats = client.get("/api/review/stats", params={"today": TODAY, "days": 3}).json()
+        assert (stats["due"], stats["new"], stats["overdue"], stats["due_today"], stats["upcoming"]) == (3, 1, 1, 1, 1)
+        assert stats["categories"]["Kanji"]["due"] == 2
+        assert stats["categories"]["Grammar"] == {"new": 0, "overdue": 0, "due_today": 1, "upcoming": 0, "due": 1}
+
+        queue = client.get("/api/review/queue", params={"today": TODAY, "limit": 1}).json()
+        assert (queue["count"], queue["total"]) == (1, 3)
+        assert client.get("/api/review/stats", params={"today": "07/10"}).status_code == 400
+        print("   ✅ Stats endpoint matches the deck")
+
+
+def benchmark_schedule_stats(count: int = 1_000_000) -> dict:
+    """Rebuild and query cost of the schedule index on a large deck"""
+    print(f"\n📊 Schedule index benchmark ({count} items)")
+    rng = random.Random(1)
+    start_day = date(2025, 6, 1)
+    dates = [(start_day + timedelta(days=day)).isoformat() for day in range(90)]
+    # Only the fields the index reads - building 1M validated Items would dominate the run
+    items = [
+        SimpleNamespace(
+            archived=rng.random() < 0.1,
+            reviewed=True,
+            next_review_date=rng.choice(dates),
+            section=SECTIONS[i % len(SECTIONS)]
+        )
+        for i in range(count)
+    ]
+    index = ScheduleIndex()
+    start = time.perf_counter()
+    index.rebuild(items)
+    rebuild_ms = (time.perf_counter() - start) * 1000
+
+    today = date.fromisoformat(TODAY).toordinal()
+    start = time.perf_counter()
+    for _ in range(20):
+        index.stats(today, days=7)
+    stats_ms = (time.perf_counter() - start) * 1000 / 20
+    start = time.perf_counter()
+    for _ in range(20):
+        index.count_due(today, section="Kanji")
+    count_ms = (time.perf_counter() - start) * 1000 / 20
+    print(f"   rebuild {rebuild_ms:8.1f}ms   stats {stats_ms:6.2f}ms   count_due {count_ms:6.2f}ms")
+    return {"rebuild_ms": rebuild_ms, "stats_ms": stats_ms, "count_ms": count_ms}
+
+
+def test_stats_are_fast_on_large_deck():
+    results = benchmark_schedule_stats(200_000)
+    assert results["stats_ms"] < 50
+    assert results["count_ms"] < 10
+
+
+if __name__ == "__main__":
+    test_due_ordinal()
+    test_stats_match_brute_force_under_mutations()
+    test_review_stats_endpoint()
+    benchmark_schedule_stats()
+    print("\n🎉 All schedule index tests passed!")
@@ -0,0 +1,209 @@
+#!/usr/bin/env python3
+"""
+Test script for the full-text search index and GET /api/items/search
+"""
+import asyncio
+import math
+import random
+import time
+from datetime import datetime
+from fastapi.testclient import TestClient
+from models import Item, AppData
+from services import data_service
+from services.search_index import BM25_B, BM25_K1, SearchIndex, tokenize
+from test_support import temp_storage
+
+
+def _item(item_id: str, name: str, **fields) -> Item:
+    now = datetime.now().isoformat()
+    return Item(id=item_id, name=name, section="Test", created_date=now, last_accessed=now, **fields)
+
+
+def test_tokenize_mixed_text():
+    """Latin words stay whole, Japanese becomes bigrams, width is normalized"""
+    print("🧪 Testing CJK-aware tokenization...")
+    assert tokenize("Binary Search") == ["binary", "search"]
+    assert tokenize("漢字の読み") == ["漢字", "字の", "の読", "読み"]
+    assert tokenize("ＡＰＩ設計") == ["api", "設計"]
+    assert tokenize("ｶﾀｶﾅ") == ["カタ", "タカ", "カナ"]
+    print("   ✅ Tokenizer handles mixed Japanese/English")
+
+
+def test_ranking_prefix_and_incremental_updates():
+    """BM25 ranking, prefix matching and incremental re-indexing"""
+    print("🧪 Testing search ranking and updates...")
+    index = SearchIndex()
+    items = [
+        _item("a", "Dijkstra algorithm", answer_text="Shortest path with a priority queue"),
+        _item("b", "Binary search", problem_text="Find an element in a sorted array"),
+        _item("c", "漢字の勉強", side_note="毎日の復習"),
+        _item("d", "Misc", answer_text="See the algorithm chapter for the details"),
+    ]
+    index.rebuild(items)
+
+    results = [item_id for item_id, _ in index.search("algorithm")]
+    assert results[0] == "a" and set(results) == {"a", "d"}
+    assert [item_id for item_id, _ in index.search("algo")][0] == "a"
+    assert [item_id for item_id, _ in index.search("漢字")] == ["c"]
+    assert [item_id for item_id, _ in index.search("復")] == ["c"]
+    assert index.search("nothing-matches-this") == []
+
+    index.update("b", _item("b", "Graph traversal"))
+    assert index.search("binary") == []
+    assert [item_id for item_id, _ in index.search("traversal")] == ["b"]
+    index.update("a", None)
+    assert [item_id for item_id, _ in index.search("algorithm")] == ["d"]
+    assert len(index) == 3
+    print("   ✅ Ranking, prefix matching and updates work")
+
+
+def test_search_endpoint():
+    """GET /api/items/search hides archived items unless asked"""
+    print("🧪 Testing GET /api/items/search...")
+    with temp_storage():
+        import main
+        data_service._cached_data = AppData(
+            items=[
+                _item("active", "Kanji radicals"),
+                _item("archived", "Kanji strokes", archived=True),
+            ],
+            categories=["Test"],
+            last_updated=datetime.now().isoformat()
+        )
+        data_service._rebuild_indexes()
+        data_service._service_ready = True
+        client = TestClient(main.app)
+
+        response = client.get("/api/items/search", params={"q": "kanji"})
+        assert response.status_code == 200
+        assert [item["id"] for item in response.json()["items"]] == ["active"]
+        response = client.get("/api/items/search", params={"q": "kanji", "include_archived": True})
+        assert {item["id"] for item in response.json()["items"]} == {"active", "archived"}
+        assert client.get("/api/items/search", params={"q": ""}).status_code == 422
+        assert "search_index_ms" in client.get("/health").json()["indexes"]
+        print("   ✅ Endpoint works")
+
+
+def _deck(size: int, seed: int = 1) -> list:
+    """Synthetic mixed-language deck: rare words, a few very common ones and kanji"""
+    rng = random.Random(seed)
+    words = [f"word{i}" for i in range(20_000)]
+    kanji = "日本語学習漢字文法単語読書記憶復習試験問題答"
+    prompts = ["What is the answer?", "Read the kanji aloud", "Translate into English", ""]
+    return [
+        _item(
+            f"item-{i}",
+            " ".join(rng.sample(words, rng.randint(1, 4))),
+            problem_text=rng.choice(prompts),
+            answer_text="".join(rng.sample(kanji, rng.randint(2, 8))) + " " + " ".join(rng.sample(words, rng.randint(0, 6))),
+            side_note="see the answer" if i % 2 else ""
+        )
+        for i in range(size)
+    ]
+
+
+def _brute_force_scores(items: list, query: str, limit: int) -> list:
+    """Top scores by scoring every document - what the pruned search must match"""
+    index = SearchIndex()
+    index.rebuild(items)
+    terms = index._query_terms(query)
+    doc_count = len(index._doc_lengths)
+    average_length = index._total_length / doc_count
+    scores = []
+    for item_id, doc_terms in index._doc_terms.items():
+        norm = BM25_K1 * (1 - BM25_B + BM25_B * index._doc_lengths[item_id] / average_length)
+        score = 0.0
+        for term in terms:
+            tf = doc_terms.get(term)
+            if tf:
+                doc_freq = index._doc_freqs[term]
+                idf = math.log(1 + (doc_count - doc_freq + 0.5) / (doc_freq + 0.5))
+                score += idf * tf * (BM25_K1 + 1) / (tf + norm)
+        if score:
+            scores.append(score)
+    return sorted(scores, reverse=True)[:limit]
+
+
+def test_pruned_search_matches_brute_force():
+    """Early termination returns the same top-k scores as scoring everything"""
+    print("🧪 Testing top-k pruning against brute force...")
+    items = _deck(3000, seed=7)
+    index = SearchIndex()
+    index.rebuild(items)
+    for query in ["answer", "the answer", "日本", "漢字 kanji", "学", "word12", "wor", "read translate"]:
+        for limit in (1, 5, 20):
+            found = [score for _, score in index.search(query, limit)]
+            expected = _brute_force_scores(items, query, limit)
+            assert [round(score, 9) for score in found] == [round(score, 9) for score in expected], query
+    # Filtered searches still fill the page from the allowed documents
+    odd = [item_id for item_id, _ in index.search("answer", 20, include=lambda item_id: int(item_id[5:]) % 2 == 1)]
+    assert len(odd) == 20 and all(int(item_id[5:]) % 2 == 1 for item_id in odd)
+    print("   ✅ Same results as exhaustive scoring")
+
+
+def benchmark_search(size: int = 100_000) -> dict:
+    """Median query latency for rare, frequent Latin and frequent CJK terms"""
+    rng = random.Random(2)
+    index = SearchIndex()
+    start = time.perf_counter()
+    index.rebuild(_deck(size))
+    print(f"   📊 {size} items indexed in {(time.perf_counter() - start) * 1000:.0f}ms")
+    queries = {
+        "rare": [f"word{rng.randrange(20_000)}" for _ in range(100)],
+        "frequent Latin": ["answer", "the", "kanji", "see the answer", "translate"] * 20,
+        "frequent CJK": ["日本", "漢字", "学", "問題", "復習 試験"] * 20,
+    }
+    medians = {}
+    for kind, batch in queries.items():
+        samples = []
+        for query in batch:
+            start = time.perf_counter()
+            index.search(query)
+            samples.append((time.perf_counter() - start) * 1000)
+        samples.sort()
+        medians[kind] = samples[len(samples) // 2]
+        print(f"   📊 {kind:15} median query {medians[kind]:.3f}ms")
+    return medians
+
+
+def test_frequent_terms_are_fast():
+    """Common words and kanji answer in about the time of rare ones"""
+    print("🧪 Benchmarking frequent search terms...")
+    medians = benchmark_search(20_000)
+    # Generous for slow CI machines - without pruning frequent terms scan every posting
+    assert max(medians.values()) < 5.0
+    print("   ✅ Frequent terms stay fast")
+
+
+def test_rebuild_runs_off_loop():
+    """On the event loop the index is built in the I/O pool; edits made meanwhile are kept"""
+    print("🧪 Testing background search index build...")
+    items = _deck(2000)
+
+    async def scenario():
+        data_service._search_index = SearchIndex()
+        data_service._rebuild_search_index(items)
+        assert not data_service.is_search_ready()
+        # Changed while building: must be replayed into the new index
+        data_service.replace_item("item-0", _item("item-0", "zebra crossing"))
+        await data_service._search_build
+        assert data_service.is_search_ready()
+
+    with temp_storage():
+        data_service._cached_data = AppData(items=list(items), categories=["Test"], last_updated=datetime.now().isoformat())
+        data_service._rebuild_indexes()
+        asyncio.run(scenario())
+        assert [item.id for item in data_service.search_items("zebra")] == ["item-0"]
+        assert "search_index_ms" in data_service.get_index_metrics()
+    print("   ✅ Index swapped in with concurrent edits replayed")
+
+
+if __name__ == "__main__":
+    test_tokenize_mixed_text()
+    test_ranking_prefix_and_incremental_updates()
+    test_search_endpoint()
+    test_pruned_search_matches_brute_force()
+    test_frequent_terms_are_fast()
+    test_rebuild_runs_off_loop()
+    benchmark_search()
+    print("\n🎉 All search index tests passed!")
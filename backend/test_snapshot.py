@@ -0,0 +1,237 @@
+#!/usr/bin/env python3
+"""
+Test script and cold-start benchmark for the binary snapshot format
+"""
+import asyncio
+import copy
+import json
+import os
+import struct
+import tempfile
+import time
+import convert_snapshot
+from services import data_service, snapshot
+from services.data_service import _process_data_dict, dump_app_data
+from test_support import temp_storage
+
+
+def _data_dict(count: int = 3) -> dict:
+    """A mnemos_data.json document, including legacy single-image fields"""
+    items = [
+        {
+            "id": "legacy",
+            "name": "漢字 Kanji",
+            "section": "日本語",
+            "side_note": "",
+            "problem_text": "What is 水?",
+            "problem_url": None,
+            "problem_image": "/images/old.png",
+            "answer_text": "water",
+            "reviewed": True,
+            "next_review_date": "2025-03-01T00:00:00",
+            "review_dates": ["2025-02-01T09:00:00", "2025-02-22T09:00:00"],
+            "created_date": "2025-01-01T00:00:00",
+            "last_accessed": "2025-02-22T09:00:00"
+        },
+        {
+            "id": None,
+            "name": "",
+            "section": "Empty",
+            "problem_images": [],
+            "answer_images": ["https://res.cloudinary.com/a.jpg", "https://res.cloudinary.com/b.jpg"],
+            "created_date": "",
+            "last_accessed": "",
+            "archived": True,
+            "revision": 7
+        }
+    ]
+    for i in range(count - len(items)):
+        items.append({
+            "id": f"item-{i}",
+            "name": f"Item {i}",
+            "section": f"Section {i % 5}",
+            "side_note": "note" if i % 2 else "",
+            "review_dates": [f"2025-01-{d:02d}T08:00:00" for d in range(1, i % 4 + 1)],
+            "created_date": "2025-01-01T00:00:00",
+            "last_accessed": "2025-01-01T00:00:00"
+        })
+    return {
+        "items": items,
+        "categories": ["日本語", "Empty"] + [f"Section {i}" for i in range(5)],
+        "settings": {"confident_days": 14, "medium_days": 5, "wtf_days": 1},
+        "last_updated": "2025-02-22T09:00:00"
+    }
+
+
+def test_round_trip():
+    """JSON schema -> binary -> AppData gives back identical data"""
+    print("🧪 Testing binary snapshot round trip...")
+    data = _process_data_dict(_data_dict(50))
+    path = os.path.join(tempfile.mkdtemp(), "data.bin")
+    snapshot.write_snapshot(data, path)
+
+    loaded = snapshot.read_snapshot(path)
+    assert dump_app_data(loaded) == data.dict()
+    assert loaded.items[0].problem_images == ["/images/old.png"]
+    assert loaded.items[1].id is None and loaded.items[1].revision == 7
+    # Loaded records behave like validated items
+    assert loaded.items[0].copy().name == "漢字 Kanji"
+    assert loaded.items[2].hydrate().dict() == data.items[2].dict()
+    print("   ✅ Round trip preserves every field")
+
+
+def test_lazy_access():
+    """Items decode individually without touching the rest"""
+    print("🧪 Testing lazy per-item decoding...")
+    data = _process_data_dict(_data_dict(1000))
+    path = os.path.join(tempfile.mkdtemp(), "data.bin")
+    snapshot.write_snapshot(data, path)
+
+    with snapshot.SnapshotReader(path) as reader:
+        assert len(reader) == 1000
+        assert reader[999].dict() == data.items[999].dict()
+        assert reader.item_fields(0)["review_dates"] == data.items[0].review_dates
+        try:
+            reader[1000]
+            assert False, "expected IndexError"
+        except IndexError:
+            pass
+    print("   ✅ Random access decodes single items")
+
+
+def test_indexes_leave_records_lazy():
+    """Loading a snapshot and building every index decodes only the eager columns"""
+    print("🧪 Testing lazy records through the index rebuild...")
+    data = _process_data_dict(_data_dict(1000))
+    path = os.path.join(tempfile.mkdtemp(), "data.bin")
+    snapshot.write_snapshot(data, path)
+
+    loaded = snapshot.read_snapshot(path)
+    saved = data_service._cached_data
+    data_service._cached_data = loaded
+    try:
+        data_service._rebuild_indexes()
+        assert all(record._source is not None for record in loaded.items)
+        assert "item-42" in [item["id"] for item in data_service.search_items("Item 42")]
+
+        # First use of a record reads the rest of it from the map
+        record = loaded.items[10]
+        assert record.review_dates == data.items[10].review_dates
+        assert record._source is None
+        assert data_service.get_item("item-9").dict() == data.items[11].dict()
+    finally:
+        data_service._cached_data = saved
+        data_service._rebuild_indexes()
+    print("   ✅ Only touched records are decoded in full")
+
+
+def test_rejects_bad_files():
+    """Wrong magic, unknown versions and truncation raise SnapshotError"""
+    print("🧪 Testing snapshot validation...")
+    directory = tempfile.mkdtemp()
+    payload = snapshot.encode_snapshot(_process_data_dict(_data_dict(10)))
+    cases = {
+        "magic": b"NOTSNAP!" + payload[8:],
+        "version": payload[:8] + struct.pack("<I", snapshot.SNAPSHOT_VERSION + 1) + payload[12:],
+        "truncated": payload[:-20],
+        "empty": b""
+    }
+    for name, content in cases.items():
+        path = os.path.join(directory, f"{name}.bin")
+        with open(path, "wb") as f:
+            f.write(content)
+        try:
+            snapshot.read_snapshot(path)
+            assert False, f"expected SnapshotError for {name}"
+        except snapshot.SnapshotError:
+            pass
+    print("   ✅ Bad files rejected")
+
+
+def test_converter():
+    """to-binary then to-json reproduces the validated document"""
+    print("🧪 Testing JSON <-> binary converter...")
+    directory = tempfile.mkdtemp()
+    source = os.path.join(directory, "mnemos_data.json")
+    with open(source, "w") as f:
+        json.dump(_data_dict(20), f)
+    binary = os.path.join(directory, "mnemos_data.bin")
+    exported = os.path.join(directory, "exported.json")
+
+    convert_snapshot.json_to_binary(source, binary)
+    convert_snapshot.binary_to_json(binary, exported)
+
+    with open(exported) as f:
+        assert _process_data_dict(json.load(f)).dict() == _process_data_dict(_data_dict(20)).dict()
+    print("   ✅ Converter round trip OK")
+
+
+def test_storage_round_trip():
+    """DATA_SNAPSHOT_FORMAT=binary uploads and cold-starts from the snapshot"""
+    print("🧪 Testing binary snapshot through storage...")
+    original_format = data_service.DATA_SNAPSHOT_FORMAT
+    data_service.DATA_SNAPSHOT_FORMAT = "binary"
+    data = _process_data_dict(_data_dict(30))
+
+    async def scenario():
+        assert await data_service._async_save_to_storage(data)
+        return await data_service._load_from_storage()
+
+    with temp_storage() as directory:
+        data_service.DATA_FILE = os.path.join(directory, "local", "mnemos_data.json")
+        try:
+            loaded = asyncio.run(scenario())
+        finally:
+            data_service.DATA_SNAPSHOT_FORMAT = original_format
+        assert os.path.exists(os.path.join(directory, "storage", "mnemos_data.bin"))
+        assert not os.path.exists(os.path.join(directory, "storage", "mnemos_data.json"))
+    assert dump_app_data(loaded) == data.dict()
+    print("   ✅ Saved and loaded via mnemos_data.bin")
+
+
+def benchmark_cold_start(count: int = 20_000) -> dict:
+    """Time JSON parse + validation vs. binary snapshot load"""
+    print(f"\n📊 Cold start benchmark ({count} items)")
+    directory = tempfile.mkdtemp()
+    document = _data_dict(count)
+    json_path = os.path.join(directory, "mnemos_data.json")
+    with open(json_path, "w") as f:
+        json.dump(document, f, indent=2)
+    binary_path = os.path.join(directory, "mnemos_data.bin")
+    snapshot.write_snapshot(_process_data_dict(copy.deepcopy(document)), binary_path)
+
+    start = time.perf_counter()
+    with open(json_path) as f:
+        _process_data_dict(json.loads(f.read()))
+    json_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    snapshot.read_snapshot(binary_path)
+    binary_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    with snapshot.SnapshotReader(binary_path) as reader:
+        reader[count // 2]
+    first_item_seconds = time.perf_counter() - start
+
+    print(f"   JSON parse + validate: {json_seconds * 1000:.1f}ms ({os.path.getsize(json_path)} bytes)")
+    print(f"   Binary load (lazy):    {binary_seconds * 1000:.1f}ms ({os.path.getsize(binary_path)} bytes)")
+    print(f"   Binary open + 1 item:  {first_item_seconds * 1000:.2f}ms")
+    return {"json": json_seconds, "binary": binary_seconds, "first_item": first_item_seconds}
+
+
+def test_binary_loads_faster():
+    results = benchmark_cold_start()
+    assert results["binary"] < results["json"]
+    assert results["first_item"] < results["json"] / 10
+
+
+if __name__ == "__main__":
+    test_round_trip()
+    test_lazy_access()
+    test_indexes_leave_records_lazy()
+    test_rejects_bad_files()
+    test_converter()
+    test_storage_round_trip()
+    benchmark_cold_start(100_000)
+    print("\n🎉 All snapshot tests passed!")
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Test script for cached storage health state and the circuit breaker
+"""
+import asyncio
+from datetime import datetime
+from models import AppData
+from services import data_service
+from services.storage_health import StorageHealth, STATE_CLOSED, STATE_OPEN
+from test_support import temp_storage
+
+
+class _Backend:
+    """Probe target whose availability the test controls"""
+
+    def __init__(self):
+        self.up = True
+        self.probes = 0
+
+    async def probe(self) -> bool:
+        self.probes += 1
+        return self.up
+
+
+def test_cached_state_no_probe_per_call():
+    """Within the TTL, is_available() answers from cache"""
+    print("🧪 Testing cached availability...")
+    backend = _Backend()
+
+    async def scenario():
+        health = StorageHealth(backend.probe, ttl_seconds=60)
+        assert health.is_available()  # Optimistic before the first probe
+        await asyncio.sleep(0)
+        for _ in range(1000):
+            assert health.is_available()
+        await asyncio.sleep(0)
+        assert backend.probes == 1
+
+    asyncio.run(scenario())
+    print("   ✅ 1000 checks, 1 background probe")
+
+
+def test_circuit_trips_and_recovers():
+    """Consecutive failures open the circuit; a background probe closes it"""
+    print("🧪 Testing circuit breaker...")
+    backend = _Backend()
+    recovered = []
+
+    async def scenario():
+        health = StorageHealth(
+            backend.probe, ttl_seconds=60, failure_threshold=3, retry_seconds=0.01,
+            on_recovery=lambda: recovered.append(True)
+        )
+        health.record_success()
+        backend.up = False
+        health.record_failure()
+        health.record_failure()
+        assert health.state == STATE_CLOSED
+        health.record_failure()
+        assert health.state == STATE_OPEN
+        assert not health.is_available()
+
+        # Background re-probing keeps failing while the backend is down
+        await asyncio.sleep(0.05)
+        assert health.state == STATE_OPEN and backend.probes >= 2
+
+        backend.up = True
+        await asyncio.sleep(0.05)
+        assert health.state == STATE_CLOSED and health.is_available()
+        assert recovered == [True]
+        assert health.stats()["trips"] == 1
+
+    asyncio.run(scenario())
+    print("   ✅ Circuit opened, re-probed and closed again")
+
+
+def test_save_data_skips_probe():
+    """save_data() uses the cached state - no storage health round-trip per save"""
+    print("🧪 Testing save_data without per-save probes...")
+    calls = []
+
+    async def scenario():
+        data = AppData(items=[], categories=[], last_updated=datetime.now().isoformat())
+        data_service._cached_data = data
+        data_service._rebuild_indexes()
+        await data_service.get_storage_health().check()
+        for _ in range(50):
+            await data_service.save_data(data)
+        await data_service.flush_pending_saves()
+
+    with temp_storage():
+        storage = data_service._storage_service
+        original_is_available = storage.is_available
+        storage.is_available = lambda: calls.append(1) or original_is_available()
+        asyncio.run(scenario())
+        assert len(calls) == 1
+        assert data_service.get_storage_health().stats()["state"] == STATE_CLOSED
+    print("   ✅ 50 saves, 1 health probe")
+
+
+if __name__ == "__main__":
+    test_cached_state_no_probe_per_call()
+    test_circuit_trips_and_recovers()
+    test_save_data_skips_probe()
+    print("\n🎉 All storage health tests passed!")
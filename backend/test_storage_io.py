@@ -0,0 +1,198 @@
+#!/usr/bin/env python3
+"""
+Event-loop lag test: API reads keep serving while a multi-MB storage upload
+is in flight
+"""
+import asyncio
+import os
+import time
+import json
+import httpx
+from models import AppData
+from services import data_service
+from services.category_registry import registry
+from services.item_record import make_item_record
+from services.storage_service import CloudStorageService, FileStorageService
+from test_support import temp_storage
+
+UPLOAD_SECONDS = 0.5
+
+
+class _BlockingBlob:
+    """Stands in for google.cloud.storage.Blob - every call blocks the calling thread"""
+
+    def __init__(self, store: dict, name: str):
+        self._store = store
+        self._name = name
+
+    def exists(self) -> bool:
+        time.sleep(0.05)
+        return self._name in self._store
+
+    def download_as_text(self) -> str:
+        time.sleep(UPLOAD_SECONDS)
+        return self._store[self._name]
+
+    def upload_from_string(self, data: str, content_type: str = None):
+        time.sleep(UPLOAD_SECONDS)
+        self._store[self._name] = data
+
+
+class _Bucket:
+    def __init__(self):
+        self.store = {}
+
+    def blob(self, name: str) -> _BlockingBlob:
+        return _BlockingBlob(self.store, name)
+
+
+def _cloud_storage() -> CloudStorageService:
+    storage = CloudStorageService("test-bucket")
+    storage._client, storage._bucket = object(), _Bucket()
+    return storage
+
+
+def _payload(megabytes: int = 4) -> dict:
+    """AppData-shaped dict of roughly `megabytes` MB once serialized"""
+    note = "x" * 1000
+    count = megabytes * 1000
+    return {
+        "items": [{"id": f"item-{i}", "name": f"Item {i}", "side_note": note} for i in range(count)],
+        "categories": [],
+        "last_updated": ""
+    }
+
+
+async def _measure_lag(stop: asyncio.Event, interval: float = 0.005) -> float:
+    """Largest delay between when the loop should and did wake us"""
+    loop = asyncio.get_running_loop()
+    worst = 0.0
+    while not stop.is_set():
+        start = loop.time()
+        await asyncio.sleep(interval)
+        worst = max(worst, loop.time() - start - interval)
+    return worst
+
+
+async def _reads_during(upload, reads: int = 20):
+    """Run the upload while timing GET /api/items; returns (lag, read latencies, upload time)"""
+    import main
+    stop = asyncio.Event()
+    lag_task = asyncio.create_task(_measure_lag(stop))
+    upload_start = time.perf_counter()
+    upload_task = asyncio.create_task(upload())
+    await asyncio.sleep(0.01)
+
+    latencies = []
+    transport = httpx.ASGITransport(app=main.app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        for _ in range(reads):
+            start = time.perf_counter()
+            response = await client.get("/api/items")
+            latencies.append(time.perf_counter() - start)
+            assert response.status_code == 200
+    reads_done = time.perf_counter() - upload_start
+
+    assert await upload_task
+    upload_time = time.perf_counter() - upload_start
+    stop.set()
+    return await lag_task, latencies, reads_done, upload_time
+
+
+def test_reads_served_during_cloud_upload():
+    """A blocking GCS upload no longer stalls the event loop"""
+    print("🧪 Testing event loop lag during a multi-MB Cloud Storage upload...")
+    storage = _cloud_storage()
+    payload = _payload()
+
+    with temp_storage():
+        data_service.initialize_default_data()
+        lag, latencies, reads_done, upload_time = asyncio.run(
+            _reads_during(lambda: storage.upload_json("mnemos_data.json", payload))
+        )
+    print(f"   upload {upload_time * 1000:.0f}ms, max loop lag {lag * 1000:.1f}ms, "
+          f"worst read {max(latencies) * 1000:.1f}ms")
+    assert upload_time >= UPLOAD_SECONDS
+    # All reads finished while the upload was still running
+    assert reads_done < upload_time
+    assert lag < UPLOAD_SECONDS / 2
+    print("   ✅ Reads keep serving during the upload")
+
+
+def test_cloud_round_trip():
+    """Download sees what upload wrote; missing blobs return None"""
+    print("🧪 Testing Cloud Storage round trip through the executor...")
+    storage = _cloud_storage()
+
+    async def scenario():
+        assert await storage.download_json("missing.json") is None
+        assert await storage.upload_json("mnemos_data.json", {"items": [], "last_updated": "x"})
+        return await storage.download_json("mnemos_data.json")
+
+    assert asyncio.run(scenario()) == {"items": [], "last_updated": "x"}
+    print("   ✅ Round trip OK")
+
+
+def test_reads_served_during_file_upload():
+    """Local file storage serializes and writes off the event loop too"""
+    print("🧪 Testing event loop lag during a multi-MB file storage upload...")
+    payload = _payload()
+
+    with temp_storage() as tmp_dir:
+        data_service.initialize_default_data()
+        storage = FileStorageService(os.path.join(tmp_dir, "upload"))
+        lag, latencies, _, upload_time = asyncio.run(
+            _reads_during(lambda: storage.upload_json("mnemos_data.json", payload), reads=5)
+        )
+        print(f"   upload {upload_time * 1000:.0f}ms, max loop lag {lag * 1000:.1f}ms, "
+              f"worst read {max(latencies) * 1000:.1f}ms")
+        assert os.path.getsize(os.path.join(tmp_dir, "upload", "mnemos_data.json")) > 4_000_000
+    print("   ✅ Upload completed without blocking reads")
+
+
+def test_storage_save_serializes_off_loop():
+    """The data dict is built in the I/O pool from a snapshot taken before the upload"""
+    print("🧪 Testing storage save serialization off the event loop...")
+    note = "x" * 200
+    data = AppData(last_updated="")
+    data.items = [
+        make_item_record({"id": f"item-{i}", "name": f"Item {i}", "section": "Storage IO", "side_note": note,
+                          "created_date": "", "last_accessed": ""})
+        for i in range(20000)
+    ]
+
+    async def scenario():
+        stop = asyncio.Event()
+        lag_task = asyncio.create_task(_measure_lag(stop))
+        save_task = asyncio.create_task(data_service._async_save_to_storage(data))
+        await asyncio.sleep(0)
+        # Committed after the save started - must not leak into its payload
+        registry.rename(category_id, "Storage IO (renamed)")
+        saved = await save_task
+        stop.set()
+        return saved, await lag_task
+
+    category_id = registry.id_for("Storage IO")
+    with temp_storage():
+        data_service.initialize_default_data()
+        storage = data_service._storage_service = _cloud_storage()
+        try:
+            saved, lag = asyncio.run(scenario())
+        finally:
+            # The registry is process-wide - undo the rename for later tests
+            registry.rename(category_id, "Storage IO")
+    print(f"   max loop lag {lag * 1000:.1f}ms")
+    assert saved
+    uploaded = json.loads(storage._bucket.store["mnemos_data.json"])
+    assert len(uploaded["items"]) == 20000
+    assert {item["section"] for item in uploaded["items"]} == {"Storage IO"}
+    assert lag < UPLOAD_SECONDS / 2
+    print("   ✅ Save payload is consistent and built off the loop")
+
+
+if __name__ == "__main__":
+    test_reads_served_during_cloud_upload()
+    test_cloud_round_trip()
+    test_reads_served_during_file_upload()
+    test_storage_save_serializes_off_loop()
+    print("\n🎉 All storage I/O tests passed!")
@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+"""
+Shared helpers for the test scripts: throwaway storage and app clients
+"""
+import json
+import os
+import tempfile
+from contextlib import contextmanager
+from fastapi.testclient import TestClient
+from services import data_service
+from services.storage_service import FileStorageService
+
+
+@contextmanager
+def temp_storage():
+    """Point DATA_FILE and the storage backend at a temp dir, restored afterwards"""
+    saved = data_service.DATA_FILE, data_service._storage_service
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        data_service.DATA_FILE = os.path.join(tmp_dir, "mnemos_data.json")
+        data_service._storage_service = FileStorageService(os.path.join(tmp_dir, "storage"))
+        try:
+            yield tmp_dir
+        finally:
+            data_service.DATA_FILE, data_service._storage_service = saved
+
+
+@contextmanager
+def temp_client():
+    """App client backed by fresh default data in a throwaway data directory"""
+    import main
+    with temp_storage():
+        data_service.initialize_default_data()
+        yield TestClient(main.app)
+
+
+@contextmanager
+def loaded_client(document: dict):
+    """App client over the document written as DATA_FILE and loaded the way startup does (items stay records)"""
+    import main
+    with temp_storage():
+        with open(data_service.DATA_FILE, "w") as f:
+            json.dump(document, f)
+        data_service._cached_data = data_service._load_from_local_file()
+        data_service._rebuild_indexes()
+        data_service._service_ready = True
+        yield TestClient(main.app)
@@ -549,51 +549,14 @@ function AppContent() {
   };
 
   const handleReview = async (itemId: string, reviewType: 'confident' | 'medium' | 'wtf' | 'custom', customDays?: number) => {
-    // Calculate days based on review type using settings
-    let daysToAdd: number;
-    switch (reviewType) {
-      case 'confident':
-        daysToAdd = settings.confidentDays;
-        break;
-      case 'medium':
-        daysToAdd = settings.mediumDays;
-        break;
-      case 'wtf':
-        daysToAdd = settings.wtfDays;
-        break;
-      case 'custom':
-        daysToAdd = customDays || settings.wtfDays;
-        break;
-      default:
-        daysToAdd = 1;
-    }
-
-    // Calculate next review date
-    const nextReviewDate = new Date();
-    nextReviewDate.setDate(nextReviewDate.getDate() + daysToAdd);
-    const nextReviewDateString = nextReviewDate.toLocaleDateString('en-CA'); // YYYY-MM-DD in local timezone
-
-    // Current date for review history
-    const currentDateString = new Date().toLocaleDateString('en-CA'); // YYYY-MM-DD in local timezone
-
+    // The backend computes the next review date from settings and appends today to the history
     try {
-      const currentItem = items.find(item => item.id === itemId);
-      if (!currentItem) return;
-
-      const updatedItem = {
-        ...currentItem,
-        isReviewed: true,
-        lastAccessedAt: currentDateString,
-        nextReviewDate: nextReviewDateString,
-        reviewDates: [...(currentItem.reviewDates || []), currentDateString]
-      };
-
-      const savedItem = await itemsApi.update(itemId, updatedItem);
+      const savedItem = await itemsApi.review(itemId, reviewType, customDays);
 
       setItems(prev => prev.map(item =>
         item.id === itemId ? savedItem : item
       ));
-      console.log(`Item ${itemId} reviewed with ${reviewType}${customDays ? ` for ${customDays} days` : ` for ${daysToAdd} days`} - next review: ${nextReviewDateString}`);
+      console.log(`Item ${itemId} reviewed with ${reviewType} - next review: ${savedItem.nextReviewDate}`);
     } catch (error) {
       console.error('Failed to update review:', error);
       // Optionally show error message to user
@@ -138,6 +138,27 @@ export const itemsApi = {
     }, 'Update item');
   },
 
+  async review(id: string, rating: 'confident' | 'medium' | 'wtf' | 'custom', days?: number): Promise<StudyItem> {
+    return retryApiCall(async () => {
+      const response = await fetch(`${API_BASE}/api/items/${id}/review`, {
+        method: 'POST',
+        headers: {
+          'Content-Type': 'application/json',
+        },
+        body: JSON.stringify({
+          rating,
+          days: rating === 'custom' ? days : undefined,
+          today: new Date().toLocaleDateString('en-CA') // YYYY-MM-DD in local timezone
+        }),
+      });
+      if (!response.ok) {
+        throw new Error(`Failed to review item (${response.status}): ${response.statusText}`);
+      }
+      const data = await response.json();
+      return transformToFrontend(data);
+    }, 'Review item');
+  },
+
   async delete(id: string): Promise<void> {
     return retryApiCall(async () => {
       const response = await fetch(`${API_BASE}/api/items/${id}`, {